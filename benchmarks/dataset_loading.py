@@ -0,0 +1,101 @@
+"""Cold-start load time of locale datasets: JSON vs compiled vs string tables.
+
+Usage: python benchmarks/dataset_loading.py
+"""
+
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from mimesis import loader
+from mimesis.constants import DATADIR
+from mimesis.loader import compile_dataset, compile_string_tables, load_dataset
+from mimesis.locales import Locale
+
+REPEATS = 20
+
+
+def benchmark(func: Callable[[], object], repeats: int = REPEATS) -> float:
+    """Return the median execution time of a function in milliseconds."""
+    times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        end = time.perf_counter()
+        times.append((end - start) * 1000)
+
+    return statistics.median(times)
+
+
+def load_locale(
+    datadir: Path,
+    locale: str,
+    files: List[str],
+    compiled: bool,
+    string_tables: bool = False,
+) -> None:
+    loader.string_tables = string_tables
+    for datafile in files:
+        data = load_dataset(datadir, locale, datafile, compiled=compiled)
+        # Compiled datasets decode values on first access, so access them all.
+        dict(data)
+
+
+def main() -> None:
+    print(f"\n{'=' * 80}")
+    print(f"{'COLD-START DATASET LOADING: JSON VS COMPILED VS STRING TABLES':^80}")
+    print(f"{'=' * 80}")
+    print(
+        f"{'Locale':<10} {'Files':<8} {'JSON':<15} "
+        f"{'Compiled':<15} {'String tables':<15} {'Speedup':<10}"
+    )
+    print(f"{'-' * 80}")
+
+    total_json = 0.0
+    total_compiled = 0.0
+    total_tables = 0.0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        datadir = Path(tmpdir) / "datasets"
+        shutil.copytree(DATADIR, datadir, ignore=shutil.ignore_patterns("*.py"))
+
+        for locale in Locale.values():
+            files = sorted(f.name for f in (datadir / locale).glob("*.json"))
+            for datafile in files:
+                compile_dataset(datadir, locale, datafile)
+                compile_string_tables(datadir, locale, datafile)
+
+            json_time = benchmark(lambda: load_locale(datadir, locale, files, False))
+            compiled_time = benchmark(lambda: load_locale(datadir, locale, files, True))
+            tables_time = benchmark(
+                lambda: load_locale(datadir, locale, files, True, string_tables=True)
+            )
+            total_json += json_time
+            total_compiled += compiled_time
+            total_tables += tables_time
+
+            print(
+                f"{locale:<10} {len(files):<8} "
+                f"{json_time:<12.3f} ms "
+                f"{compiled_time:<12.3f} ms "
+                f"{tables_time:<12.3f} ms "
+                f"{json_time / compiled_time:.2f}x / {json_time / tables_time:.2f}x"
+            )
+
+    print(f"{'-' * 80}")
+    print(
+        f"{'TOTAL':<10} {'':<8} "
+        f"{total_json:<12.3f} ms "
+        f"{total_compiled:<12.3f} ms "
+        f"{total_tables:<12.3f} ms "
+        f"{total_json / total_compiled:.2f}x / {total_json / total_tables:.2f}x"
+    )
+    print(f"{'=' * 80}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Overhead of Field compared to calling provider methods directly.
+
+Compares ``Person().email()`` with ``Field()("person.email")``,
+``Field()("email")``, ``Field()("email", key=str.upper)``
+and the same fields compiled with ``Field.compile()``.
+The field has a few aliases, which used to be validated on every call.
+
+Usage: python benchmarks/field_overhead.py [--calls 200000]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from mimesis import Field, Locale
+from mimesis.providers import Person
+
+REPEATS = 5
+
+
+def benchmark(func: Callable[[], object], calls: int) -> float:
+    """Return the median time per call in microseconds."""
+    times = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        end = time.perf_counter()
+        times.append((end - start) / calls * 1_000_000)
+
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    person = Person(Locale.EN)
+    field = Field(Locale.EN)
+    field.aliases = {f"alias_{i}": "email" for i in range(20)}
+
+    direct = benchmark(person.email, args.calls)
+    cases = {
+        "Person().email()": person.email,
+        "field('person.email')": lambda: field("person.email"),
+        "field('email')": lambda: field("email"),
+        "field('alias_0')": lambda: field("alias_0"),
+        "field('email', key=...)": lambda: field("email", key=str.upper),
+        "field.compile('email')": field.compile("email"),
+        "field.compile('email', key=...)": field.compile("email", key=str.upper),
+    }
+
+    print(f"\n{'=' * 70}")
+    print(f"{'FIELD OVERHEAD':^70}")
+    print(f"{'=' * 70}")
+    print(f"Calls: {args.calls:,}\n")
+    print(f"{'Call':<36} {'Time':>15} {'Overhead':>15}")
+    print(f"{'-' * 70}")
+
+    for name, func in cases.items():
+        elapsed = benchmark(func, args.calls)
+        print(f"{name:<36} {elapsed:>12.3f} µs {elapsed - direct:>12.3f} µs")
+
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Import time of mimesis.
+
+Fails (exit code 1) when ``import mimesis`` takes longer than
+the budget or when it executes modules of locale-independent
+datasets, which must be imported lazily.
+
+Usage: python benchmarks/import_time.py [--budget-ms 150] [--runs 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Small modules which are needed at import time anyway.
+ALLOWED_DATASETS = {"mimesis.datasets.int", "mimesis.datasets.int.common"}
+
+
+def measure() -> Tuple[float, List[str]]:
+    """Import mimesis in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in milliseconds, imported dataset modules)
+    """
+    # Bytecode must be cached to measure the import time users see.
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mimesis"],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    ).stderr
+
+    total = 0.0
+    datasets = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name.startswith("mimesis.datasets.int"):
+            datasets.append(name)
+        if name == "mimesis":
+            total = int(cumulative) / 1000
+
+    return total, datasets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    # The first run compiles bytecode, so it is not representative.
+    measure()
+    results = [measure() for _ in range(args.runs)]
+    best = min(total for total, _ in results)
+    datasets = sorted(set(results[0][1]) - ALLOWED_DATASETS)
+
+    print(f"\n{'=' * 70}")
+    print(f"{'IMPORT TIME':^70}")
+    print(f"{'=' * 70}")
+    print(f"import mimesis (best of {args.runs}): {best:.1f} ms")
+    print(f"Budget: {args.budget_ms:.1f} ms")
+    print(f"{'=' * 70}\n")
+
+    failed = False
+
+    if datasets:
+        print(f"FAIL: datasets imported eagerly: {', '.join(datasets)}")
+        failed = True
+
+    if best > args.budget_ms:
+        print(f"FAIL: import time exceeds the budget of {args.budget_ms:.1f} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Per-row overhead of Schema transformers.
+
+The schema itself returns a constant item, so the measured time is
+the overhead of creating items and applying 0, 1 and 5 transformers,
+both with a plain Schema and within a SchemaBuilder.
+
+Usage: python benchmarks/schema_transformers.py [--rows 100000]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from mimesis.schema import Schema, SchemaBuilder, SchemaContext
+from mimesis.types import JSON
+
+REPEATS = 5
+TRANSFORMER_COUNTS = (0, 1, 5)
+
+
+def identity(item: JSON) -> JSON:
+    return item
+
+
+def identity_with_context(item: JSON, ctx: SchemaContext) -> JSON:
+    return item
+
+
+def make_schema(rows: int, transformers: int) -> Schema:
+    """Create a schema with the given number of transformers.
+
+    Transformers alternate between one and two parameters.
+    """
+    schema = Schema(schema=lambda: {"id": 1}, iterations=rows)
+    for i in range(transformers):
+        schema.map(identity_with_context if i % 2 else identity)
+    return schema
+
+
+def benchmark(func: Callable[[], object], rows: int) -> float:
+    """Return the median time per row in microseconds."""
+    times = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        end = time.perf_counter()
+        times.append((end - start) / rows * 1_000_000)
+
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"\n{'=' * 70}")
+    print(f"{'SCHEMA TRANSFORMERS OVERHEAD':^70}")
+    print(f"{'=' * 70}")
+    print(f"Rows: {args.rows:,}\n")
+    print(f"{'Transformers':<15} {'Schema':>15} {'SchemaBuilder':>15}")
+    print(f"{'-' * 70}")
+
+    for count in TRANSFORMER_COUNTS:
+        schema = make_schema(args.rows, count)
+        builder = SchemaBuilder()
+        builder.define("items", make_schema(args.rows, count))
+
+        plain = benchmark(schema.create, args.rows)
+        built = benchmark(lambda: builder.create(items=args.rows), args.rows)
+        print(f"{count:<15} {plain:>12.3f} µs {built:>12.3f} µs")
+
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
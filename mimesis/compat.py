@@ -1,6 +1,29 @@
 """Import optional dependencies only when needed."""
 
+import importlib
+import typing as t
+
 try:
     import pytz
 except ImportError:
     pytz = None  # type: ignore
+
+# Heavy optional dependencies, imported on first access.
+_LAZY_MODULES = {
+    "numpy": "numpy",
+    "pyarrow": "pyarrow",
+    "parquet": "pyarrow.parquet",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(_LAZY_MODULES[name])
+    except ImportError:
+        module = None
+
+    globals()[name] = module
+    return module
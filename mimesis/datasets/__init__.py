@@ -1,15 +1,124 @@
-from .int.address import *
-from .int.code import *
-from .int.common import *
-from .int.datetime import *
-from .int.development import *
-from .int.file import *
-from .int.finance import *
-from .int.hardware import *
-from .int.internet import *
-from .int.path import *
-from .int.payment import *
-from .int.person import *
-from .int.scientific import *
-from .int.text import *
-from .int.transport import *
+"""Locale-independent datasets.
+
+Constants are resolved on first access (see :pep:`562`), so the large
+modules of literal data in ``mimesis.datasets.int`` are executed only
+when a constant defined there is actually used.
+"""
+
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .int.address import *
+    from .int.code import *
+    from .int.common import *
+    from .int.cryptographic import *
+    from .int.datetime import *
+    from .int.development import *
+    from .int.file import *
+    from .int.finance import *
+    from .int.hardware import *
+    from .int.internet import *
+    from .int.path import *
+    from .int.payment import *
+    from .int.person import *
+    from .int.scientific import *
+    from .int.text import *
+    from .int.transport import *
+
+#: Maps every constant to the module of ``mimesis.datasets.int`` defining it.
+_CONSTANTS: t.Final[dict[str, str]] = {
+    "CALLING_CODES": "address",
+    "CONTINENT_CODES": "address",
+    "COUNTRY_CODES": "address",
+    "IATA_CODES": "address",
+    "ICAO_CODES": "address",
+    "SHORTENED_ADDRESS_FMT": "address",
+    "EAN_MASKS": "code",
+    "IMEI_TACS": "code",
+    "ISBN_GROUPS": "code",
+    "ISBN_MASKS": "code",
+    "LOCALE_CODES": "code",
+    "COMMON_LETTERS": "common",
+    "ROMANIZATION_DICT": "common",
+    "WORDLIST": "cryptographic",
+    "DATETIME_LOCALES": "datetime",
+    "GMT_OFFSETS": "datetime",
+    "ROMAN_NUMS": "datetime",
+    "TIMEZONES": "datetime",
+    "FOLDERS": "development",
+    "LICENSES": "development",
+    "OS": "development",
+    "PROGRAMMING_LANGS": "development",
+    "PROJECT_NAMES": "development",
+    "STAGES": "development",
+    "SYSTEM_QUALITY_ATTRIBUTES": "development",
+    "EXTENSIONS": "file",
+    "FILENAMES": "file",
+    "MIME_TYPES": "file",
+    "CRYPTOCURRENCY_ISO_CODES": "finance",
+    "CRYPTOCURRENCY_SYMBOLS": "finance",
+    "CURRENCY_ISO_CODES": "finance",
+    "CURRENCY_SYMBOLS": "finance",
+    "STOCK_EXCHANGES": "finance",
+    "STOCK_NAMES": "finance",
+    "STOCK_TICKERS": "finance",
+    "CPU": "hardware",
+    "CPU_CODENAMES": "hardware",
+    "GENERATION": "hardware",
+    "GRAPHICS": "hardware",
+    "HDD_SSD": "hardware",
+    "HDD_SSD_MANUFACTURERS": "hardware",
+    "MANUFACTURERS": "hardware",
+    "PHONE_MODELS": "hardware",
+    "RAM_SIZES": "hardware",
+    "RAM_TYPES": "hardware",
+    "RESOLUTIONS": "hardware",
+    "SCREEN_SIZES": "hardware",
+    "CLOUD_REGION_DIRECTIONS": "internet",
+    "CLOUD_REGION_PREFIXES": "internet",
+    "CONTENT_ENCODING_DIRECTIVES": "internet",
+    "CORS_OPENER_POLICIES": "internet",
+    "CORS_RESOURCE_POLICIES": "internet",
+    "EMAIL_DOMAINS": "internet",
+    "HTTP_METHODS": "internet",
+    "HTTP_SERVERS": "internet",
+    "HTTP_STATUS_CODES": "internet",
+    "HTTP_STATUS_MSGS": "internet",
+    "PUBLIC_DNS": "internet",
+    "TLD": "internet",
+    "USER_AGENTS": "internet",
+    "PLATFORMS": "path",
+    "CREDIT_CARD_NETWORKS": "payment",
+    "BLOOD_GROUPS": "person",
+    "GENDER_CODES": "person",
+    "GENDER_SYMBOLS": "person",
+    "USERNAMES": "person",
+    "SI_PREFIXES": "scientific",
+    "SI_PREFIXES_SYM": "scientific",
+    "SAFE_COLORS": "text",
+    "AIRPLANES": "transport",
+    "AUTO_MANUFACTURERS": "transport",
+    "CARS": "transport",
+    "VRC_BY_LOCALES": "transport",
+    "VR_CODES": "transport",
+}
+
+__all__ = list(_CONSTANTS)
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module_name = _CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(f"{__name__}.int.{module_name}")
+    value = getattr(module, name)
+    # Cache the value, so next lookups do not call this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
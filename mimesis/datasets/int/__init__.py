@@ -1,17 +1,10 @@
 """Here you can see data that used in all locales."""
 
-from .address import *
-from .code import *
-from .common import *
-from .datetime import *
-from .development import *
-from .file import *
-from .finance import *
-from .hardware import *
-from .internet import *
-from .path import *
-from .payment import *
-from .person import *
-from .scientific import *
-from .text import *
-from .transport import *
+import typing as t
+
+
+def __getattr__(name: str) -> t.Any:
+    # Constants are resolved lazily, see mimesis.datasets.
+    from mimesis import datasets
+
+    return getattr(datasets, name)
@@ -24,7 +24,8 @@ class SchemaError(ValueError):
 
     def __str__(self) -> str:
         return (
-            "The schema must be a callable object that returns a dict."
+            "The schema must be a callable object that returns a dict "
+            "or a mapping of names to callable objects. "
             "See https://mimesis.name/en/master/schema.html for more details."
         )
 
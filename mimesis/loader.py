@@ -0,0 +1,504 @@
+"""Loads locale datasets from JSON files or their compiled counterparts.
+
+Every locale dataset can be compiled into a binary file (see
+``tasks/minifier.py``) which stores the dataset already merged with
+the data of its master locale together with a content hash of the
+JSON files it was built from. The compiled file is used only while
+the hash matches the JSON files, otherwise the JSON files are parsed.
+Values of top-level keys are stored separately, so the compiled dataset
+is loaded as :class:`LazyDataset` which decodes a key on first access.
+
+Alternatively, every list of strings of a dataset can be compiled into
+a string table: an offset-indexed blob of UTF-8 strings which is
+memory-mapped read-only and exposed as :class:`StringTable`. Picking
+an element decodes only that element, and all processes mapping the
+same file (e.g. forked workers) share its physical pages.
+"""
+
+import itertools
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import typing as t
+import zlib
+from collections.abc import ItemsView, KeysView, ValuesView
+from pathlib import Path
+
+from mimesis.constants import LOCALE_SEP
+from mimesis.types import JSON
+
+__all__ = [
+    "COMPILED_SUFFIX",
+    "STRING_TABLE_SUFFIX",
+    "LazyDataset",
+    "StringTable",
+    "compile_dataset",
+    "compile_string_tables",
+    "compiled_path",
+    "load_dataset",
+    "string_tables_path",
+    "update_dict",
+]
+
+#: Suffix of the compiled dataset files.
+COMPILED_SUFFIX: t.Final[str] = ".marshal"
+
+#: Suffix of the compiled string table files.
+STRING_TABLE_SUFFIX: t.Final[str] = ".strtab"
+
+#: Version of the layout of the compiled dataset files.
+FORMAT_VERSION: t.Final[int] = 2
+
+#: When enabled, lists of strings are loaded as memory-mapped
+#: string tables if compiled string tables are available.
+#: Set it before creating data providers, otherwise call
+#: :meth:`~mimesis.providers.base.DatasetCache.clear`.
+string_tables: bool = False
+
+_HEADER_SIZE = struct.Struct("<Q")
+_OFFSET_SIZE: t.Final[int] = 8
+
+Digest = tuple[tuple[int, int], ...]
+
+
+class _MappedFile(t.NamedTuple):
+    """Memory-mapped string tables file."""
+
+    path: Path
+    digest: Digest
+    buffer: mmap.mmap
+    offsets: memoryview
+
+
+#: Files mapped again by unpickled string tables, shared by all of them.
+_mapped_files: dict[tuple[Path, Digest], _MappedFile] = {}
+
+
+class StringTable(t.Sequence[str]):
+    """Read-only sequence of strings stored in a memory-mapped file.
+
+    Strings are decoded on access, so only the picked
+    element is materialized as :class:`str`. A pickled string
+    table refers to its file, which is mapped again on unpickling.
+    """
+
+    __slots__ = ("_file", "_buffer", "_offsets", "_start", "_length")
+
+    def __init__(self, file: _MappedFile, start: int, length: int) -> None:
+        """Initialize attributes.
+
+        :param file: Memory-mapped file.
+        :param start: Index of the first string of the table in offsets.
+        :param length: Number of strings in the table.
+        """
+        self._file = file
+        self._buffer = file.buffer
+        self._offsets = file.offsets
+        self._start = start
+        self._length = length
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        path, digest = self._file.path, self._file.digest
+        return _restore_string_table, (path, digest, self._start, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @t.overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[str]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("string table index out of range")
+
+        i = self._start + index
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return self._buffer[start:end].decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} <{self._length} strings>"
+
+
+def _restore_string_table(
+    path: Path, digest: Digest, start: int, length: int
+) -> StringTable:
+    """Restores a pickled string table, mapping its file once per process.
+
+    :raises ValueError: If the file is missing or was compiled from other data.
+    """
+    key = (path, digest)
+    if key not in _mapped_files:
+        file = _map_string_tables(path)
+        if file is None or file[0].digest != digest:
+            raise ValueError(f"String tables file {path} is missing or changed.")
+        _mapped_files[key] = file[0]
+    return StringTable(_mapped_files[key], start, length)
+
+
+def update_dict(initial: JSON, other: JSON) -> JSON:
+    """Recursively updates a dictionary.
+
+    :param initial: Dict to update.
+    :param other: Dict to update from.
+    :return: Updated dict.
+    """
+    for k, v in other.items():
+        if isinstance(v, dict):
+            initial[k] = update_dict(initial.get(k, {}), v)
+        else:
+            initial[k] = other[k]
+    return initial
+
+
+def compiled_path(datadir: Path, locale: str, datafile: str) -> Path:
+    """Returns the path of the compiled dataset.
+
+    :param datadir: Directory with datasets.
+    :param locale: Locale.
+    :param datafile: Name of the JSON file.
+    :return: Path of the compiled file.
+    """
+    return (datadir / locale / datafile).with_suffix(COMPILED_SUFFIX)
+
+
+class LazyDataset(dict[str, t.Any]):
+    """Dataset which decodes values of top-level keys on first access.
+
+    Decoded values are stored in the dict itself, so lookups of
+    already loaded keys are as fast as for a regular dict. All
+    the other methods behave as if every key has been loaded.
+    """
+
+    __slots__ = ("_blobs",)
+
+    def __init__(self, blobs: dict[str, bytes]) -> None:
+        """Initialize attributes.
+
+        :param blobs: Marshalled values of top-level keys.
+        """
+        super().__init__()
+        self._blobs = blobs
+
+    def __missing__(self, key: str) -> t.Any:
+        value = marshal.loads(self._blobs[key])
+        return self.setdefault(key, value)
+
+    def loaded_keys(self) -> set[str]:
+        """Returns the keys which have been loaded or overridden.
+
+        :return: Set of keys.
+        """
+        return set(super().keys())
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        return KeysView(self)
+
+    def values(self) -> ValuesView[t.Any]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, t.Any]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self) -> "LazyDataset":
+        return self | {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._blobs or super().__contains__(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(dict.fromkeys(itertools.chain(self._blobs, super().keys())))
+
+    def __len__(self) -> int:
+        return len(self._blobs.keys() | super().keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, dict):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __or__(self, other: t.Any) -> "LazyDataset":  # type: ignore[override]
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        blobs = {k: v for k, v in self._blobs.items() if k not in other}
+        dataset = LazyDataset(blobs)
+        dict.update(dataset, super().items())
+        dict.update(dataset, other)
+        return dataset
+
+    def __reduce__(self) -> t.Any:
+        return self.__class__, (self._blobs,), None, None, iter(super().items())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__} <{len(self)} keys, "
+            f"{len(self.loaded_keys())} loaded>"
+        )
+
+
+def string_tables_path(datadir: Path, locale: str, datafile: str) -> Path:
+    """Returns the path of the compiled string tables.
+
+    :param datadir: Directory with datasets.
+    :param locale: Locale.
+    :param datafile: Name of the JSON file.
+    :return: Path of the string tables file.
+    """
+    return (datadir / locale / datafile).with_suffix(STRING_TABLE_SUFFIX)
+
+
+def _locale_chain(locale: str) -> list[str]:
+    """Returns the master locale followed by the locale itself (if differs)."""
+    master_locale = locale.split(LOCALE_SEP)[0]
+    if master_locale == locale:
+        return [locale]
+    return [master_locale, locale]
+
+
+def _read_sources(datadir: Path, locale: str, datafile: str) -> list[bytes]:
+    """Reads the raw content of the JSON files of the dataset.
+
+    :raises FileNotFoundError: If any of the files was not found.
+    """
+    return [
+        (datadir / locale_name / datafile).read_bytes()
+        for locale_name in _locale_chain(locale)
+    ]
+
+
+def _digest(sources: list[bytes]) -> Digest:
+    """Computes the content hash of the JSON files.
+
+    CRC-32 is used since it is only meant to detect stale compiled
+    files, and it is several times cheaper than cryptographic hashes.
+    """
+    return tuple((len(source), zlib.crc32(source)) for source in sources)
+
+
+def _parse_sources(sources: list[bytes]) -> JSON:
+    """Parses the JSON files and merges them into a single dataset."""
+    data: JSON = json.loads(sources[0])
+    for source in sources[1:]:
+        data = update_dict(data, json.loads(source))
+    return data
+
+
+def _read_compiled(path: Path, digest: Digest) -> JSON | None:
+    """Reads the compiled dataset if it is fresh.
+
+    :param path: Path of the compiled file.
+    :param digest: Content hash of the JSON files.
+    :return: Dataset or None if the file is missing, stale or malformed.
+    """
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        version, compiled_digest, blobs = marshal.loads(content)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    if version != FORMAT_VERSION or compiled_digest != digest:
+        return None
+
+    return LazyDataset(blobs)
+
+
+def _is_string_list(value: t.Any) -> bool:
+    return isinstance(value, list) and all(isinstance(i, str) for i in value)
+
+
+def _build_skeleton(value: t.Any, strings: list[str]) -> t.Any:
+    """Replaces lists of strings with ``(start, length)`` references.
+
+    JSON has no tuples, so tuples in the skeleton are always references.
+    """
+    if isinstance(value, dict):
+        return {k: _build_skeleton(v, strings) for k, v in value.items()}
+
+    if value and _is_string_list(value):
+        start = len(strings)
+        strings.extend(value)
+        return start, len(value)
+
+    return value
+
+
+def _attach_tables(value: t.Any, file: _MappedFile) -> t.Any:
+    """Replaces ``(start, length)`` references with string tables."""
+    if isinstance(value, dict):
+        return {k: _attach_tables(v, file) for k, v in value.items()}
+
+    if isinstance(value, tuple):
+        start, length = value
+        return StringTable(file, start, length)
+
+    return value
+
+
+def _map_string_tables(path: Path) -> tuple[_MappedFile, t.Any] | None:
+    """Maps the compiled string tables.
+
+    :param path: Path of the string tables file.
+    :return: Mapped file and skeleton of the dataset or None if the file
+        is missing, malformed or compiled for another version or byte order.
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        (header_size,) = _HEADER_SIZE.unpack_from(buffer)
+        header_end = _HEADER_SIZE.size + header_size
+        version, byteorder, digest, count, skeleton = marshal.loads(
+            buffer[_HEADER_SIZE.size : header_end]
+        )
+    except (struct.error, EOFError, ValueError, TypeError):
+        return None
+
+    if version != FORMAT_VERSION or byteorder != sys.byteorder:
+        return None
+
+    offsets_start = -header_end % _OFFSET_SIZE + header_end
+    offsets_end = offsets_start + (count + 1) * _OFFSET_SIZE
+    offsets = memoryview(buffer)[offsets_start:offsets_end].cast("Q")
+    return _MappedFile(path, digest, buffer, offsets), skeleton
+
+
+def _read_string_tables(path: Path, digest: Digest) -> JSON | None:
+    """Maps the compiled string tables if they are fresh.
+
+    :param path: Path of the string tables file.
+    :param digest: Content hash of the JSON files.
+    :return: Dataset or None if the file is missing, stale or malformed.
+    """
+    mapped = _map_string_tables(path)
+    if mapped is None:
+        return None
+
+    file, skeleton = mapped
+    if file.digest != digest:
+        return None
+
+    return t.cast(JSON, _attach_tables(skeleton, file))
+
+
+def load_dataset(
+    datadir: Path,
+    locale: str,
+    datafile: str,
+    compiled: bool = True,
+) -> JSON:
+    """Loads the dataset merged with the data of its master locale.
+
+    :param datadir: Directory with datasets.
+    :param locale: Locale.
+    :param datafile: Name of the JSON file.
+    :param compiled: Prefer the compiled dataset when it is fresh.
+        The string tables are preferred when :data:`string_tables` is enabled.
+    :return: Dataset.
+    :raises FileNotFoundError: If the JSON file was not found.
+    """
+    sources = _read_sources(datadir, locale, datafile)
+
+    if compiled:
+        digest = _digest(sources)
+        data = None
+
+        if string_tables:
+            path = string_tables_path(datadir, locale, datafile)
+            data = _read_string_tables(path, digest)
+
+        if data is None:
+            path = compiled_path(datadir, locale, datafile)
+            data = _read_compiled(path, digest)
+
+        if data is not None:
+            return data
+
+    return _parse_sources(sources)
+
+
+def compile_dataset(datadir: Path, locale: str, datafile: str) -> Path:
+    """Compiles the dataset into a binary file next to its JSON file.
+
+    Values of top-level keys are marshalled separately,
+    so they can be decoded on demand by :class:`LazyDataset`.
+
+    :param datadir: Directory with datasets.
+    :param locale: Locale.
+    :param datafile: Name of the JSON file.
+    :return: Path of the compiled file.
+    :raises FileNotFoundError: If the JSON file was not found.
+    """
+    sources = _read_sources(datadir, locale, datafile)
+    blobs = {k: marshal.dumps(v) for k, v in _parse_sources(sources).items()}
+    content = (FORMAT_VERSION, _digest(sources), blobs)
+    path = compiled_path(datadir, locale, datafile)
+    path.write_bytes(marshal.dumps(content))
+    return path
+
+
+def compile_string_tables(datadir: Path, locale: str, datafile: str) -> Path:
+    """Compiles lists of strings of the dataset into string tables.
+
+    The file consists of a header (the dataset with lists of strings
+    replaced by references), offsets of all strings and the UTF-8 blob.
+
+    :param datadir: Directory with datasets.
+    :param locale: Locale.
+    :param datafile: Name of the JSON file.
+    :return: Path of the string tables file.
+    :raises FileNotFoundError: If the JSON file was not found.
+    """
+    sources = _read_sources(datadir, locale, datafile)
+    strings: list[str] = []
+    skeleton = _build_skeleton(_parse_sources(sources), strings)
+    header = marshal.dumps(
+        (FORMAT_VERSION, sys.byteorder, _digest(sources), len(strings), skeleton)
+    )
+    header_end = _HEADER_SIZE.size + len(header)
+    padding = -header_end % _OFFSET_SIZE
+
+    blob = [s.encode("utf-8") for s in strings]
+    offset = header_end + padding + (len(blob) + 1) * _OFFSET_SIZE
+    offsets = [offset]
+    for encoded in blob:
+        offset += len(encoded)
+        offsets.append(offset)
+
+    path = string_tables_path(datadir, locale, datafile)
+    # Replace the file instead of truncating it, since it may be mapped.
+    temp_path = path.with_suffix(f"{STRING_TABLE_SUFFIX}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        f.write(bytes(padding))
+        f.write(struct.pack(f"={len(offsets)}Q", *offsets))
+        f.writelines(blob)
+    os.replace(temp_path, path)
+    return path
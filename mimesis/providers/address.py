@@ -6,14 +6,7 @@ data related to location, such as street name, city etc.
 
 import typing as t
 
-from mimesis.datasets import (
-    CALLING_CODES,
-    CONTINENT_CODES,
-    COUNTRY_CODES,
-    IATA_CODES,
-    ICAO_CODES,
-    SHORTENED_ADDRESS_FMT,
-)
+from mimesis import datasets
 from mimesis.enums import CountryCode
 from mimesis.providers.base import BaseDataProvider
 
@@ -116,7 +109,7 @@ class Address(BaseDataProvider):
         st_num = self.street_number()
         st_name = self.street_name()
 
-        if self.locale in SHORTENED_ADDRESS_FMT:
+        if self.locale in datasets.SHORTENED_ADDRESS_FMT:
             return fmt.format(
                 st_num=st_num,
                 st_name=st_name,
@@ -201,7 +194,7 @@ class Address(BaseDataProvider):
         :raises KeyError: if fmt is not supported.
         """
         key = self.validate_enum(code, CountryCode)
-        return self.random.choice(COUNTRY_CODES[key])
+        return self.random.choice(datasets.COUNTRY_CODES[key])
 
     def country_emoji_flag(self) -> str:
         """Generates a randomly chosen country emoji flag.
@@ -296,7 +289,7 @@ class Address(BaseDataProvider):
         codes: list[str] = self._extract(["continent"])
 
         if code:
-            codes = CONTINENT_CODES
+            codes = datasets.CONTINENT_CODES
 
         return self.random.choice(codes)
 
@@ -305,7 +298,7 @@ class Address(BaseDataProvider):
 
         :return: Calling code.
         """
-        return self.random.choice(CALLING_CODES)
+        return self.random.choice(datasets.CALLING_CODES)
 
     def isd_code(self) -> str:
         """Generates a random ISD code.
@@ -319,11 +312,11 @@ class Address(BaseDataProvider):
 
         :return: IATA code.
         """
-        return self.random.choice(IATA_CODES)
+        return self.random.choice(datasets.IATA_CODES)
 
     def icao_code(self) -> str:
         """Generates a random ICAO code.
 
         :return: ICAO code.
         """
-        return self.random.choice(ICAO_CODES)
+        return self.random.choice(datasets.ICAO_CODES)
@@ -1,18 +1,33 @@
 """Base data provider."""
 
 import contextlib
+import inspect
 import json
 import operator
+import threading
 import typing as t
+from collections import OrderedDict
 from functools import reduce
+from pathlib import Path
 
 from mimesis import random as _random
-from mimesis.constants import DATADIR, LOCALE_SEP
+from mimesis.constants import DATADIR
 from mimesis.exceptions import NonEnumerableError
+from mimesis.loader import load_dataset, update_dict
 from mimesis.locales import Locale, validate_locale
 from mimesis.types import JSON, MissingSeed, Seed
 
-__all__ = ["BaseDataProvider", "BaseProvider", "ProviderRegistry"]
+__all__ = [
+    "BaseDataProvider",
+    "BaseProvider",
+    "DatasetCache",
+    "DatasetCacheInfo",
+    "ProviderRegistry",
+]
+
+DatasetKey = tuple[Path, str, str]
+
+P = t.TypeVar("P", bound="BaseProvider")
 
 
 class ProviderRegistry:
@@ -23,6 +38,7 @@ class ProviderRegistry:
     """
 
     _providers: t.ClassVar[dict[str, type["BaseProvider"]]] = {}
+    _method_index: t.ClassVar[dict[str, str] | None] = None
 
     @classmethod
     def register(cls, name: str, provider_cls: type["BaseProvider"]) -> None:
@@ -32,6 +48,29 @@ class ProviderRegistry:
         :param provider_cls: Provider class
         """
         cls._providers[name] = provider_cls
+        cls._method_index = None
+
+    @classmethod
+    def get_method_index(cls) -> dict[str, str]:
+        """Get an index of public methods of all registered providers.
+
+        The index is built from the provider classes, so no provider
+        is instantiated. When several providers have a method with the
+        same name, the provider whose name comes first alphabetically wins.
+
+        :return: Dictionary mapping method names to provider names.
+        """
+        if cls._method_index is None:
+            index: dict[str, str] = {}
+            for name in sorted(cls._providers):
+                provider_cls = cls._providers[name]
+                for attr in dir(provider_cls):
+                    if not attr.startswith("_") and inspect.isroutine(
+                        getattr(provider_cls, attr)
+                    ):
+                        index.setdefault(attr, name)
+            cls._method_index = index
+        return cls._method_index
 
     @classmethod
     def get_all(cls) -> dict[str, type["BaseProvider"]]:
@@ -51,9 +90,123 @@ class ProviderRegistry:
         return cls._providers.get(name)
 
 
+class DatasetCacheInfo(t.NamedTuple):
+    """Statistics of the :class:`DatasetCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class DatasetCache:
+    """Process-wide cache for the datasets of data providers.
+
+    Datasets are keyed by ``(datadir, locale, datafile)`` and stored
+    already merged with the data of their master locale, so all
+    instances of the same data provider share a single parsed copy.
+
+    Cached datasets are shared between instances, so they must be
+    treated as read-only. Use :meth:`BaseDataProvider.update_dataset`
+    to override data for a single instance.
+
+    When the cache is full, the least recently used dataset is evicted.
+    """
+
+    _maxsize: t.ClassVar[int | None] = 128
+    _datasets: t.ClassVar[OrderedDict[DatasetKey, JSON]] = OrderedDict()
+    _hits: t.ClassVar[int] = 0
+    _misses: t.ClassVar[int] = 0
+    _evictions: t.ClassVar[int] = 0
+    _lock: t.ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, key: DatasetKey) -> JSON | None:
+        """Get a cached dataset.
+
+        :param key: Tuple of datadir, locale and datafile.
+        :return: Dataset or None if it is not cached.
+        """
+        with cls._lock:
+            data = cls._datasets.get(key)
+            if data is None:
+                cls._misses += 1
+                return None
+            cls._datasets.move_to_end(key)
+            cls._hits += 1
+            return data
+
+    @classmethod
+    def put(cls, key: DatasetKey, data: JSON) -> None:
+        """Put a dataset into the cache.
+
+        :param key: Tuple of datadir, locale and datafile.
+        :param data: Dataset.
+        """
+        with cls._lock:
+            if cls._maxsize == 0:
+                return None
+            cls._datasets[key] = data
+            cls._datasets.move_to_end(key)
+            cls._evict()
+
+    @classmethod
+    def _evict(cls) -> None:
+        """Evict the least recently used datasets exceeding the size cap."""
+        if cls._maxsize is None:
+            return None
+        while len(cls._datasets) > cls._maxsize:
+            cls._datasets.popitem(last=False)
+            cls._evictions += 1
+
+    @classmethod
+    def set_maxsize(cls, maxsize: int | None) -> None:
+        """Set the maximum number of cached datasets.
+
+        :param maxsize: Maximum number of datasets.
+            When set to ``None`` the cache is unbounded,
+            when set to ``0`` the caching is disabled.
+        :raises ValueError: If maxsize is negative.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("The maxsize must be a non-negative integer or None.")
+
+        with cls._lock:
+            cls._maxsize = maxsize
+            cls._evict()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all cached datasets and reset statistics."""
+        with cls._lock:
+            cls._datasets.clear()
+            cls._hits = cls._misses = cls._evictions = 0
+
+    @classmethod
+    def info(cls) -> DatasetCacheInfo:
+        """Get statistics of the cache.
+
+        :return: Named tuple with hits, misses, evictions, maxsize and currsize.
+        """
+        with cls._lock:
+            return DatasetCacheInfo(
+                hits=cls._hits,
+                misses=cls._misses,
+                evictions=cls._evictions,
+                maxsize=cls._maxsize,
+                currsize=len(cls._datasets),
+            )
+
+
 class BaseProvider:
     """This is a base class for all providers.
 
+    A method ``name`` may have a batch counterpart ``name_many(n, **kwargs)``,
+    which accepts the same keyword arguments and returns a list of n values.
+    :class:`~mimesis.schema.Fieldset` calls it once instead of calling
+    ``name`` n times. Values of the batch may differ from the values
+    of n calls of ``name`` with the same seed.
 
     :attr: random: An instance of :class:`mimesis.random.Random`.
     :attr: seed: Seed for random.
@@ -102,7 +255,10 @@ class BaseProvider:
         else:
             self.random = _random.Random()
         self.seed = seed
-        self.reseed(seed)
+        # A thread-local random is seeded by its owner. Reseeding
+        # it here would reset the generators of all threads.
+        if not isinstance(random, _random.ThreadLocalRandom):
+            self.reseed(seed)
 
     def reseed(self, seed: Seed = MissingSeed) -> None:
         """Reseeds the internal random generator.
@@ -122,6 +278,22 @@ class BaseProvider:
         else:
             self.random.seed(t.cast(t.Any, seed))
 
+    def _nested_provider(self, provider_cls: type[P], **kwargs: t.Any) -> P:
+        """Creates a provider which shares the random generator of this one.
+
+        Creating a provider reseeds its random generator, so the state
+        is restored afterward. Thanks to that nested providers can be
+        created lazily without affecting the generated values.
+
+        :param provider_cls: Provider class.
+        :param kwargs: Keyword arguments for provider.
+        :return: Provider instance.
+        """
+        state = self.random.getstate()
+        provider = provider_cls(seed=self.seed, random=self.random, **kwargs)
+        self.random.setstate(state)
+        return provider
+
     def validate_enum(self, item: t.Any, enum: t.Any) -> t.Any:
         """Validates various enum objects that are used as arguments for methods.
 
@@ -183,6 +355,9 @@ class BaseDataProvider(BaseProvider):
         # This is a dict with data
         # loaded from the JSON file.
         self._dataset: JSON = {}
+        # Top-level keys of the dataset
+        # which were used by this instance.
+        self._touched_keys: set[str] = set()
         # Order matters here, since
         # we have to set up locale first.
         self._setup_locale(locale)
@@ -202,12 +377,16 @@ class BaseDataProvider(BaseProvider):
     def _extract(self, keys: list[str], default: t.Any = None) -> t.Any:
         """Extracts nested values from JSON file by list of keys.
 
+        Compiled datasets are loaded lazily (see :class:`~mimesis.loader.LazyDataset`),
+        so only the top-level key which is extracted gets decoded.
+
         :param keys: List of keys (order extremely matters).
         :param default: Default value.
         :return: Data.
         """
         if not keys:
             raise ValueError("The list of keys to extract cannot be empty.")
+        self._touched_keys.add(keys[0])
         try:
             return reduce(operator.getitem, keys, self._dataset)
         except (TypeError, KeyError):
@@ -220,16 +399,15 @@ class BaseDataProvider(BaseProvider):
         :param other: Dict to update from.
         :return: Updated dict.
         """
-        for k, v in other.items():
-            if isinstance(v, dict):
-                initial[k] = self._update_dict(initial.get(k, {}), v)
-            else:
-                initial[k] = other[k]
-        return initial
+        return update_dict(initial, other)
 
     def _load_dataset(self) -> None:
         """Loads the content from the JSON dataset.
 
+        Datasets are shared between instances through :class:`DatasetCache`.
+        The compiled dataset is preferred when it is up-to-date
+        (see :mod:`mimesis.loader`).
+
         :return: The content of the file.
         :raises UnsupportedLocale: Raises if locale is unsupported.
         """
@@ -240,17 +418,12 @@ class BaseDataProvider(BaseProvider):
         if not datafile:
             return None
 
-        def read_file(locale_name: str) -> t.Any:
-            file_path = datadir / locale_name / datafile
-            with open(file_path, encoding="utf8") as f:
-                return json.load(f)
+        key = (datadir, locale, datafile)
+        data = DatasetCache.get(key)
 
-        master_locale = locale.split(LOCALE_SEP).pop(0)
-
-        data = read_file(master_locale)
-
-        if LOCALE_SEP in locale:
-            data = self._update_dict(data, read_file(locale))
+        if data is None:
+            data = load_dataset(datadir, locale, datafile)
+            DatasetCache.put(key, data)
 
         self._dataset = data
 
@@ -259,11 +432,14 @@ class BaseDataProvider(BaseProvider):
 
         This method may be useful when you need to override data
         for a given key in JSON file.
+
+        The dataset is shared between instances, so the update is
+        applied to a copy and never affects other instances.
         """
         if not isinstance(data, dict):
             raise TypeError("The data must be a dict.")
 
-        self._dataset |= data
+        self._dataset = self._dataset | data
 
     def get_current_locale(self) -> str:
         """Returns current locale.
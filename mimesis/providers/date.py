@@ -4,8 +4,8 @@ import typing as t
 from calendar import monthrange
 from datetime import date, datetime, time, timedelta
 
+from mimesis import datasets
 from mimesis.compat import pytz
-from mimesis.datasets import GMT_OFFSETS, ROMAN_NUMS, TIMEZONES
 from mimesis.enums import DurationUnit, TimestampFormat, TimezoneRegion
 from mimesis.providers.base import BaseDataProvider
 from mimesis.types import Date, DateTime, Time
@@ -122,7 +122,7 @@ class Datetime(BaseDataProvider):
 
         :return: Century.
         """
-        return self.random.choice(ROMAN_NUMS)
+        return self.random.choice(datasets.ROMAN_NUMS)
 
     def periodicity(self) -> str:
         """Generates a random periodicity string.
@@ -201,7 +201,7 @@ class Datetime(BaseDataProvider):
         """
         region_name = self.validate_enum(region, TimezoneRegion)
         return self.random.choice(
-            [tz for tz in TIMEZONES if tz.startswith(region_name)]
+            [tz for tz in datasets.TIMEZONES if tz.startswith(region_name)]
         )
 
     def gmt_offset(self) -> str:
@@ -209,7 +209,7 @@ class Datetime(BaseDataProvider):
 
         :return: GMT Offset.
         """
-        return self.random.choice(GMT_OFFSETS)
+        return self.random.choice(datasets.GMT_OFFSETS)
 
     def datetime(
         self,
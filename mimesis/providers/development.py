@@ -3,13 +3,7 @@
 import typing as t
 from datetime import datetime
 
-from mimesis.datasets import (
-    LICENSES,
-    OS,
-    PROGRAMMING_LANGS,
-    STAGES,
-    SYSTEM_QUALITY_ATTRIBUTES,
-)
+from mimesis import datasets
 from mimesis.providers.base import BaseProvider
 
 __all__ = ["Development"]
@@ -32,7 +26,7 @@ class Development(BaseProvider):
         :Example:
             The BSD 3-Clause License.
         """
-        return self.random.choice(LICENSES)
+        return self.random.choice(datasets.LICENSES)
 
     def calver(self) -> str:
         """Generates a random calendar versioning string.
@@ -66,7 +60,7 @@ class Development(BaseProvider):
         :Example:
             Alpha.
         """
-        return self.random.choice(STAGES)
+        return self.random.choice(datasets.STAGES)
 
     def programming_language(self) -> str:
         """Generates a random programming language from the list.
@@ -76,7 +70,7 @@ class Development(BaseProvider):
         :Example:
             Erlang.
         """
-        return self.random.choice(PROGRAMMING_LANGS)
+        return self.random.choice(datasets.PROGRAMMING_LANGS)
 
     def os(self) -> str:
         """Generates a random operating system or distributive name.
@@ -86,7 +80,7 @@ class Development(BaseProvider):
         :Example:
             Gentoo
         """
-        return self.random.choice(OS)
+        return self.random.choice(datasets.OS)
 
     def boolean(self) -> bool:
         """Generates a random boolean value.
@@ -105,7 +99,7 @@ class Development(BaseProvider):
 
         :return: System quality attribute.
         """
-        return self.random.choice(SYSTEM_QUALITY_ATTRIBUTES)
+        return self.random.choice(datasets.SYSTEM_QUALITY_ATTRIBUTES)
 
     def ility(self) -> str:
         """Generates a random system quality attribute.
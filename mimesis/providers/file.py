@@ -1,6 +1,6 @@
 """File data provider."""
 
-from mimesis.datasets import EXTENSIONS, FILENAMES, MIME_TYPES
+from mimesis import datasets
 from mimesis.enums import FileType, MimeType
 from mimesis.providers.base import BaseProvider
 
@@ -23,7 +23,7 @@ class File(BaseProvider):
             .py
         """
         key = self.validate_enum(item=file_type, enum=FileType)
-        extensions = EXTENSIONS[key]
+        extensions = datasets.EXTENSIONS[key]
         return self.random.choice(extensions)
 
     def mime_type(self, type_: MimeType | None = None) -> str:
@@ -33,7 +33,7 @@ class File(BaseProvider):
         :return: Mime type.
         """
         key = self.validate_enum(item=type_, enum=MimeType)
-        types = MIME_TYPES[key]
+        types = datasets.MIME_TYPES[key]
         return self.random.choice(types)
 
     def size(self, minimum: int = 1, maximum: int = 100) -> str:
@@ -60,5 +60,5 @@ class File(BaseProvider):
             legislative.txt
         """
         ext = self.extension(file_type)
-        name = self.random.choice(FILENAMES)
+        name = self.random.choice(datasets.FILENAMES)
         return f"{name}{ext}"
@@ -1,14 +1,6 @@
 """Business data provider."""
 
-from mimesis.datasets import (
-    CRYPTOCURRENCY_ISO_CODES,
-    CRYPTOCURRENCY_SYMBOLS,
-    CURRENCY_ISO_CODES,
-    CURRENCY_SYMBOLS,
-    STOCK_EXCHANGES,
-    STOCK_NAMES,
-    STOCK_TICKERS,
-)
+from mimesis import datasets
 from mimesis.providers.base import BaseDataProvider
 
 __all__ = ["Finance"]
@@ -50,7 +42,7 @@ class Finance(BaseDataProvider):
         code: str = self._extract(["currency-code"])
 
         if allow_random:
-            return self.random.choice(CURRENCY_ISO_CODES)
+            return self.random.choice(datasets.CURRENCY_ISO_CODES)
         return code
 
     def bank(self) -> str:
@@ -66,21 +58,21 @@ class Finance(BaseDataProvider):
 
         :return: Symbol of cryptocurrency.
         """
-        return self.random.choice(CRYPTOCURRENCY_ISO_CODES)
+        return self.random.choice(datasets.CRYPTOCURRENCY_ISO_CODES)
 
     def currency_symbol(self) -> str:
         """Returns a currency symbol for current locale.
 
         :return: Currency symbol.
         """
-        return CURRENCY_SYMBOLS[self.locale]
+        return datasets.CURRENCY_SYMBOLS[self.locale]
 
     def cryptocurrency_symbol(self) -> str:
         """Get a cryptocurrency symbol.
 
         :return: Symbol of cryptocurrency.
         """
-        return self.random.choice(CRYPTOCURRENCY_SYMBOLS)
+        return self.random.choice(datasets.CRYPTOCURRENCY_SYMBOLS)
 
     def price(self, minimum: float = 500, maximum: float = 1500) -> float:
         """Generate a random price.
@@ -113,18 +105,18 @@ class Finance(BaseDataProvider):
 
         :return: Ticker.
         """
-        return self.random.choice(STOCK_TICKERS)
+        return self.random.choice(datasets.STOCK_TICKERS)
 
     def stock_name(self) -> str:
         """Generates a stock name.
 
         :return: Stock name.
         """
-        return self.random.choice(STOCK_NAMES)
+        return self.random.choice(datasets.STOCK_NAMES)
 
     def stock_exchange(self) -> str:
         """Generates a stock exchange name.
 
         :return: Returns exchange name.
         """
-        return self.random.choice(STOCK_EXCHANGES)
+        return self.random.choice(datasets.STOCK_EXCHANGES)
@@ -1,18 +1,24 @@
 """Provides all at one."""
 
 import inspect
+import threading
 import typing as t
 
+from mimesis import random as _random
 from mimesis.locales import Locale
 from mimesis.providers.base import (
     BaseDataProvider,
     BaseProvider,
     ProviderRegistry,
 )
+from mimesis.random import Random, ThreadLocalRandom
 from mimesis.types import MissingSeed, Seed
 
 __all__ = ["Generic"]
 
+# Guards lazy creation of providers.
+_lock = threading.RLock()
+
 
 class Generic(BaseProvider):
     """Class which contain all providers at one."""
@@ -21,19 +27,34 @@ class Generic(BaseProvider):
         self,
         locale: Locale = Locale.DEFAULT,
         seed: Seed = MissingSeed,
+        random: Random | None = None,
+        thread_local: bool = False,
     ) -> None:
-        """Initialize attributes lazily."""
-        super().__init__(seed=seed)
+        """Initialize attributes lazily.
+
+        :param locale: Locale.
+        :param seed: Seed for random.
+        :param random: Custom random shared by all providers.
+            By default, every provider has its own random.
+        :param thread_local: Share a :class:`~mimesis.random.ThreadLocalRandom`
+            by all providers, so every thread has its own random.
+        :raises ValueError: if both random and thread_local are passed.
+        """
+        if thread_local:
+            if random is not None:
+                raise ValueError("Cannot use custom random with thread_local.")
+            base_seed = seed if seed is not MissingSeed else _random.global_seed
+            random = ThreadLocalRandom(None if base_seed is MissingSeed else base_seed)
+
+        super().__init__(seed=seed, random=random)
         self.locale = locale
+        self._shared_random = random is not None
 
         for name, provider_cls in ProviderRegistry.get_all().items():
             if provider_cls is Generic:
                 continue
 
-            if issubclass(provider_cls, BaseDataProvider):
-                setattr(self, f"_{name}", provider_cls)
-            elif issubclass(provider_cls, BaseProvider):
-                setattr(self, name, provider_cls(seed=self.seed))
+            setattr(self, f"_{name}", provider_cls)
 
     class Meta:
         """Class for metadata."""
@@ -48,13 +69,31 @@ class Generic(BaseProvider):
         :return: An attribute.
         """
         attribute = object.__getattribute__(self, "_" + attrname)
-        if attribute and callable(attribute):
-            self.__dict__[attrname] = attribute(
-                self.locale,
-                self.seed,
-            )
-            return self.__dict__[attrname]
-        return None
+        with _lock:
+            # Another thread may have created the provider meanwhile.
+            if attrname in self.__dict__:
+                return self.__dict__[attrname]
+            if (
+                isinstance(attribute, type)
+                and issubclass(attribute, BaseProvider)
+                and self._shared_random
+            ):
+                if issubclass(attribute, BaseDataProvider):
+                    provider = self._nested_provider(attribute, locale=self.locale)
+                else:
+                    provider = self._nested_provider(attribute)
+                self.__dict__[attrname] = provider
+                return provider
+            if isinstance(attribute, type) and issubclass(attribute, BaseDataProvider):
+                self.__dict__[attrname] = attribute(
+                    self.locale,
+                    self.seed,
+                )
+                return self.__dict__[attrname]
+            if attribute and callable(attribute):
+                self.__dict__[attrname] = attribute(seed=self.seed)
+                return self.__dict__[attrname]
+            return None
 
     def __dir__(self) -> list[str]:
         """Available data providers.
@@ -65,7 +104,7 @@ class Generic(BaseProvider):
         exclude = list(BaseProvider().__dict__.keys())
         # Exclude locale explicitly because
         # it is not a provider.
-        exclude.append("locale")
+        exclude.extend(["locale", "_shared_random"])
 
         for attr in self.__dict__:
             if attr not in exclude:
@@ -81,18 +120,18 @@ class Generic(BaseProvider):
 
         Overrides method `BaseProvider.reseed()`.
 
+        Only providers which have already been created are reseeded,
+        the rest of them pick up the stored seed on first access.
+
         :param seed: Seed for random.
         :return: None.
         """
         # Make sure to reseed the random generator on Generic itself.
         super().reseed(seed)
 
-        for attr in self.__dir__():
-            try:
-                provider = getattr(self, attr)
+        for provider in self.__dict__.values():
+            if isinstance(provider, BaseProvider):
                 provider.reseed(seed)
-            except AttributeError:
-                continue
 
     def add_provider(self, cls: t.Type[BaseProvider], **kwargs: t.Any) -> None:
         """Adds a custom provider to a Generic() object.
@@ -118,7 +157,10 @@ class Generic(BaseProvider):
             # Enforce the same seed is used across all providers.
             kwargs.pop("seed", None)
 
-            instance = cls(seed=self.seed, **kwargs)
+            if self._shared_random:
+                instance = self._nested_provider(cls, **kwargs)
+            else:
+                instance = cls(seed=self.seed, **kwargs)
             if isinstance(instance, Generic):
                 raise TypeError("Cannot add Generic instance to itself.")
             setattr(self, name, instance)
@@ -3,6 +3,7 @@ import typing as t
 from mimesis import providers
 from mimesis.locales import Locale
 from mimesis.providers.base import BaseProvider
+from mimesis.random import Random
 from mimesis.types import Seed
 
 __all__ = ["Generic"]
@@ -32,7 +33,13 @@ class Generic(BaseProvider):
     science: providers.Science
     transport: providers.Transport
 
-    def __init__(self, locale: Locale = ..., seed: Seed = ...) -> None: ...
+    def __init__(
+        self,
+        locale: Locale = ...,
+        seed: Seed = ...,
+        random: Random | None = ...,
+        thread_local: bool = ...,
+    ) -> None: ...
 
     class Meta:
         name: t.Final[str]
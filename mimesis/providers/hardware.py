@@ -1,18 +1,6 @@
 """Provides data related to hardware."""
 
-from mimesis.datasets import (
-    CPU,
-    CPU_CODENAMES,
-    GENERATION,
-    GRAPHICS,
-    HDD_SSD,
-    MANUFACTURERS,
-    PHONE_MODELS,
-    RAM_SIZES,
-    RAM_TYPES,
-    RESOLUTIONS,
-    SCREEN_SIZES,
-)
+from mimesis import datasets
 from mimesis.providers.base import BaseProvider
 
 __all__ = ["Hardware"]
@@ -34,7 +22,7 @@ class Hardware(BaseProvider):
         :Example:
             1280x720.
         """
-        return self.random.choice(RESOLUTIONS)
+        return self.random.choice(datasets.RESOLUTIONS)
 
     def screen_size(self) -> str:
         """Generates a random size of screen in inch.
@@ -44,7 +32,7 @@ class Hardware(BaseProvider):
         :Example:
             13″.
         """
-        return self.random.choice(SCREEN_SIZES)
+        return self.random.choice(datasets.SCREEN_SIZES)
 
     def cpu(self) -> str:
         """Generates a random CPU name.
@@ -54,7 +42,7 @@ class Hardware(BaseProvider):
         :Example:
             Intel® Core i7.
         """
-        return self.random.choice(CPU)
+        return self.random.choice(datasets.CPU)
 
     def cpu_frequency(self) -> str:
         """Generates a random frequency of CPU.
@@ -75,7 +63,7 @@ class Hardware(BaseProvider):
         :Example:
              6th Generation.
         """
-        return self.random.choice(GENERATION)
+        return self.random.choice(datasets.GENERATION)
 
     def cpu_codename(self) -> str:
         """Generates a random CPU code name.
@@ -85,7 +73,7 @@ class Hardware(BaseProvider):
         :Example:
             Cannonlake.
         """
-        return self.random.choice(CPU_CODENAMES)
+        return self.random.choice(datasets.CPU_CODENAMES)
 
     def ram_type(self) -> str:
         """Generates a random RAM type.
@@ -95,7 +83,7 @@ class Hardware(BaseProvider):
         :Example:
             DDR3.
         """
-        return self.random.choice(RAM_TYPES)
+        return self.random.choice(datasets.RAM_TYPES)
 
     def ram_size(self) -> str:
         """Generates a random size of RAM.
@@ -105,7 +93,7 @@ class Hardware(BaseProvider):
         :Example:
             16GB.
         """
-        return self.random.choice(RAM_SIZES)
+        return self.random.choice(datasets.RAM_SIZES)
 
     def ssd_or_hdd(self) -> str:
         """Generates a random type of disk.
@@ -115,7 +103,7 @@ class Hardware(BaseProvider):
         :Example:
             512GB SSD.
         """
-        return self.random.choice(HDD_SSD)
+        return self.random.choice(datasets.HDD_SSD)
 
     def graphics(self) -> str:
         """Generates a random graphics card name.
@@ -125,7 +113,7 @@ class Hardware(BaseProvider):
         :Example:
             Intel® Iris™ Pro Graphics 6200.
         """
-        return self.random.choice(GRAPHICS)
+        return self.random.choice(datasets.GRAPHICS)
 
     def manufacturer(self) -> str:
         """Generates a random manufacturer of hardware.
@@ -135,7 +123,7 @@ class Hardware(BaseProvider):
         :Example:
             Dell.
         """
-        return self.random.choice(MANUFACTURERS)
+        return self.random.choice(datasets.MANUFACTURERS)
 
     def phone_model(self) -> str:
         """Generates a random phone model.
@@ -145,4 +133,4 @@ class Hardware(BaseProvider):
         :Example:
             Nokia Lumia 920.
         """
-        return self.random.choice(PHONE_MODELS)
+        return self.random.choice(datasets.PHONE_MODELS)
@@ -1,27 +1,12 @@
 """Provides data related to internet."""
 
 import typing as t
-import urllib.error
 import urllib.parse
-import urllib.request
 from base64 import b64encode
+from functools import cached_property
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 
-from mimesis.datasets import (
-    CLOUD_REGION_DIRECTIONS,
-    CLOUD_REGION_PREFIXES,
-    CONTENT_ENCODING_DIRECTIVES,
-    CORS_OPENER_POLICIES,
-    CORS_RESOURCE_POLICIES,
-    HTTP_METHODS,
-    HTTP_SERVERS,
-    HTTP_STATUS_CODES,
-    HTTP_STATUS_MSGS,
-    PUBLIC_DNS,
-    TLD,
-    USER_AGENTS,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.enums import (
     DSNType,
     IPv4Purpose,
@@ -47,31 +32,21 @@ class Internet(BaseProvider):
     _MAX_IPV4: t.Final[int] = (2**32) - 1
     _MAX_IPV6: t.Final[int] = (2**128) - 1
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Initialize attributes.
+    @cached_property
+    def _file(self) -> File:
+        return self._nested_provider(File)
 
-        :param args: Arguments.
-        :param kwargs: Keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-        self._file = File(
-            seed=self.seed,
-            random=self.random,
-        )
-        self._code = Code(
-            seed=self.seed,
-            random=self.random,
-        )
-        self._text = Text(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
-        self._datetime = Datetime(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
+    @cached_property
+    def _code(self) -> Code:
+        return self._nested_provider(Code)
+
+    @cached_property
+    def _text(self) -> Text:
+        return self._nested_provider(Text, locale=Locale.EN)
+
+    @cached_property
+    def _datetime(self) -> Datetime:
+        return self._nested_provider(Datetime, locale=Locale.EN)
 
     class Meta:
         name = "internet"
@@ -104,7 +79,7 @@ class Internet(BaseProvider):
         :Example:
             200 OK
         """
-        return self.random.choice(HTTP_STATUS_MSGS)
+        return self.random.choice(datasets.HTTP_STATUS_MSGS)
 
     def http_status_code(self) -> int:
         """Generates a random HTTP status code.
@@ -114,7 +89,7 @@ class Internet(BaseProvider):
         :Example:
             200
         """
-        return self.random.choice(HTTP_STATUS_CODES)
+        return self.random.choice(datasets.HTTP_STATUS_CODES)
 
     def http_method(self) -> str:
         """Generates a random HTTP method.
@@ -124,7 +99,7 @@ class Internet(BaseProvider):
         :Example:
             POST
         """
-        return self.random.choice(HTTP_METHODS)
+        return self.random.choice(datasets.HTTP_METHODS)
 
     def ip_v4_object(self) -> IPv4Address:
         """Generates a random :py:class:`ipaddress.IPv4Address` object.
@@ -227,8 +202,8 @@ class Internet(BaseProvider):
             us-east-2
             ap-southeast-3
         """
-        prefix = self.random.choice(CLOUD_REGION_PREFIXES)
-        direction = self.random.choice(CLOUD_REGION_DIRECTIONS)
+        prefix = self.random.choice(datasets.CLOUD_REGION_PREFIXES)
+        direction = self.random.choice(datasets.CLOUD_REGION_DIRECTIONS)
         zone_number = self.random.randint(1, 5)
         return f"{prefix}{separator}{direction}{separator}{zone_number}"
 
@@ -300,7 +275,7 @@ class Internet(BaseProvider):
         :return: Hostname.
         """
         tld = self.tld(tld_type=tld_type)
-        host = self.random.choice(USERNAMES)
+        host = self.random.choice(datasets.USERNAMES)
 
         if subdomains:
             subdomain = self.random.choice(subdomains)
@@ -400,7 +375,7 @@ class Internet(BaseProvider):
         :raises NonEnumerableError: if tld_type not in :class:`enums.TLDType`.
         """
         key = self.validate_enum(item=tld_type, enum=TLDType)
-        return self.random.choice(TLD[key])
+        return self.random.choice(datasets.TLD[key])
 
     def tld(self, *args: t.Any, **kwargs: t.Any) -> str:
         """Generates a random TLD.
@@ -418,7 +393,7 @@ class Internet(BaseProvider):
             Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:15.0)
             Gecko/20100101 Firefox/15.0.1
         """
-        return self.random.choice(USER_AGENTS)
+        return self.random.choice(datasets.USER_AGENTS)
 
     def port(self, port_range: PortRange = PortRange.ALL) -> int:
         """Generates a random port.
@@ -467,7 +442,7 @@ class Internet(BaseProvider):
         :Example:
             1.1.1.1
         """
-        return self.random.choice(PUBLIC_DNS)
+        return self.random.choice(datasets.PUBLIC_DNS)
 
     def http_response_headers(self) -> dict[str, t.Any]:
         """Generates a random HTTP response headers.
@@ -511,7 +486,7 @@ class Internet(BaseProvider):
         headers = {
             "Allow": "*",
             "Age": max_age,
-            "Server": self.random.choice(HTTP_SERVERS),
+            "Server": self.random.choice(datasets.HTTP_SERVERS),
             "Content-Type": self._file.mime_type(),
             "X-Request-ID": self.random.randbytes(16).hex(),
             "Content-Language": self._code.locale_code(),
@@ -522,9 +497,15 @@ class Internet(BaseProvider):
             "X-XSS-Protection": 1,
             "Connection": self.random.choice(["close", "keep-alive"]),
             "X-Frame-Options": self.random.choice(["DENY", "SAMEORIGIN"]),
-            "Content-Encoding": self.random.choice(CONTENT_ENCODING_DIRECTIVES),
-            "Cross-Origin-Opener-Policy": self.random.choice(CORS_OPENER_POLICIES),
-            "Cross-Origin-Resource-Policy": self.random.choice(CORS_RESOURCE_POLICIES),
+            "Content-Encoding": self.random.choice(
+                datasets.CONTENT_ENCODING_DIRECTIVES
+            ),
+            "Cross-Origin-Opener-Policy": self.random.choice(
+                datasets.CORS_OPENER_POLICIES
+            ),
+            "Cross-Origin-Resource-Policy": self.random.choice(
+                datasets.CORS_RESOURCE_POLICIES
+            ),
             "Strict-Transport-Security": f"max-age={max_age}",
         }
         return headers
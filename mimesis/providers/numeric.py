@@ -1,5 +1,6 @@
 """Provides data related to numbers."""
 
+import threading
 import typing as t
 from collections import defaultdict
 from decimal import Decimal
@@ -18,6 +19,18 @@ class Numeric(BaseProvider):
         super().__init__(*args, **kwargs)
         self.__increment_dict: t.DefaultDict[str, int] = defaultdict(int)
         self.__default_accumulator_value: t.Final[str] = "default"
+        # Makes increment() atomic when the provider is shared by threads.
+        self._increment_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # Locks cannot be pickled.
+        state = self.__dict__.copy()
+        del state["_increment_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._increment_lock = threading.Lock()
 
     class Meta:
         name = "numeric"
@@ -49,8 +62,9 @@ class Numeric(BaseProvider):
         if not accumulator:
             accumulator = self.__default_accumulator_value
 
-        self.__increment_dict[accumulator] += 1
-        return self.__increment_dict[accumulator]
+        with self._increment_lock:
+            self.__increment_dict[accumulator] += 1
+            return self.__increment_dict[accumulator]
 
     def float_number(
         self, start: float = -1000.0, end: float = 1000.0, precision: int = 15
@@ -65,6 +79,28 @@ class Numeric(BaseProvider):
         """
         return self.random.uniform(start, end, precision)
 
+    def float_number_many(
+        self,
+        n: int,
+        start: float = -1000.0,
+        end: float = 1000.0,
+        precision: int = 15,
+    ) -> list[float]:
+        """Generates n random float numbers in range [start, end].
+
+        This is the batch counterpart of :meth:`float_number`.
+
+        :param n: Number of values.
+        :param start: Start range.
+        :param end:  End range.
+        :param precision: Round numbers to a given
+            precision in decimal digits, default is 15.
+        :return: List of floats.
+        """
+        rand_fn = self.random._batch_generator(use_numpy=False).random
+        width = end - start
+        return [round(start + width * rand_fn(), precision) for _ in range(n)]
+
     def floats(
         self, start: float = 0, end: float = 1, n: int = 10, precision: int = 15
     ) -> list[float]:
@@ -88,6 +124,25 @@ class Numeric(BaseProvider):
         """
         return self.random.randint(start, end)
 
+    def integer_number_many(
+        self, n: int, start: int = -1000, end: int = 1000
+    ) -> list[int]:
+        """Generates n random integers from start to end.
+
+        This is the batch counterpart of :meth:`integer_number`.
+
+        :param n: Number of values.
+        :param start: Start range.
+        :param end: End range.
+        :return: List of integers.
+        """
+        if start > end:
+            raise ValueError("Minimum value cannot be greater than maximum value.")
+
+        randrange = self.random._batch_generator(use_numpy=False).randrange
+        stop = end + 1
+        return [randrange(start, stop) for _ in range(n)]
+
     def integers(self, start: int = 0, end: int = 10, n: int = 10) -> list[int]:
         """Generates a list of random integers.
 
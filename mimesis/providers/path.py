@@ -4,13 +4,7 @@ import sys
 import typing as t
 from pathlib import PurePosixPath, PureWindowsPath
 
-from mimesis.datasets import (
-    FOLDERS,
-    PLATFORMS,
-    PROGRAMMING_LANGS,
-    PROJECT_NAMES,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.providers.base import BaseProvider
 
 __all__ = ["Path"]
@@ -38,7 +32,7 @@ class Path(BaseProvider):
         self._pathlib_home = (
             PureWindowsPath() if platform.startswith("win") else PurePosixPath()
         )
-        self._pathlib_home /= PLATFORMS[platform]["home"]
+        self._pathlib_home /= datasets.PLATFORMS[platform]["home"]
 
     class Meta:
         name = "path"
@@ -71,7 +65,7 @@ class Path(BaseProvider):
         :Example:
             /home/oretha
         """
-        user = self.random.choice(USERNAMES)
+        user = self.random.choice(datasets.USERNAMES)
         user = user.capitalize() if self.platform.startswith("win") else user.lower()
         return str(self._pathlib_home / user)
 
@@ -84,7 +78,7 @@ class Path(BaseProvider):
             /home/taneka/Pictures
         """
         user = self.user()
-        folder = self.random.choice(FOLDERS)
+        folder = self.random.choice(datasets.FOLDERS)
         return str(self._pathlib_home / user / folder)
 
     def dev_dir(self) -> str:
@@ -97,7 +91,7 @@ class Path(BaseProvider):
         """
         user = self.user()
         folder = self.random.choice(["Development", "Dev"])
-        stack = self.random.choice(PROGRAMMING_LANGS)
+        stack = self.random.choice(datasets.PROGRAMMING_LANGS)
         return str(self._pathlib_home / user / folder / stack)
 
     def project_dir(self) -> str:
@@ -109,5 +103,5 @@ class Path(BaseProvider):
             /home/sherika/Development/Falcon/mercenary
         """
         dev_dir = self.dev_dir()
-        project = self.random.choice(PROJECT_NAMES)
+        project = self.random.choice(datasets.PROJECT_NAMES)
         return str(self._pathlib_home / dev_dir / project)
@@ -2,9 +2,9 @@
 
 import re
 import string
-import typing as t
+from functools import cached_property
 
-from mimesis.datasets import CREDIT_CARD_NETWORKS
+from mimesis import datasets
 from mimesis.enums import CardType, Gender
 from mimesis.exceptions import NonEnumerableError
 from mimesis.locales import Locale
@@ -18,18 +18,9 @@ __all__ = ["Payment"]
 class Payment(BaseProvider):
     """Class that provides data related to payments."""
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Initialize attributes.
-
-        :param args: Arguments.
-        :param kwargs: Keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-        self._person = Person(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
+    @cached_property
+    def _person(self) -> Person:
+        return self._nested_provider(Person, locale=Locale.EN)
 
     class Meta:
         name = "payment"
@@ -92,7 +83,7 @@ class Payment(BaseProvider):
         :Example:
             MasterCard
         """
-        return self.random.choice(CREDIT_CARD_NETWORKS)
+        return self.random.choice(datasets.CREDIT_CARD_NETWORKS)
 
     def credit_card_number(self, card_type: CardType | None = None) -> str:
         """Generates a random credit card number.
@@ -7,14 +7,7 @@ import uuid
 from datetime import date, datetime
 from string import ascii_letters, digits, punctuation
 
-from mimesis.datasets import (
-    BLOOD_GROUPS,
-    CALLING_CODES,
-    EMAIL_DOMAINS,
-    GENDER_CODES,
-    GENDER_SYMBOLS,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.enums import Gender, TitleType
 from mimesis.providers.base import BaseDataProvider
 from mimesis.types import Date
@@ -242,7 +235,7 @@ class Person(BaseDataProvider):
 
         final_username = ""
         for tag in tags:
-            username = self.random.choice(USERNAMES)
+            username = self.random.choice(datasets.USERNAMES)
             if tag == "C":
                 final_username += username.capitalize()
             if tag == "U":
@@ -297,7 +290,7 @@ class Person(BaseDataProvider):
             )
 
         if not domains:
-            domains = EMAIL_DOMAINS
+            domains = datasets.EMAIL_DOMAINS
 
         domain = self.random.choice(domains)
 
@@ -317,7 +310,7 @@ class Person(BaseDataProvider):
         :Example:
             ♂
         """
-        return self.random.choice(GENDER_SYMBOLS)
+        return self.random.choice(datasets.GENDER_SYMBOLS)
 
     def gender_code(self) -> int:
         """Generate a random ISO/IEC 5218 gender code.
@@ -332,7 +325,7 @@ class Person(BaseDataProvider):
 
         :return:
         """
-        return self.random.choice(GENDER_CODES)
+        return self.random.choice(datasets.GENDER_CODES)
 
     def gender(self) -> str:
         """Generates a random gender title.
@@ -383,7 +376,7 @@ class Person(BaseDataProvider):
         :Example:
             A+
         """
-        return self.random.choice(BLOOD_GROUPS)
+        return self.random.choice(datasets.BLOOD_GROUPS)
 
     def occupation(self) -> str:
         """Generates a random job.
@@ -498,7 +491,7 @@ class Person(BaseDataProvider):
             E.164: +79634091122
         """
         if not mask:
-            code = self.random.choice(CALLING_CODES)
+            code = self.random.choice(datasets.CALLING_CODES)
             default = f"{code}-(###)-###-####"
             masks = self._extract(["telephone_fmt"], default=[default])
             mask = self.random.choice(masks)
@@ -1,6 +1,6 @@
 """Provides pseudo-scientific data."""
 
-from mimesis.datasets import SI_PREFIXES, SI_PREFIXES_SYM
+from mimesis import datasets
 from mimesis.enums import MeasureUnit, MetricPrefixSign
 from mimesis.providers.base import BaseProvider
 
@@ -68,7 +68,7 @@ class Science(BaseProvider):
         :Example:
             mega
         """
-        prefixes = SI_PREFIXES_SYM if symbol else SI_PREFIXES
+        prefixes = datasets.SI_PREFIXES_SYM if symbol else datasets.SI_PREFIXES
 
         key = self.validate_enum(item=sign, enum=MetricPrefixSign)
         return self.random.choice(prefixes[key])
@@ -1,7 +1,7 @@
 """Provides data related to text."""
 import typing as t
 
-from mimesis.datasets import SAFE_COLORS
+from mimesis import datasets
 from mimesis.enums import EmojiCategory
 from mimesis.providers.base import BaseDataProvider
 
@@ -28,8 +28,9 @@ class Text(BaseDataProvider):
         """
         case = "uppercase" if not lower_case else "lowercase"
 
-        alpha: list[str] = self._extract(["alphabet", case])
-        return alpha
+        alpha: t.Sequence[str] = self._extract(["alphabet", case])
+        # Datasets are shared between instances, so never expose them.
+        return list(alpha)
 
     def level(self) -> str:
         """Generates a word that indicates a level of something.
@@ -129,7 +130,7 @@ class Text(BaseDataProvider):
             #d8346b
         """
         if safe:
-            return self.random.choice(SAFE_COLORS)
+            return self.random.choice(datasets.SAFE_COLORS)
 
         return f"#{self.random.randint(0x000000, 0xFFFFFF):06x}"
 
@@ -1,12 +1,6 @@
 """Provides data related to transports."""
 
-from mimesis.datasets import (
-    AIRPLANES,
-    AUTO_MANUFACTURERS,
-    CARS,
-    VR_CODES,
-    VRC_BY_LOCALES,
-)
+from mimesis import datasets
 from mimesis.locales import Locale
 from mimesis.providers.base import BaseProvider
 
@@ -27,7 +21,7 @@ class Transport(BaseProvider):
         :Example:
             Tesla.
         """
-        return self.random.choice(AUTO_MANUFACTURERS)
+        return self.random.choice(datasets.AUTO_MANUFACTURERS)
 
     def car(self) -> str:
         """Generates a random vehicle name.
@@ -37,7 +31,7 @@ class Transport(BaseProvider):
         :Example:
             Tesla Model S.
         """
-        return self.random.choice(CARS)
+        return self.random.choice(datasets.CARS)
 
     def airplane(self) -> str:
         """Generates a random airplane model name.
@@ -47,7 +41,7 @@ class Transport(BaseProvider):
         :Example:
             Boeing 727.
         """
-        return self.random.choice(AIRPLANES)
+        return self.random.choice(datasets.AIRPLANES)
 
     def vehicle_registration_code(self, locale: Locale | None = None) -> str:
         """Returns vehicle registration code.
@@ -56,6 +50,6 @@ class Transport(BaseProvider):
         :return: Vehicle registration code.
         """
         if locale:
-            return VRC_BY_LOCALES[locale.value]
+            return datasets.VRC_BY_LOCALES[locale.value]
 
-        return self.random.choice(VR_CODES)
+        return self.random.choice(datasets.VR_CODES)
@@ -5,12 +5,17 @@ methods which are not included in standard :py:class:`random.Random`,
 but frequently used in this project.
 """
 
+import hashlib
+import os
 import random as random_module
+import struct
+import threading
 import typing as t
 
+from mimesis import compat
 from mimesis.types import MissingSeed, Seed
 
-__all__ = ["Random", "random"]
+__all__ = ["CounterRandom", "Random", "ThreadLocalRandom", "WeightedChoice", "random"]
 
 #: Different plugins (like `pytest-randomly`)
 #: can set custom values to a global seed,
@@ -18,6 +23,79 @@ __all__ = ["Random", "random"]
 global_seed: Seed = MissingSeed
 
 
+class WeightedChoice:
+    """A frozen weighted distribution.
+
+    Builds the alias table (Vose's method) once, so that every draw
+    takes constant time regardless of the number of choices.
+
+    Pass it to :meth:`Random.weighted_choice` and :meth:`Random.weighted_choices`
+    instead of a dictionary, which is read on every call.
+    """
+
+    __slots__ = ("population", "weights", "_prob", "_alias", "_arrays")
+
+    def __init__(self, choices: t.Mapping[t.Any, float]) -> None:
+        """Build the alias table.
+
+        :param choices: A mapping where keys are choices and values are weights.
+        :raises ValueError: If choices are empty or weights are invalid.
+        """
+        if not choices:
+            raise ValueError("Choices cannot be empty.")
+
+        self.population: tuple[t.Any, ...] = tuple(choices.keys())
+        self.weights: tuple[float, ...] = tuple(choices.values())
+
+        total = sum(self.weights)
+        if any(w < 0 for w in self.weights) or not total > 0:
+            raise ValueError("Weights must be non-negative with a positive sum.")
+
+        n = len(self.weights)
+        scaled = [w * n / total for w in self.weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        # Zero weights are paired first, so rounding errors
+        # can never make them full columns.
+        small = [i for i, p in enumerate(scaled) if 0 < p < 1.0]
+        small.extend(i for i, p in enumerate(scaled) if p == 0)
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # The rest of the columns are full (up to rounding errors).
+        self._prob = tuple(prob)
+        self._alias = tuple(alias)
+        self._arrays: t.Any = None
+
+    def __len__(self) -> int:
+        return len(self.population)
+
+    def __repr__(self) -> str:
+        items = dict(zip(self.population, self.weights))
+        return f"{self.__class__.__name__}({items!r})"
+
+    def _pick(self, u: float) -> t.Any:
+        """Pick a choice using a uniform number in the range [0.0, 1.0).
+
+        :param u: Uniform random number.
+        :return: Choice.
+        """
+        u *= len(self._prob)
+        i = int(u)
+        if u - i < self._prob[i]:
+            return self.population[i]
+        return self.population[self._alias[i]]
+
+
 class Random(random_module.Random):
     """A custom random class.
 
@@ -98,13 +176,160 @@ class Random(random_module.Random):
         """Generate n random bytes."""
         return self.getrandbits(n * 8).to_bytes(n, "little")
 
-    def weighted_choice(self, choices: dict[t.Any, float]) -> t.Any:
+    def _batch_generator(self, use_numpy: bool = True) -> t.Any:
+        """Create a generator for a single batch.
+
+        The generator is seeded with 128 bits drawn from this instance,
+        so the batch stream is determined by the seed and the number of
+        values generated before. Exactly one draw is made regardless of
+        the batch size and the backend.
+
+        :param use_numpy: Use NumPy if it is installed. Pass False
+            to get the same batch whether NumPy is installed or not.
+        :return: :py:class:`numpy.random.Generator` when NumPy is
+            installed and used, otherwise :py:class:`random.Random`.
+        """
+        batch_seed = self.getrandbits(128)
+        if use_numpy and compat.numpy is not None:
+            return compat.numpy.random.default_rng(batch_seed)
+        return random_module.Random(batch_seed)
+
+    @staticmethod
+    def _validate_amount(n: int) -> None:
+        if n < 0:
+            raise ValueError("Amount out of range.")
+
+    def choice_many(self, seq: t.Sequence[t.Any], n: int) -> t.Sequence[t.Any]:
+        """Get n random elements of the sequence (with replacement).
+
+        :param seq: Non-empty sequence or one-dimensional NumPy array.
+        :param n: Number of elements.
+        :return: NumPy array if NumPy is installed, otherwise list.
+        :raises ValueError: if n is negative.
+        :raises IndexError: if the sequence is empty.
+        """
+        self._validate_amount(n)
+        if len(seq) == 0:
+            raise IndexError("Cannot choose from an empty sequence.")
+
+        rng = self._batch_generator()
+        numpy = compat.numpy
+        if numpy is not None:
+            if isinstance(seq, numpy.ndarray):
+                population = seq
+            else:
+                # Object dtype keeps the elements as they are: asarray() would
+                # convert mixed types to strings and tuples to rows.
+                population = numpy.empty(len(seq), dtype=object)
+                population[:] = list(seq) if isinstance(seq, str) else seq
+            indices = rng.integers(0, len(seq), size=n)
+            return t.cast(t.Sequence[t.Any], population[indices])
+
+        size = len(seq)
+        rand_fn = rng.random
+        return [seq[int(rand_fn() * size)] for _ in range(n)]
+
+    def randint_array(self, a: int, b: int, n: int) -> t.Sequence[int]:
+        """Get n random integers in the range [a, b], including both end points.
+
+        :param a: Minimum value.
+        :param b: Maximum value.
+        :param n: Number of elements.
+        :return: NumPy array if NumPy is installed, otherwise list.
+        :raises ValueError: if n is negative or a is greater than b.
+        """
+        self._validate_amount(n)
+        if a > b:
+            raise ValueError("Minimum value cannot be greater than maximum value.")
+
+        rng = self._batch_generator()
+        if compat.numpy is not None:
+            return t.cast(
+                t.Sequence[int],
+                rng.integers(a, b, size=n, endpoint=True),
+            )
+
+        randrange = rng.randrange
+        stop = b + 1
+        return [randrange(a, stop) for _ in range(n)]
+
+    def uniform_array(
+        self,
+        a: float,
+        b: float,
+        n: int,
+        precision: int = 15,
+    ) -> t.Sequence[float]:
+        """Get n random numbers in the range [a, b).
+
+        :param a: Minimum value.
+        :param b: Maximum value.
+        :param n: Number of elements.
+        :param precision: Round numbers to a given
+            precision in decimal digits, default is 15.
+        :return: NumPy array if NumPy is installed, otherwise list.
+        :raises ValueError: if n is negative.
+        """
+        self._validate_amount(n)
+
+        rng = self._batch_generator()
+        if compat.numpy is not None:
+            return t.cast(
+                t.Sequence[float],
+                compat.numpy.round(rng.uniform(a, b, size=n), precision),
+            )
+
+        rand_fn = rng.random
+        width = b - a
+        return [round(a + width * rand_fn(), precision) for _ in range(n)]
+
+    def randbytes_many(self, n: int, size: int = 16) -> list[bytes]:
+        """Generate n random byte strings of the given size.
+
+        :param n: Number of byte strings.
+        :param size: Size of every byte string.
+        :return: List of byte strings.
+        :raises ValueError: if n or size is negative.
+        """
+        self._validate_amount(n)
+        if size < 0:
+            raise ValueError("Size cannot be negative.")
+
+        # Bytes are generated fast enough without NumPy,
+        # so they do not depend on whether it is installed.
+        rng = self._batch_generator(use_numpy=False)
+        total = n * size
+        blob = rng.getrandbits(total * 8).to_bytes(total, "little")
+
+        if not size:
+            return [b""] * n
+        return [blob[i : i + size] for i in range(0, total, size)]
+
+    @staticmethod
+    def _weighted_table(
+        choices: t.Mapping[t.Any, float] | WeightedChoice,
+    ) -> WeightedChoice:
+        if isinstance(choices, WeightedChoice):
+            return choices
+        return WeightedChoice(choices)
+
+    def weighted_choice(
+        self,
+        choices: t.Mapping[t.Any, float] | WeightedChoice,
+    ) -> t.Any:
         """Returns a random element according to the specified weights.
 
-        :param choices: A dictionary where keys are choices and values are weights.
+        A draw from a :class:`WeightedChoice` takes constant time,
+        a draw from a dictionary takes time linear in its size.
+
+        :param choices: A dictionary where keys are choices and values are weights
+            or a :class:`WeightedChoice`.
         :raises ValueError: If choices are empty.
         :return: Random key from dictionary.
         """
+        if isinstance(choices, WeightedChoice):
+            return choices._pick(self.random())
+
         if not choices:
             raise ValueError("Choices cannot be empty.")
 
@@ -112,6 +337,44 @@ class Random(random_module.Random):
         weights = list(choices.values())
         return self.choices(population, weights=weights, k=1)[0]
 
+    def weighted_choices(
+        self,
+        choices: t.Mapping[t.Any, float] | WeightedChoice,
+        k: int,
+    ) -> t.Sequence[t.Any]:
+        """Returns k random elements according to the specified weights.
+
+        :param choices: A dictionary where keys are choices and values are weights
+            or a :class:`WeightedChoice`.
+        :param k: Number of elements.
+        :raises ValueError: If choices are empty or k is negative.
+        :return: NumPy array if NumPy is installed, otherwise list.
+        """
+        self._validate_amount(k)
+        table = self._weighted_table(choices)
+
+        rng = self._batch_generator()
+        if compat.numpy is not None:
+            if table._arrays is None:
+                population = compat.numpy.empty(len(table), dtype=object)
+                population[:] = table.population
+                table._arrays = (
+                    population,
+                    compat.numpy.asarray(table._prob),
+                    compat.numpy.asarray(table._alias),
+                )
+            population, prob, alias = table._arrays
+            u = rng.random(k) * len(table)
+            indices = u.astype(compat.numpy.intp)
+            indices = compat.numpy.where(
+                u - indices < prob[indices], indices, alias[indices]
+            )
+            return t.cast(t.Sequence[t.Any], population[indices])
+
+        pick = table._pick
+        rand_fn = rng.random
+        return [pick(rand_fn()) for _ in range(k)]
+
     def choice_enum_item(self, enum: t.Any) -> t.Any:
         """Get random value of enum object.
 
@@ -121,6 +384,263 @@ class Random(random_module.Random):
         return self.choice(list(enum))
 
 
+class CounterRandom(Random):
+    """A counter-based random class.
+
+    Every 64-bit word of the stream is a pure function of the seed,
+    the stream number and the position of the word in the stream:
+    words are produced by BLAKE2b keyed with the seed over
+    ``(stream, block)`` pairs, eight words per block.
+
+    Thanks to that, the generator can be moved to any position of any
+    stream without generating the values before it, see :meth:`jump`,
+    :meth:`seek` and :meth:`substream`.
+
+    It is slower than :class:`Random` per value, so use it only when
+    random access to the stream is needed.
+    """
+
+    VERSION: t.ClassVar[int] = 1
+
+    _WORDS_PER_BLOCK: t.Final[int] = 8
+    _RECIP_BPF: t.Final[float] = 2.0**-53
+    _UNPACK: t.Final = struct.Struct("<8Q").unpack
+
+    def __init__(self, x: t.Any = None, stream: int = 0) -> None:
+        """Initialize the generator.
+
+        :param x: Seed.
+        :param stream: Stream number.
+        """
+        super().__init__(x)
+        self.seek(stream)
+
+    def seed(self, a: t.Any = None, version: int = 2) -> None:
+        """Initialize the key from the seed and move to the start of stream 0.
+
+        :param a: Seed. When set to ``None`` the key is random.
+        :param version: Unused, kept for compatibility.
+        """
+        if a is None:
+            key = os.urandom(32)
+        elif isinstance(a, int):
+            size = (a.bit_length() + 8) // 8
+            key = b"i" + a.to_bytes(size, "little", signed=True)
+        elif isinstance(a, float):
+            key = b"f" + a.hex().encode()
+        elif isinstance(a, str):
+            key = b"s" + a.encode()
+        elif isinstance(a, (bytes, bytearray)):
+            key = b"b" + bytes(a)
+        else:
+            raise TypeError(
+                "The only supported seed types are: None, "
+                "int, float, str, bytes, and bytearray."
+            )
+
+        self._key = hashlib.blake2b(key, digest_size=32).digest()
+        self.gauss_next = None
+        self.seek(0)
+
+    @property
+    def stream(self) -> int:
+        """Current stream number."""
+        return self._stream
+
+    @property
+    def counter(self) -> int:
+        """Number of words consumed from the current stream."""
+        return self._counter
+
+    def seek(self, stream: int, counter: int = 0) -> None:
+        """Move to the given position of the given stream.
+
+        :param stream: Stream number.
+        :param counter: Position in the stream (in words).
+        :raises ValueError: if stream or counter is negative.
+        """
+        if stream < 0 or counter < 0:
+            raise ValueError("Stream and counter cannot be negative.")
+
+        self._stream = stream
+        self._stream_bytes = stream.to_bytes(16, "little")
+        self._counter = counter
+        self._block = -1
+        self._words: tuple[int, ...] = ()
+
+    def jump(self, n: int) -> None:
+        """Skip n words of the current stream.
+
+        :meth:`random` consumes one word and :meth:`getrandbits`
+        consumes one word per 64 bits.
+
+        :param n: Number of words.
+        :raises ValueError: if n is negative.
+        """
+        if n < 0:
+            raise ValueError("Cannot jump backwards.")
+        self._counter += n
+
+    def substream(self, k: int) -> "CounterRandom":
+        """Create a generator positioned at the start of stream k.
+
+        The new generator has the same seed but is independent of this one.
+
+        :param k: Stream number.
+        :return: New generator.
+        """
+        other = type(self).__new__(type(self))
+        other.setstate((self.VERSION, self._key, k, 0, None))
+        return other
+
+    def _next_word(self) -> int:
+        block, offset = divmod(self._counter, self._WORDS_PER_BLOCK)
+        if block != self._block:
+            digest = hashlib.blake2b(
+                self._stream_bytes + block.to_bytes(16, "little"),
+                key=self._key,
+                digest_size=self._WORDS_PER_BLOCK * 8,
+            ).digest()
+            self._words = self._UNPACK(digest)
+            self._block = block
+        self._counter += 1
+        return self._words[offset]
+
+    def random(self) -> float:
+        """Get the next random number in the range [0.0, 1.0)."""
+        return (self._next_word() >> 11) * self._RECIP_BPF
+
+    def getrandbits(self, k: int) -> int:
+        """Generate an int with k random bits."""
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative.")
+
+        words = (k + 63) // 64
+        x = 0
+        for _ in range(words):
+            x = (x << 64) | self._next_word()
+        return x >> (words * 64 - k)
+
+    def getstate(self) -> tuple[t.Any, ...]:
+        """Return internal state; can be passed to :meth:`setstate` later."""
+        return self.VERSION, self._key, self._stream, self._counter, self.gauss_next
+
+    def setstate(self, state: tuple[t.Any, ...]) -> None:
+        """Restore internal state from object returned by :meth:`getstate`."""
+        version, key, stream, counter, gauss_next = state
+        if version != self.VERSION:
+            raise ValueError(
+                f"State with version {version} passed to "
+                f"setstate() of version {self.VERSION}."
+            )
+        self._key = key
+        self.seek(stream, counter)
+        self.gauss_next = gauss_next
+
+
+class ThreadLocalRandom(Random):
+    """A random class which gives every thread its own generator.
+
+    The generator of stream *k* is a :class:`Random` seeded with
+    ``f"{seed!r}:{k}"``, so it is determined by the seed and *k*.
+    A thread moves to the start of stream *k* with :meth:`seek`.
+    Threads which do not call it are numbered in the order they first
+    use the instance after it is seeded, and thread *k* uses stream *k*.
+    That order depends on scheduling, so call :meth:`seek` with an index
+    of the task or worker when the values must be reproducible.
+    Without a seed, every thread gets an unseeded generator.
+
+    Values are drawn from the generator of the calling thread, so one
+    instance can be shared by providers which are used from many threads.
+    :meth:`getstate` and :meth:`setstate` work with the generator
+    of the calling thread, and :meth:`seed` resets the generators
+    and the numbering of all threads.
+    """
+
+    def __init__(self, x: t.Any = None) -> None:
+        """Initialize the generator.
+
+        :param x: Seed.
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._generation = 0
+        super().__init__(x)
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return self.__class__, (self._seed,)
+
+    def seed(self, a: t.Any = None, version: int = 2) -> None:
+        """Set the seed and reset the generators of all threads.
+
+        :param a: Seed.
+        :param version: Unused, kept for compatibility.
+        """
+        with self._lock:
+            self._seed = a
+            self._threads = 0
+            self._generation += 1
+
+    def seek(self, stream: int) -> None:
+        """Move the calling thread to the start of the given stream.
+
+        :param stream: Stream number.
+        :raises ValueError: if stream is negative.
+        """
+        if stream < 0:
+            raise ValueError("Stream cannot be negative.")
+
+        with self._lock:
+            seed = self._seed
+            self._local.generation = self._generation
+
+        self._local.random = self._stream_generator(seed, stream)
+
+    @staticmethod
+    def _stream_generator(seed: t.Any, stream: int) -> Random:
+        """Create the generator of the given stream.
+
+        :param seed: Seed.
+        :param stream: Stream number.
+        :return: Random instance.
+        """
+        return Random(None if seed is None else f"{seed!r}:{stream}")
+
+    def _generator(self) -> Random:
+        """Get the generator of the calling thread.
+
+        :return: Random instance.
+        """
+        local = self._local
+        if getattr(local, "generation", None) == self._generation:
+            return local.random  # type: ignore[no-any-return]
+
+        with self._lock:
+            seed, index = self._seed, self._threads
+            self._threads += 1
+            local.generation = self._generation
+
+        local.random = self._stream_generator(seed, index)
+        return local.random  # type: ignore[no-any-return]
+
+    def random(self) -> float:
+        """Get the next random number in the range [0.0, 1.0)."""
+        return self._generator().random()
+
+    def getrandbits(self, k: int) -> int:
+        """Generate an int with k random bits."""
+        return self._generator().getrandbits(k)
+
+    def getstate(self) -> tuple[t.Any, ...]:
+        """Return the state of the generator of the calling thread."""
+        return self._generator().getstate()
+
+    def setstate(self, state: tuple[t.Any, ...]) -> None:
+        """Restore the state of the generator of the calling thread."""
+        self._generator().setstate(state)
+
+
 # Compat
 # See: https://github.com/lk-geimfari/mimesis/issues/469
 random = Random()
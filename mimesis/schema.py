@@ -1,12 +1,29 @@
 """Implements classes for generating data by schema."""
 
+import bz2
+import copy
 import csv
+import gzip
 import inspect
+import io
 import json
+import lzma
+import os
 import pickle
 import re
-from typing import Any, Callable, Sequence
-
+import sys
+import threading
+import types
+import typing as t
+import weakref
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Sequence
+
+from mimesis import compat, datasets
+from mimesis import random as _random
 from mimesis.exceptions import (
     AliasesTypeError,
     FieldArityError,
@@ -16,15 +33,33 @@ from mimesis.exceptions import (
     SchemaError,
 )
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseProvider
+from mimesis.providers import (
+    Address,
+    Code,
+    Development,
+    Finance,
+    Hardware,
+    Internet,
+    Payment,
+    Person,
+    Text,
+    Transport,
+)
+from mimesis.providers.base import BaseProvider, ProviderRegistry
 from mimesis.providers.generic import Generic
-from mimesis.random import Random
+from mimesis.random import CounterRandom, Random
 from mimesis.types import JSON, CallableSchema, Key, MissingSeed, Seed
 
+if t.TYPE_CHECKING:
+    import sqlite3
+    from concurrent.futures import Executor, Future, ProcessPoolExecutor
+    from multiprocessing.context import BaseContext
+
 __all__ = [
     "BaseField",
     "Field",
     "Fieldset",
+    "FieldSpec",
     "Schema",
     "SchemaContext",
     "SchemaBuilder",
@@ -37,6 +72,63 @@ FieldCache = dict[str, Callable[[Any], Any]]
 FieldHandler = Callable[[Random, Any], Any]
 RegisterableFieldHandler = tuple[str, FieldHandler]
 RegisterableFieldHandlers = Sequence[RegisterableFieldHandler]
+Transformer = Callable[[JSON, "SchemaContext"], JSON]
+
+
+def _extracted(*keys: str) -> Callable[[Any], Sequence[Any]]:
+    return lambda provider: provider._extract(list(keys))
+
+
+def _dataset(name: str) -> Callable[[Any], Sequence[Any]]:
+    return lambda provider: getattr(datasets, name)
+
+
+#: Provider methods which return a random item of a fixed list, mapped
+#: to functions which return the list for a provider instance. The keys
+#: are pairs of a method and its keyword arguments. Arrow exporters
+#: generate such columns as dictionary-encoded arrays.
+_CATEGORICAL_METHODS: dict[
+    tuple[Callable[..., Any], tuple[tuple[str, Any], ...]],
+    Callable[[Any], Sequence[Any]],
+] = {
+    (Address.calling_code, ()): _dataset("CALLING_CODES"),
+    (Address.city, ()): _extracted("city"),
+    (Address.country, ()): _extracted("country", "name"),
+    (Code.locale_code, ()): _dataset("LOCALE_CODES"),
+    (Development.os, ()): _dataset("OS"),
+    (Development.programming_language, ()): _dataset("PROGRAMMING_LANGS"),
+    (Development.software_license, ()): _dataset("LICENSES"),
+    (Finance.bank, ()): _extracted("banks"),
+    (Finance.cryptocurrency_iso_code, ()): _dataset("CRYPTOCURRENCY_ISO_CODES"),
+    (Finance.currency_iso_code, (("allow_random", True),)): _dataset(
+        "CURRENCY_ISO_CODES"
+    ),
+    (Finance.stock_exchange, ()): _dataset("STOCK_EXCHANGES"),
+    (Hardware.cpu, ()): _dataset("CPU"),
+    (Hardware.manufacturer, ()): _dataset("MANUFACTURERS"),
+    (Hardware.ram_type, ()): _dataset("RAM_TYPES"),
+    (Hardware.resolution, ()): _dataset("RESOLUTIONS"),
+    (Internet.http_method, ()): _dataset("HTTP_METHODS"),
+    (Internet.http_status_code, ()): _dataset("HTTP_STATUS_CODES"),
+    (Payment.credit_card_network, ()): _dataset("CREDIT_CARD_NETWORKS"),
+    (Person.academic_degree, ()): _extracted("academic_degree"),
+    (Person.blood_type, ()): _dataset("BLOOD_GROUPS"),
+    (Person.gender, ()): _extracted("gender"),
+    (Person.language, ()): _extracted("language"),
+    (Person.occupation, ()): _extracted("occupation"),
+    (Text.color, ()): _extracted("color"),
+    (Transport.manufacturer, ()): _dataset("AUTO_MANUFACTURERS"),
+}
+
+_COMPRESSORS: dict[str, Callable[..., Any]] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+#: Maximum number of key functions whose arity is remembered by a field.
+_KEY_ARITY_CACHE_SIZE = 1024
 
 
 class BaseField:
@@ -44,6 +136,8 @@ class BaseField:
         self,
         locale: Locale = Locale.DEFAULT,
         seed: Seed = MissingSeed,
+        random: Random | None = None,
+        thread_local: bool = False,
     ) -> None:
         """Base class for fields.
 
@@ -52,12 +146,20 @@ class BaseField:
         :attr: aliases: A dictionary of aliases for standard fields.
         :param locale: Locale.
         :param seed: Seed for random.
+        :param random: Custom random shared by all providers,
+            e.g. :class:`~mimesis.random.CounterRandom`.
+        :param thread_local: Give every thread which uses the field
+            its own random, see :class:`~mimesis.random.ThreadLocalRandom`.
         """
         self.seed = seed
-        self._generic = Generic(locale, seed)
+        self._generic = Generic(locale, seed, random=random, thread_local=thread_local)
         self._cache: FieldCache = {}
+        self._plans: dict[str, Callable[..., Any]] = {}
+        self._key_arities: dict[Callable[..., Any], int] = {}
         self._handlers: dict[str, FieldHandler] = {}
         self.aliases: dict[str, str] = {}
+        # Copy of the aliases which were validated last.
+        self._valid_aliases: dict[str, str] = {}
 
     def reseed(self, seed: Seed = MissingSeed) -> None:
         """Reseed the random generator.
@@ -96,15 +198,28 @@ class BaseField:
         This method is called when the field definition
         is fuzzy, like this: ``method``
 
+        Custom providers added with :meth:`~mimesis.Generic.add_provider`
+        take precedence in the order they were added. Other methods are
+        found in the index of provider classes, so only the provider
+        which has the method is instantiated.
+
         :param name: The field name.
         :return: Callable object.
         :raise FieldError: When field is invalid.
         """
-        for provider in dir(self._generic):
-            provider = getattr(self._generic, provider)
-            if isinstance(provider, BaseProvider):
-                if name in dir(provider):
-                    return getattr(provider, name)
+        attributes = vars(self._generic)
+        for attr, provider in attributes.items():
+            # Built-in providers are stored as classes under "_<name>".
+            if (
+                isinstance(provider, BaseProvider)
+                and type(provider) is not attributes.get(f"_{attr}")
+                and name in dir(provider)
+            ):
+                return getattr(provider, name)
+
+        provider_name = ProviderRegistry.get_method_index().get(name)
+        if provider_name is not None:
+            return getattr(getattr(self._generic, provider_name), name)
 
         raise FieldError(name)
 
@@ -142,6 +257,7 @@ class BaseField:
             # Reset to valid state
             self.aliases = {}
             raise AliasesTypeError()
+        self._valid_aliases = self.aliases.copy()
         return True
 
     def perform(
@@ -185,30 +301,229 @@ class BaseField:
         :return: The result of method.
         :raises ValueError: if provider is not supported or if field is not defined.
         """
-        # Validate aliases before lookup
-        self._validate_aliases()
-
         if name is None:
             raise FieldError()
 
-        random = self.get_random_instance()
+        aliases = self.aliases
+        # Comparing with the last valid aliases is cheaper than validating them.
+        if aliases != self._valid_aliases:
+            self._validate_aliases()
 
         # First, try to find a custom field handler.
-        if name in self._handlers:
-            result = self._handlers[name](random, **kwargs)  # type: ignore
+        handler = self._handlers.get(name)
+        if handler is not None:
+            result = handler(self.get_random_instance(), **kwargs)  # type: ignore
         else:
-            result = self._lookup_method(name)(**kwargs)
+            try:
+                method = self._plans[aliases.get(name, name)]
+            except KeyError:
+                method = self._compile_plan(name)
+            result = method(**kwargs)
 
         if key and callable(key):
-            try:
-                # If a key function accepts two parameters
-                # then pass random instance to it.
-                return key(result, random)  # type: ignore
-            except TypeError:
-                return key(result)
+            return self._apply_key(key, result, self.get_random_instance())
 
         return result
 
+    def _get_plan(self, name: str) -> Callable[..., Any]:
+        """Resolve the field name to a callable which accepts the kwargs of the method.
+
+        :param name: The field name.
+        :return: Handler with the random bound or provider method.
+        :raise FieldError: When field is invalid.
+        """
+        # Validate aliases before lookup
+        self._validate_aliases()
+
+        # First, try to find a custom field handler.
+        if name in self._handlers:
+            return partial(self._handlers[name], self.get_random_instance())
+
+        try:
+            return self._plans[self.aliases.get(name, name)]
+        except KeyError:
+            return self._compile_plan(name)
+
+    def _compile_plan(self, name: str) -> Callable[..., Any]:
+        """Resolve the field name to a provider method and cache it.
+
+        Plans are cached by the name the alias resolves to,
+        so changing aliases does not invalidate them.
+
+        :param name: The field name.
+        :return: Provider method.
+        :raise FieldError: When field is invalid.
+        """
+        plan: Callable[..., Any] = self._lookup_method(name)
+        self._plans[self.aliases.get(name, name)] = plan
+        return plan
+
+    def _apply_key(self, key: Callable[..., Any], result: Any, random: Random) -> Any:
+        """Apply a key function to the result.
+
+        Whether the key function accepts the random instance is found
+        out on the first call and remembered for hashable key functions.
+
+        :param key: Key function.
+        :param result: Result of the method.
+        :param random: Random instance.
+        :return: The result of the key function.
+        """
+        arities = self._key_arities
+        try:
+            arity = arities.get(key, 0)
+        except TypeError:
+            # Unhashable key function.
+            arity, arities = 0, {}
+
+        if arity == 2:
+            return key(result, random)
+        if arity == 1:
+            return key(result)
+
+        try:
+            # If a key function accepts two parameters
+            # then pass random instance to it.
+            value, arity = key(result, random), 2
+        except TypeError:
+            value, arity = key(result), 1
+
+        if len(arities) >= _KEY_ARITY_CACHE_SIZE:
+            arities.clear()
+        arities[key] = arity
+        return value
+
+    def _perform_many(
+        self,
+        n: int,
+        /,
+        name: str | None = None,
+        key: Key = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Performs the field n times, looking up the method only once.
+
+        When the provider has a batch counterpart of the method
+        (see :class:`~mimesis.providers.BaseProvider`), it is called once.
+        Otherwise, the compiled field is called n times.
+
+        :param n: Number of values.
+        :param name: Name of the method.
+        :param key: A key function which will be applied to every result.
+        :param kwargs: Kwargs of method.
+        :return: List of values.
+        """
+        batch = self._batch_method(name)
+        if batch is None:
+            compiled = self.compile(name, key, **kwargs)  # type: ignore[arg-type]
+            return [compiled() for _ in range(n)]
+
+        values = batch(n, **kwargs)
+        if key and callable(key):
+            apply_key = self._apply_key
+            random = self.get_random_instance()
+            return [apply_key(key, value, random) for value in values]
+        return values
+
+    def _batch_method(self, name: str | None) -> Callable[..., list[Any]] | None:
+        """Get the batch counterpart of the method the field name resolves to.
+
+        :param name: Name of the field.
+        :return: Bound batch method or None.
+        :raise FieldError: When field is invalid.
+        """
+        if name is None:
+            raise FieldError()
+
+        method = self._get_plan(name)
+
+        provider = getattr(method, "__self__", None)
+        if not isinstance(provider, BaseProvider):
+            # Custom field handlers have no batch counterparts.
+            return None
+        return getattr(provider, f"{method.__name__}_many", None)
+
+    def compile(self, name: str, key: Key = None, **kwargs: Any) -> Callable[[], Any]:
+        """Compile the field to a callable which performs it.
+
+        The field name is resolved, and the kwargs and the key function
+        are bound only once, so calling the result costs about
+        as much as calling the provider method directly:
+
+            >>> field = Field()
+            >>> username = field.compile("username", key=str.upper)
+            >>> username()
+            'POT_1821'
+
+        .. note:: Unlike :meth:`perform`, the compiled field
+            does not see aliases or handlers changed afterward.
+
+        :param name: Name of the method.
+        :param key: A key function which will be applied to the result.
+        :param kwargs: Kwargs of method.
+        :return: Callable which accepts no arguments.
+        :raises FieldError: if field is not defined.
+        """
+        if name is None:
+            raise FieldError()
+
+        method = self._get_plan(name)
+
+        if kwargs:
+            method = partial(method, **kwargs)
+
+        if not (key and callable(key)):
+            return method
+
+        apply_key = self._apply_key
+        random = self.get_random_instance()
+
+        def compiled() -> Any:
+            return apply_key(key, method(), random)
+
+        return compiled
+
+    def compile_many(
+        self, schema: Mapping[str, "str | FieldSpec"]
+    ) -> dict[str, Callable[[], Any]]:
+        """Compile fields of a mapping schema.
+
+        Values are either field names or specifications created by
+        :meth:`spec`. The result can be passed to :class:`Schema`:
+
+            >>> field = Field()
+            >>> fields = field.compile_many({
+            ...     "username": "username",
+            ...     "age": field.spec("integer_number", start=18, end=90),
+            ... })
+            >>> schema = Schema(fields, iterations=100)
+
+        :param schema: Mapping of names to field names or specifications.
+        :return: Dictionary of names to compiled fields.
+        :raises FieldError: if a field is not defined.
+        """
+        compiled = {}
+        for column, field in schema.items():
+            if isinstance(field, FieldSpec):
+                compiled[column] = field.field.compile(
+                    field.name, field.key, **field.kwargs
+                )
+            else:
+                compiled[column] = self.compile(field)
+        return compiled
+
+    def spec(self, name: str, key: Key = None, **kwargs: Any) -> "FieldSpec":
+        """Create a specification of a column for mapping schemas.
+
+        See :class:`Schema` for details.
+
+        :param name: Name of the method.
+        :param key: A key function.
+        :param kwargs: Kwargs of method.
+        :return: Field specification.
+        """
+        return FieldSpec(self, name, key, **kwargs)
+
     def register_handler(self, field_name: str, field_handler: FieldHandler) -> None:
         """Register a new field handler.
 
@@ -289,6 +604,12 @@ class BaseField:
         """
         self._handlers.clear()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Key functions are often lambdas, which cannot be pickled.
+        state = self.__dict__.copy()
+        state["_key_arities"] = {}
+        return state
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__} <{self._generic.locale}>"
 
@@ -381,7 +702,79 @@ class Fieldset(BaseField):
         if iterations < min_iterations:
             raise FieldsetError()
 
-        return [self.perform(*args, **kwargs) for _ in range(iterations)]
+        return self._perform_many(iterations, *args, **kwargs)
+
+
+class FieldSpec:
+    """Specification of a column of a mapping schema.
+
+    Calling the specification performs the field once,
+    :meth:`column` performs it for the whole column at once.
+
+    Use :meth:`BaseField.spec` to create it:
+
+        >>> field = Field()
+        >>> spec = field.spec("username")
+        >>> spec()
+        'pot_1821'
+        >>> spec.column(2)
+        ['vhs_1915', 'reviewed_1849']
+    """
+
+    __slots__ = ("field", "name", "key", "kwargs")
+
+    def __init__(
+        self,
+        field: BaseField,
+        name: str,
+        key: Key = None,
+        **kwargs: Any,
+    ) -> None:
+        self.field = field
+        self.name = name
+        self.key = key
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        return self.field.perform(self.name, key=self.key, **self.kwargs)
+
+    def column(self, n: int) -> list[Any]:
+        """Generate n values of the column.
+
+        :param n: Number of values.
+        :return: List of values.
+        """
+        return self.field._perform_many(n, self.name, self.key, **self.kwargs)
+
+    def _categories(self) -> tuple[Random, Sequence[Any]] | None:
+        """Get the list the field draws values from, if it is known.
+
+        :return: Random of the provider and the list or None.
+        """
+        if self.key is not None or self.name in self.field._handlers:
+            return None
+
+        method = self.field._lookup_method(self.name)
+        func = getattr(method, "__func__", None)
+        if func is None:
+            return None
+
+        try:
+            getter = _CATEGORICAL_METHODS.get(
+                (func, tuple(sorted(self.kwargs.items())))
+            )
+        except TypeError:
+            # Unhashable keyword arguments.
+            return None
+
+        if getter is None:
+            return None
+
+        provider = method.__self__
+        return provider.random, getter(provider)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} <{self.name}>"
 
 
 class SchemaContext:
@@ -421,11 +814,12 @@ class SchemaContext:
             raise ValueError("pick_from() requires SchemaBuilder")
         return self.schema_builder._pick_from(schema_name, field)
 
-    def ref(self, schema_name: str) -> list[JSON]:
+    def ref(self, schema_name: str) -> Sequence[JSON]:
         """Get all generated items from a schema.
 
         :param schema_name: Name of the schema in builder registry.
-        :return: List of all items from that schema.
+        :return: List of all items from that schema or, for
+            :meth:`SchemaBuilder.stream`, a sequence of their kept fields.
         :raises ValueError: If builder is not available or schema is not found.
         """
         if not self.schema_builder:
@@ -434,7 +828,23 @@ class SchemaContext:
 
 
 class Schema:
-    """Class which return list of filled schemas."""
+    """Class which return list of filled schemas.
+
+    The schema is either a callable object which returns a dict or a mapping
+    of names to callable objects, usually :class:`FieldSpec`:
+
+        >>> field = Field()
+        >>> schema = Schema(
+        ...     schema={
+        ...         "username": field.spec("username"),
+        ...         "age": field.spec("integer_number", start=18, end=90),
+        ...     },
+        ...     iterations=100,
+        ... )
+
+    Columns of mapping schemas are generated in one pass per column
+    by :meth:`create_columns` and :meth:`iter_columns`.
+    """
 
     __slots__ = (
         "iterations",
@@ -443,31 +853,50 @@ class Schema:
         "__schema",
         "__seed",
         "_custom_context",
+        "_random",
+        "_fields",
     )
 
     def __init__(
         self,
-        schema: CallableSchema,
+        schema: CallableSchema | Mapping[str, Callable[[], Any]],
         iterations: int = 10,
         seed: Seed = MissingSeed,
+        random: CounterRandom | None = None,
     ) -> None:
         """Initialize schema.
 
-        :param schema: A schema (must be a callable object).
+        :param schema: A schema (a callable object or a mapping
+            of names to callable objects).
         :param iterations: Number of iterations.
         :param seed: Seed for random generator.
+        :param random: Counter-based random used by the fields of the schema.
+            When passed, the item with index *i* is generated from
+            the stream *i* of this random, so it depends only on the seed
+            and the index.
+        :raises TypeError: if random is not a :class:`~mimesis.random.CounterRandom`.
         """
         if iterations < 1:
             raise ValueError("Number of iterations should be greater than 1.")
 
-        if not callable(schema):
+        self._fields: dict[str, Callable[[], Any]] | None = None
+        if isinstance(schema, Mapping):
+            if not all(callable(value) for value in schema.values()):
+                raise SchemaError()
+            self._fields = dict(schema)
+            schema = self._create_row
+        elif not callable(schema):
             raise SchemaError()
 
+        if random is not None and not isinstance(random, CounterRandom):
+            raise TypeError("The random must be an instance of CounterRandom.")
+
+        self._random = random
         self.__schema = schema
         self.__seed = seed
         self.__counter = 0
         self.iterations = iterations
-        self._transformers: list[Callable[..., Any]] = []
+        self._transformers: list[Transformer] = []
         self._custom_context: dict[str, Any] = {}
 
     def _apply_transformers(self, item: JSON, ctx: SchemaContext) -> JSON:
@@ -478,18 +907,34 @@ class Schema:
         :return: Transformed item.
         """
         for transformer in self._transformers:
-            sig = inspect.signature(transformer)
-            param_count = len(sig.parameters)
-
-            if param_count == 1:
-                item = transformer(item)
-            elif param_count >= 2:
-                item = transformer(item, ctx)
-            else:
-                item = transformer(item)
+            item = transformer(item, ctx)
 
         return item
 
+    @staticmethod
+    def _bind_transformer(fn: Callable[..., Any]) -> Transformer:
+        """Bind a transformer to the (item, context) calling convention.
+
+        The arity of the transformer is resolved only once here
+        because :func:`inspect.signature` is too slow to call per item.
+
+        :param fn: Function which accepts (item) or (item, context).
+        :return: Function which accepts (item, context).
+        """
+        try:
+            param_count = len(inspect.signature(fn).parameters)
+        except (TypeError, ValueError):
+            # Some builtins have no signature.
+            param_count = 1
+
+        if param_count >= 2:
+            return fn
+
+        def transformer(item: JSON, ctx: SchemaContext) -> JSON:
+            return fn(item)  # type: ignore[no-any-return]
+
+        return transformer
+
     def map(self, fn: Callable[..., Any]) -> "Schema":
         """Transform each generated item.
 
@@ -497,7 +942,7 @@ class Schema:
             Can accept (item) or (item, context).
         :return: Self for chaining.
         """
-        self._transformers.append(fn)
+        self._transformers.append(self._bind_transformer(fn))
         return self
 
     def with_context(self, **kwargs: Any) -> "Schema":
@@ -509,36 +954,249 @@ class Schema:
         self._custom_context.update(kwargs)
         return self
 
-    def to_csv(self, file_path: str, **kwargs: Any) -> None:
+    def _chunks(
+        self,
+        chunk_size: int,
+        total: int | None = None,
+        fill: bool = True,
+    ) -> Iterator[list[JSON]]:
+        """Lazily create items in chunks.
+
+        The context object is shared by the items of all chunks
+        and the items are filtered once per chunk.
+
+        :param chunk_size: Maximum number of items per chunk.
+        :param total: Total number of items, defaults to :attr:`iterations`.
+        :param fill: Replace items filtered out by transformers, as :meth:`create`
+            does. Otherwise, make one attempt per item, as the iteration
+            protocol does, so fewer items may be created.
+        :return: Iterator of lists of items.
+        :raises ValueError: if chunk size is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be greater than 0.")
+
+        total = self.iterations if total is None else total
+
+        schema = self.__schema
+        transformers = self._transformers
+        random = self._random
+        ctx = SchemaContext(
+            index=0,
+            seed=self.__seed,
+            custom=self._custom_context,
+        )
+
+        index = count = 0
+        attempts = sys.maxsize if fill else total
+
+        while count < total and index < attempts:
+            chunk: list[JSON] = []
+            size = min(chunk_size, total - count)
+
+            while len(chunk) < size and index < attempts:
+                items = []
+                stop = min(index + size - len(chunk), attempts)
+                for index in range(index, stop):
+                    if random is not None:
+                        random.seek(index)
+
+                    item = schema()
+                    if transformers:
+                        ctx.index = index
+                        ctx.iteration = index + 1
+                        for transformer in transformers:
+                            item = transformer(item, ctx)
+
+                    items.append(item)
+
+                index += 1
+                chunk.extend(item for item in items if item is not None)
+
+            if chunk:
+                count += len(chunk)
+                yield chunk
+
+    def batches(self, size: int = 1000) -> Iterator[list[JSON]]:
+        """Lazily create batches of :attr:`iterations` items.
+
+        The items are the same as the items of the iteration protocol,
+        but the per-item overhead is lower. So items filtered out
+        by transformers are not replaced, unlike in :meth:`create`.
+        Transformers of the schema receive the same context object
+        for all items, updated for each of them.
+
+        See :meth:`iter_columns` for column-oriented batches.
+
+        :param size: Maximum number of items per batch.
+        :return: Iterator of lists of items.
+        :raises ValueError: if size is less than 1.
+        """
+        return self._chunks(size, fill=False)
+
+    def to_csv(self, file_path: str, chunk_size: int = 1000, **kwargs: Any) -> None:
         """Export a schema as a CSV file.
 
+        Items are written in chunks, so the memory usage does not depend
+        on the number of iterations. The header is taken from the first item.
+
         :param file_path: The file path.
-        :param kwargs: The keyword arguments for :py:class:`csv.DictWriter` class.
+        :param chunk_size: Number of items per chunk.
+        :param kwargs: The keyword arguments for :py:func:`csv.writer`.
         """
-        data = self.create()
         with open(file_path, "w", encoding="utf-8", newline="") as fp:
-            fieldnames = list(data[0])
-            dict_writer = csv.DictWriter(fp, fieldnames, **kwargs)
-            dict_writer.writeheader()
-            dict_writer.writerows(data)
+            writer = csv.writer(fp, **kwargs)
+            fieldnames: list[str] | None = None
+
+            for chunk in self._chunks(chunk_size):
+                if fieldnames is None:
+                    fieldnames = list(chunk[0])
+                    writer.writerow(fieldnames)
+
+                writer.writerows(
+                    [item.get(name, "") for name in fieldnames] for item in chunk
+                )
 
-    def to_json(self, file_path: str, **kwargs: Any) -> None:
+    def to_json(self, file_path: str, chunk_size: int = 1000, **kwargs: Any) -> None:
         """Export a schema as a JSON file.
 
+        The JSON array is written incrementally in chunks, so the memory
+        usage does not depend on the number of iterations. The layout is
+        the same as the layout of :py:func:`json.dump` for a list of the items.
+
         :param file_path: File a path.
+        :param chunk_size: Number of items per chunk.
         :param kwargs: Extra keyword arguments for :py:func:`json.dump` class.
         """
+        encoder_cls = kwargs.pop("cls", None) or json.JSONEncoder
+        encoder = encoder_cls(**kwargs)
+        encode: Callable[[JSON], str] = encoder.encode
+        newline = ""
+
+        if encoder.indent is not None:
+            indent = encoder.indent
+            newline = "\n" + (indent if isinstance(indent, str) else " " * indent)
+
+            def encode_nested(item: JSON) -> str:
+                # Items are nested one level deeper in the array. Encoded
+                # strings never contain raw newlines, so only the line
+                # breaks of the layout are indented.
+                return encoder.encode(item).replace("\n", newline)
+
+            encode = encode_nested
+
+        separator = encoder.item_separator + newline
+
         with open(file_path, "w", encoding="utf-8") as fp:
-            json.dump(self.create(), fp, **kwargs)
+            fp.write("[")
+            empty = True
+            for chunk in self._chunks(chunk_size):
+                fp.write(newline if empty else separator)
+                fp.write(separator.join(map(encode, chunk)))
+                empty = False
+            if newline and not empty:
+                fp.write("\n")
+            fp.write("]")
+
+    def to_jsonl(
+        self,
+        file: str | os.PathLike[str] | t.IO[Any],
+        buffer_size: int = 1024 * 1024,
+        compress: t.Literal["gzip", "bz2", "xz"] | None = None,
+        chunk_size: int = 1000,
+        **kwargs: Any,
+    ) -> None:
+        """Export a schema as JSON Lines (newline-delimited JSON).
+
+        Items are encoded by a single encoder and written when at least
+        ``buffer_size`` characters are collected, so the memory usage does
+        not depend on the number of iterations.
+
+        The file can be a path or a file-like object, e.g. :py:data:`sys.stdout`,
+        which is not closed afterwards. Compressed output requires a path
+        or a binary file-like object.
+
+        :param file: The file path or a file-like object.
+        :param buffer_size: Number of characters to collect before writing.
+        :param compress: Compression: ``gzip``, ``bz2``, ``xz`` or ``None``.
+        :param chunk_size: Number of items per chunk.
+        :param kwargs: Extra keyword arguments for :py:class:`json.JSONEncoder`.
+        :raises ValueError: if compression is not supported, if it is used
+            with a text file-like object or if ``indent`` is passed.
+        """
+        if compress is not None and compress not in _COMPRESSORS:
+            raise ValueError(
+                f"Unsupported compression: {compress}. "
+                f"Use one of: {', '.join(_COMPRESSORS)}."
+            )
+
+        if kwargs.get("indent") is not None:
+            raise ValueError("JSON Lines cannot be indented.")
+
+        encoder_cls = kwargs.pop("cls", None) or json.JSONEncoder
+        encode = encoder_cls(**kwargs).encode
+
+        with ExitStack() as stack:
+            if isinstance(file, (str, os.PathLike)):
+                fp: t.IO[Any] = stack.enter_context(open(file, "wb"))
+            else:
+                fp = file
+
+            write: Callable[[str], Any]
+            if isinstance(fp, io.TextIOBase):
+                if compress is not None:
+                    raise ValueError("Compressed output requires a binary file.")
+                write = fp.write
+            else:
+                if compress is not None:
+                    fp = stack.enter_context(_COMPRESSORS[compress](fp, "wb"))
+                binary_write = fp.write
+
+                def write(data: str) -> Any:
+                    return binary_write(data.encode("utf-8"))
+
+            buffer: list[str] = []
+            buffered = 0
+
+            for chunk in self._chunks(chunk_size):
+                for item in chunk:
+                    line = encode(item)
+                    buffer.append(line)
+                    buffered += len(line) + 1
+
+                if buffered >= buffer_size:
+                    buffer.append("")
+                    write("\n".join(buffer))
+                    buffer.clear()
+                    buffered = 0
 
-    def to_pickle(self, file_path: str, **kwargs: Any) -> None:
-        """Export a schema as the pickled representation of the object to the file.
+            if buffer:
+                buffer.append("")
+                write("\n".join(buffer))
+
+            fp.flush()
+
+    def to_pickle(self, file_path: str, chunk_size: int = 1000, **kwargs: Any) -> None:
+        """Export a schema as a stream of pickled chunks to the file.
+
+        Every chunk is a list of at most ``chunk_size`` items, pickled
+        separately, so the memory usage does not depend on the number
+        of iterations. To read the items, load chunks until the end of file:
+
+            >>> with open(file_path, "rb") as fp:
+            ...     while True:
+            ...         try:
+            ...             items.extend(pickle.load(fp))
+            ...         except EOFError:
+            ...             break
 
         :param file_path: The file path.
+        :param chunk_size: Number of items per chunk.
         :param kwargs: Extra keyword arguments for :py:func:`pickle.dump` class.
         """
         with open(file_path, "wb") as fp:
-            pickle.dump(self.create(), fp, **kwargs)
+            for chunk in self._chunks(chunk_size):
+                pickle.dump(chunk, fp, **kwargs)
 
     def _create_item(self, index: int) -> JSON:
         """Create a single item with given index.
@@ -552,11 +1210,279 @@ class Schema:
             custom=self._custom_context,
         )
 
+        if self._random is not None:
+            self._random.seek(index)
+
         result = self.__schema()
         result = self._apply_transformers(result, ctx)
         return result
 
-    def create(self) -> list[JSON]:
+    def _create_row(self) -> JSON:
+        """Create a row of a mapping schema."""
+        fields = t.cast(dict[str, Callable[[], Any]], self._fields)
+        return {name: fn() for name, fn in fields.items()}
+
+    def _columnar_fields(self) -> dict[str, Callable[[], Any]] | None:
+        """Get fields of the schema if its columns can be generated directly.
+
+        Transformers and counter-based random work with rows,
+        so such schemas are generated row by row.
+
+        :return: Fields of a mapping schema or None.
+        """
+        if self._transformers or self._random:
+            return None
+        return self._fields
+
+    def _column_batches(
+        self,
+        batch_size: int,
+        total: int,
+    ) -> Iterator[dict[str, list[Any]]]:
+        """Lazily create batches of columns.
+
+        :param batch_size: Maximum number of items per batch.
+        :param total: Total number of items.
+        :return: Iterator of dictionaries of columns.
+        """
+        fields = self._columnar_fields()
+        if fields is None:
+            for rows in self._chunks(batch_size, total):
+                names = dict.fromkeys(name for row in rows for name in row)
+                yield {name: [row.get(name) for row in rows] for name in names}
+            return
+
+        for start in range(0, total, batch_size):
+            n = min(batch_size, total - start)
+            yield {
+                name: fn.column(n)
+                if isinstance(fn, FieldSpec)
+                else [fn() for _ in range(n)]
+                for name, fn in fields.items()
+            }
+
+    def create_columns(self, n: int | None = None) -> dict[str, list[Any]]:
+        """Creates column-oriented data.
+
+        .. note::
+            For mapping schemas, values are generated column by column,
+            so a seeded schema produces different values than :meth:`create`.
+
+        :param n: Number of items, defaults to :attr:`iterations`.
+        :return: Dictionary of column names to lists of values.
+        :raises ValueError: if n is less than 1.
+        """
+        n = self.iterations if n is None else n
+        if n < 1:
+            raise ValueError("Number of items should be greater than 0.")
+        return next(self._column_batches(n, n))
+
+    def iter_columns(self, batch_size: int = 1000) -> Iterator[dict[str, list[Any]]]:
+        """Lazily create column-oriented batches of :attr:`iterations` items.
+
+        :param batch_size: Maximum number of items per batch.
+        :return: Iterator of dictionaries of columns.
+        :raises ValueError: if batch size is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size should be greater than 0.")
+
+        yield from self._column_batches(batch_size, self.iterations)
+
+    def _record_batches(
+        self, batch_size: int, arrow_schema: Any = None
+    ) -> Iterator[Any]:
+        """Lazily create Arrow record batches of :attr:`iterations` items.
+
+        Columns of mapping schemas which draw values from a fixed list
+        of a dataset are generated as dictionary-encoded arrays of
+        random indices into the list.
+
+        Unless ``arrow_schema`` is passed, the type of a column is inferred
+        from the first batch in which it has a value other than None, so
+        batches may differ in columns of type ``null``.
+
+        :param batch_size: Maximum number of items per batch.
+        :param arrow_schema: :class:`pyarrow.Schema` of all batches.
+        :return: Iterator of :class:`pyarrow.RecordBatch`.
+        :raises ImportError: if pyarrow is not installed.
+        :raises ValueError: if batch size is less than 1.
+        """
+        pa = compat.pyarrow
+        if pa is None:
+            raise ImportError("Arrow export requires pyarrow.")
+
+        if batch_size < 1:
+            raise ValueError("Batch size should be greater than 0.")
+
+        types: dict[str, Any] = {}
+        if arrow_schema is not None:
+            types = {field.name: field.type for field in arrow_schema}
+
+        fields = self._columnar_fields()
+
+        if fields is None:
+            for columns in self._column_batches(batch_size, self.iterations):
+                if arrow_schema is not None:
+                    yield pa.RecordBatch.from_pydict(columns, schema=arrow_schema)
+                    continue
+
+                arrays = [pa.array(v, type=types.get(k)) for k, v in columns.items()]
+                batch = pa.RecordBatch.from_arrays(arrays, names=list(columns))
+                _update_arrow_types(types, batch.schema)
+                yield batch
+            return
+
+        dictionaries = {}
+        for name, fn in fields.items():
+            if name in types and not pa.types.is_dictionary(types[name]):
+                continue
+            if isinstance(fn, FieldSpec):
+                categories = fn._categories()
+                if categories is not None:
+                    random, values = categories
+                    dictionaries[name] = (random, pa.array(list(values)))
+
+        for start in range(0, self.iterations, batch_size):
+            n = min(batch_size, self.iterations - start)
+            arrays = []
+
+            for name, fn in fields.items():
+                if name in dictionaries:
+                    random, dictionary = dictionaries[name]
+                    indices = random.randint_array(0, len(dictionary) - 1, n)
+                    arrays.append(
+                        pa.DictionaryArray.from_arrays(
+                            pa.array(indices, type=pa.int32()),
+                            dictionary,
+                        )
+                    )
+                    continue
+
+                if isinstance(fn, FieldSpec):
+                    values = fn.column(n)
+                else:
+                    values = [fn() for _ in range(n)]
+
+                arrays.append(pa.array(values, type=types.get(name)))
+
+            batch = pa.RecordBatch.from_arrays(arrays, names=list(fields))
+            if arrow_schema is None:
+                _update_arrow_types(types, batch.schema)
+            yield batch
+
+    def to_arrow(self, batch_size: int = 10_000, arrow_schema: Any = None) -> Any:
+        """Export a schema as an Arrow table.
+
+        The table is built from record batches, which are generated
+        incrementally. Columns which are None in the first batches
+        get the type of their first other values.
+        Requires `pyarrow <https://arrow.apache.org/>`_.
+
+        :param batch_size: Maximum number of items per record batch.
+        :param arrow_schema: :class:`pyarrow.Schema` of the table,
+            inferred from the values by default.
+        :return: :class:`pyarrow.Table`.
+        :raises ImportError: if pyarrow is not installed.
+        """
+        pa = compat.pyarrow
+        batches = list(self._record_batches(batch_size, arrow_schema))
+        if arrow_schema is not None:
+            return pa.Table.from_batches(batches).cast(arrow_schema)
+
+        tables = [pa.Table.from_batches([batch]) for batch in batches]
+        # Columns of type null are widened to the type of other batches.
+        return pa.concat_tables(tables, promote_options="default")
+
+    def to_parquet(
+        self,
+        file_path: str | os.PathLike[str],
+        row_group_size: int = 100_000,
+        arrow_schema: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        """Export a schema as a Parquet file.
+
+        Every row group is generated and written separately, so the memory
+        usage does not depend on the number of iterations.
+        Requires `pyarrow <https://arrow.apache.org/>`_.
+
+        :param file_path: The file path.
+        :param row_group_size: Number of items per row group.
+        :param arrow_schema: :class:`pyarrow.Schema` of the file, defaults to
+            the schema of the first row group. Pass it when a column may be
+            None in the whole first row group.
+        :param kwargs: Extra keyword arguments for :class:`pyarrow.parquet.ParquetWriter`.
+        :raises ImportError: if pyarrow is not installed.
+        :raises ValueError: if a row group does not match the schema of the file.
+        """
+        batches = self._record_batches(row_group_size, arrow_schema)
+        first = next(batches)
+        if arrow_schema is None:
+            arrow_schema = first.schema
+
+        with compat.parquet.ParquetWriter(file_path, arrow_schema, **kwargs) as writer:
+            _write_arrow_batch(writer, first, arrow_schema)
+            for batch in batches:
+                _write_arrow_batch(writer, batch, arrow_schema)
+
+    def to_arrow_ipc(
+        self,
+        sink: str | os.PathLike[str] | t.IO[bytes] | Any,
+        batch_size: int = 10_000,
+        arrow_schema: Any = None,
+    ) -> None:
+        """Export a schema in the Arrow IPC streaming format.
+
+        Record batches are generated and written one by one, so the memory
+        usage does not depend on the number of iterations. File-like
+        objects are not closed afterwards.
+        Requires `pyarrow <https://arrow.apache.org/>`_.
+
+        :param sink: The file path, a binary file-like object or
+            a :class:`pyarrow.NativeFile`.
+        :param batch_size: Maximum number of items per record batch.
+        :param arrow_schema: :class:`pyarrow.Schema` of the stream, defaults to
+            the schema of the first batch. Pass it when a column may be
+            None in the whole first batch.
+        :raises ImportError: if pyarrow is not installed.
+        :raises ValueError: if a batch does not match the schema of the stream.
+        """
+        batches = self._record_batches(batch_size, arrow_schema)
+        first = next(batches)
+
+        if isinstance(sink, os.PathLike):
+            sink = os.fspath(sink)
+
+        if arrow_schema is None:
+            arrow_schema = first.schema
+
+        with compat.pyarrow.ipc.new_stream(sink, arrow_schema) as writer:
+            _write_arrow_batch(writer, first, arrow_schema)
+            for batch in batches:
+                _write_arrow_batch(writer, batch, arrow_schema)
+
+    def create_item(self, index: int) -> JSON:
+        """Create the item with the given index.
+
+        Unless the schema has a counter-based random, the result depends
+        on all values generated before.
+
+        .. note::
+            Items filtered out by transformers are counted too, so the index
+            may differ from the position of the item in :meth:`create`.
+
+        :param index: Index of the item.
+        :return: Generated and transformed item.
+        """
+        return self._create_item(index)
+
+    def create(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 1000,
+        mp_context: "BaseContext | None" = None,
+    ) -> list[JSON]:
         """Creates a list of a fulfilled schemas.
 
         .. note::
@@ -566,20 +1492,316 @@ class Schema:
             If you need a lazy version of this method, just use :meth:`iterator` or
             the iterator protocol of :class:`Schema`
 
+        :param workers: Number of worker processes. When passed, items are
+            generated in chunks by :meth:`iter_parallel`.
+        :param chunk_size: Number of items per chunk of parallel generation.
+        :param mp_context: Multiprocessing context of parallel generation.
         :return: List of fulfilled schemas.
         """
-        index = 0
-        results: list[JSON] = []
+        if workers is not None:
+            return [
+                item
+                for chunk in self.iter_parallel(
+                    workers, chunk_size, mp_context=mp_context
+                )
+                for item in chunk
+            ]
 
-        while len(results) < self.iterations:
-            result = self._create_item(index)
+        return next(self._chunks(self.iterations))
 
-            if result is not None:
-                results.append(result)
+    def _random_sources(self) -> list[Any]:
+        """Get distinct fields, providers and randoms of a mapping schema."""
+        sources: dict[int, Any] = {}
+        for fn in (self._fields or {}).values():
+            _find_random_sources(fn, sources)
+        return list(sources.values())
+
+    def _check_reproducible(self) -> None:
+        """Check that the fields of the schema can be reseeded for parallel generation.
+
+        :raises ValueError: if the schema is neither a mapping nor has
+            a counter-based random, or if a value of the mapping draws
+            from nothing which can be reseeded.
+        """
+        if self._random is not None:
+            return
+
+        if self._fields is None:
+            raise ValueError(
+                "Parallel generation requires a mapping schema "
+                "or a counter-based random."
+            )
+
+        for name, fn in self._fields.items():
+            if not _find_random_sources(fn, {}):
+                raise ValueError(
+                    f"Field '{name}' cannot be reseeded for parallel generation. "
+                    "Use fields, their specifications or compiled fields."
+                )
+
+    def _reseed_fields(self, seed: str) -> None:
+        """Reseed the fields of a mapping schema, unless it has a counter-based random.
+
+        :param seed: Seed, extended with the position of each field,
+            provider or random the schema draws from.
+        """
+        if self._random is None:
+            for n, source in enumerate(self._random_sources()):
+                if isinstance(source, Random):
+                    source.seed(f"{seed}:{n}")
+                else:
+                    source.reseed(f"{seed}:{n}")
+
+    def _isolated(self) -> "Schema":
+        """Copy a mapping schema, so reseeding the copy does not affect its fields.
+
+        :return: Copy of the schema or the schema itself if it has
+            a counter-based random or is not a mapping.
+        """
+        if self._fields is None or self._random is not None:
+            return self
+
+        memo: dict[int, Any] = {}
+        schema = copy.copy(self)
+        schema._fields = {
+            name: _copy_value(fn, memo) for name, fn in self._fields.items()
+        }
+        schema.__schema = schema._create_row
+        return schema
+
+    def _create_chunk(
+        self, seed: Seed, index: int, start: int, stop: int
+    ) -> list[JSON]:
+        """Create items with indices in the given range.
+
+        Unless the schema has a counter-based random, fields of the schema
+        are reseeded from the seed and the index of the chunk first.
+
+        :param seed: Base seed of chunks.
+        :param index: Index of the chunk.
+        :param start: Index of the first item.
+        :param stop: Index after the last item.
+        :return: Items which are not filtered out by transformers.
+        """
+        self._reseed_fields(f"{seed!r}:{index}")
+
+        items = []
+        for i in range(start, stop):
+            item = self._create_item(i)
+            if item is not None:
+                items.append(item)
+        return items
+
+    def iter_parallel(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 1000,
+        ordered: bool = True,
+        sink: Callable[[int, list[JSON]], Any] | None = None,
+        mp_context: "BaseContext | None" = None,
+    ) -> Iterator[Any]:
+        """Lazily create chunks of items in a pool of worker processes.
+
+        The item with index *i* belongs to the chunk ``i // chunk_size``.
+        Every chunk is generated from a seed derived from the seed of the schema
+        and the index of the chunk, so the output does not depend on the number
+        of workers. The fields, providers and randoms which values of a mapping
+        schema refer to are reseeded for that. With a counter-based random,
+        every item is the same as the one returned by :meth:`create_item`.
+
+        Items filtered out by transformers are not replaced, so fewer than
+        :attr:`iterations` items are generated in this case.
+
+        .. note::
+            Methods which keep a state between calls, such as ``increment``,
+            continue it in every process separately. Use the index of
+            the item from the context of a transformer instead.
+
+        Worker processes are started with the default start method of
+        the platform, see :mod:`multiprocessing`. Unless they are forked,
+        the schema and the sink must be picklable, so use fields,
+        their specifications and functions defined at the module level.
+
+        :param workers: Number of worker processes, defaults to the number
+            of CPUs. With a single worker, chunks are generated in this process.
+        :param chunk_size: Number of items per chunk.
+        :param ordered: Yield chunks in order. Otherwise, chunks are yielded
+            as soon as they are ready.
+        :param sink: Function called in a worker with the index of a chunk
+            and its items, e.g. to write them to a file. Its results are
+            yielded instead of the items, so they are not sent back.
+        :param mp_context: Multiprocessing context used to start workers,
+            e.g. ``multiprocessing.get_context("spawn")``.
+        :return: Iterator of lists of items or results of the sink.
+        :raises ValueError: if workers or chunk size is less than 1,
+            if the schema is neither a mapping nor has a counter-based random
+            or if a value of the mapping refers to nothing which can be reseeded.
+        """
+        results = self._parallel_chunks(workers, chunk_size, ordered, sink, mp_context)
+        # Start the workers.
+        next(results)
+        yield from results
+
+    def _parallel_chunks(
+        self,
+        workers: int | None,
+        chunk_size: int,
+        ordered: bool,
+        sink: Callable[[int, list[JSON]], Any] | None,
+        mp_context: "BaseContext | None",
+    ) -> Iterator[Any]:
+        """Generator of :meth:`iter_parallel`, which yields None once workers start.
+
+        This way, the caller decides on which thread worker processes are started.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError("Number of workers should be greater than 0.")
+
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be greater than 0.")
 
-            index += 1
+        self._check_reproducible()
+        seed = _parallel_seed(self.__seed)
 
-        return results
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        chunks = (
+            (seed, index, start, min(start + chunk_size, self.iterations))
+            for index, start in enumerate(range(0, self.iterations, chunk_size))
+        )
+
+        if workers == 1:
+            schema = self._isolated()
+            yield None
+            for args in chunks:
+                items = schema._create_chunk(*args)
+                yield items if sink is None else sink(args[1], items)
+            return
+
+        with _process_pool(
+            workers, mp_context, _init_parallel_worker, self, sink
+        ) as executor:
+            # Keep a bounded number of chunks in flight.
+            pending: deque[Future[Any]] = deque(
+                executor.submit(_run_parallel_chunk, *args)
+                for args in islice(chunks, workers * 2)
+            )
+            yield None
+
+            try:
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in finished]
+                        for future in done:
+                            pending.remove(future)
+
+                    for future in done:
+                        for args in islice(chunks, 1):
+                            pending.append(executor.submit(_run_parallel_chunk, *args))
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def aiter(
+        self,
+        batch_size: int = 1000,
+        executor: "Executor | None" = None,
+        maxsize: int = 2,
+        workers: int | None = None,
+        mp_context: "BaseContext | None" = None,
+    ) -> AsyncIterator[list[JSON]]:
+        """Asynchronously iterate over batches of :attr:`iterations` items.
+
+        Batches are generated in a background thread and passed through
+        a bounded queue, so the event loop is not blocked and a slow
+        consumer pauses the generation instead of buffering items.
+        As in the iteration protocol, items filtered out by transformers
+        are not replaced. At most ``maxsize`` batches are generated ahead
+        of the consumer:
+
+            >>> async for batch in schema.aiter(batch_size=100):
+            ...     await insert_many(batch)
+
+        :param batch_size: Maximum number of items per batch.
+        :param executor: Executor which runs the background thread,
+            defaults to the default executor of the event loop.
+        :param maxsize: Maximum number of batches waiting in the queue.
+        :param workers: Number of worker processes. When passed, batches
+            are generated by :meth:`iter_parallel` instead.
+        :param mp_context: Multiprocessing context used to start workers.
+        :return: Asynchronous iterator of lists of items.
+        :raises ValueError: if batch size or maxsize is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size should be greater than 0.")
+
+        if maxsize < 1:
+            raise ValueError("Queue size should be greater than 0.")
+
+        if workers is None:
+            batches = self._chunks(batch_size, fill=False)
+        else:
+            batches = self._parallel_chunks(workers, batch_size, True, None, mp_context)
+            # Start the workers on this thread. Forking a process
+            # from the background thread may deadlock.
+            next(batches)
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        slots = threading.Semaphore(maxsize)
+        stopped = threading.Event()
+        done = object()
+
+        def produce() -> None:
+            batch: Any = None
+            try:
+                while batch is not done:
+                    # Blocks while the queue is full.
+                    slots.acquire()
+                    if stopped.is_set():
+                        return
+                    batch = next(batches, done)
+                    loop.call_soon_threadsafe(queue.put_nowait, batch)
+            finally:
+                if batch is not done and not stopped.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, done)
+                t.cast(t.Generator[Any, None, None], batches).close()
+
+        producer = loop.run_in_executor(executor, produce)
+
+        try:
+            while (batch := await queue.get()) is not done:
+                slots.release()
+                yield batch
+            await producer
+        finally:
+            stopped.set()
+            # Wake up the producer if the consumer stopped early.
+            slots.release()
+            await asyncio.wait({producer})
+            if not producer.cancelled():
+                producer.exception()
+
+    async def _aiter_items(self) -> AsyncIterator[JSON]:
+        async for batch in self.aiter():
+            for item in batch:
+                yield item
+
+    def __aiter__(self) -> AsyncIterator[JSON]:
+        """Return an asynchronous iterator over items.
+
+        Items are generated in batches by :meth:`aiter`.
+        """
+        return self._aiter_items()
 
     def iterator(self) -> "Schema":
         """Return an iterator for the schema.
@@ -605,18 +1827,333 @@ class Schema:
         return self
 
 
+def _update_arrow_types(types: dict[str, Any], arrow_schema: Any) -> None:
+    """Remember the types of columns of a record batch, except ``null``.
+
+    :param types: Types of columns by their names.
+    :param arrow_schema: Schema of the record batch.
+    """
+    for field in arrow_schema:
+        if field.name not in types and field.type != compat.pyarrow.null():
+            types[field.name] = field.type
+
+
+def _write_arrow_batch(writer: Any, batch: Any, arrow_schema: Any) -> None:
+    """Write a record batch, cast to the schema of the writer if needed.
+
+    :param writer: Parquet or Arrow IPC writer.
+    :param batch: Record batch.
+    :param arrow_schema: Schema of the writer.
+    :raises ValueError: if the batch cannot be cast to the schema.
+    """
+    if batch.schema.equals(arrow_schema):
+        writer.write_batch(batch)
+        return
+
+    pa = compat.pyarrow
+    try:
+        table = pa.Table.from_batches([batch]).cast(arrow_schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, ValueError) as e:
+        raise ValueError(
+            f"Record batch does not match the schema of the output: {e} "
+            "Pass arrow_schema to set the types of columns which are None "
+            "in the whole first batch."
+        ) from e
+    writer.write_table(table)
+
+
+def _parallel_seed(seed: Seed) -> Seed:
+    """Get the seed which seeds of parallel tasks are derived from.
+
+    :param seed: Seed of a schema or a builder.
+    :return: The seed, the global seed or a random one.
+    """
+    if seed is MissingSeed:
+        seed = _random.global_seed
+    if seed is MissingSeed:
+        seed = os.urandom(16).hex()
+    return seed
+
+
+def _find_random_sources(
+    value: Any,
+    sources: dict[int, Any],
+    seen: set[int] | None = None,
+) -> dict[int, Any]:
+    """Find fields, providers and randoms which a value of a mapping schema draws from.
+
+    They are reached through field specifications, bound methods,
+    partials and closures, e.g. of compiled fields and lambdas.
+
+    :param value: Value of a mapping schema.
+    :param sources: Sources found so far by their ids, updated in place.
+    :param seen: Ids of visited values.
+    :return: The sources.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return sources
+    seen.add(id(value))
+
+    if isinstance(value, FieldSpec):
+        value = value.field
+
+    if isinstance(value, (BaseField, BaseProvider, Random)):
+        sources.setdefault(id(value), value)
+    elif isinstance(value, partial):
+        for item in (value.func, *value.args, *value.keywords.values()):
+            _find_random_sources(item, sources, seen)
+    elif isinstance(
+        getattr(value, "__self__", None), (BaseField, BaseProvider, Random)
+    ):
+        _find_random_sources(value.__self__, sources, seen)
+    else:
+        for cell in getattr(value, "__closure__", None) or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                # The variable is not assigned yet.
+                continue
+            _find_random_sources(contents, sources, seen)
+
+    return sources
+
+
+def _copy_value(value: Any, memo: dict[int, Any]) -> Any:
+    """Deep copy a value of a mapping schema.
+
+    :func:`copy.deepcopy` does not copy functions, so closures
+    are copied here together with the variables they refer to.
+
+    :param value: Value of a mapping schema.
+    :param memo: Memo shared by the values of the schema.
+    :return: The copy.
+    """
+    if isinstance(value, partial):
+        return partial(
+            _copy_value(value.func, memo),
+            *(_copy_value(arg, memo) for arg in value.args),
+            **{name: _copy_value(arg, memo) for name, arg in value.keywords.items()},
+        )
+
+    if not isinstance(value, types.FunctionType) or not value.__closure__:
+        return copy.deepcopy(value, memo)
+
+    if id(value) in memo:
+        return memo[id(value)]
+
+    cells = tuple(types.CellType() for _ in value.__closure__)
+    fn = types.FunctionType(
+        value.__code__,
+        value.__globals__,
+        value.__name__,
+        value.__defaults__,
+        cells,
+    )
+    fn.__kwdefaults__ = value.__kwdefaults__
+    memo[id(value)] = fn
+
+    for cell, old in zip(cells, value.__closure__):
+        try:
+            cell.cell_contents = _copy_value(old.cell_contents, memo)
+        except ValueError:
+            # The variable is not assigned yet.
+            continue
+
+    return fn
+
+
+def _process_pool(
+    workers: int,
+    mp_context: "BaseContext | None",
+    initializer: Callable[..., None],
+    *initargs: Any,
+) -> "ProcessPoolExecutor":
+    """Create a pool of worker processes.
+
+    Workers are started with the start method of the platform unless
+    ``mp_context`` is passed. Only forked workers inherit the initializer
+    arguments, otherwise the arguments must be picklable.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+#: Schema and sink of a worker process of :meth:`Schema.iter_parallel`.
+_parallel_state: tuple[Schema, Callable[[int, list[JSON]], Any] | None] | None = None
+
+
+def _init_parallel_worker(
+    schema: Schema,
+    sink: Callable[[int, list[JSON]], Any] | None,
+) -> None:
+    global _parallel_state
+    _parallel_state = (schema, sink)
+
+
+def _run_parallel_chunk(seed: Seed, index: int, start: int, stop: int) -> Any:
+    schema, sink = t.cast(tuple[Schema, t.Any], _parallel_state)
+    items = schema._create_chunk(seed, index, start, stop)
+    return items if sink is None else sink(index, items)
+
+
+def _close_reference_store(connection: "sqlite3.Connection", directory: str) -> None:
+    import shutil
+
+    connection.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class _ReferenceStore(Sequence[JSON]):
+    """Column-oriented store of the referenced fields of generated items.
+
+    Items are kept in memory until their number exceeds the threshold.
+    Then all of them are moved to a temporary SQLite database.
+    """
+
+    # Types which SQLite stores as is. Others are pickled.
+    _NATIVE_TYPES = (int, float, str, type(None))
+
+    def __init__(self, fields: Sequence[str], threshold: int) -> None:
+        self.fields = tuple(fields)
+        self._threshold = threshold
+        self._columns: list[list[Any]] = [[] for _ in self.fields]
+        self._size = 0
+        self._connection: sqlite3.Connection | None = None
+        self._finalizer: Callable[[], Any] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @t.overload
+    def __getitem__(self, index: int) -> JSON:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[JSON]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> JSON | list[JSON]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range.")
+
+        if self._connection is None:
+            values = [column[index] for column in self._columns]
+        else:
+            values = self._connection.execute(
+                "SELECT * FROM items WHERE rowid = ?", (index + 1,)
+            ).fetchone()
+
+        return {name: self._decode(v) for name, v in zip(self.fields, values)}
+
+    @classmethod
+    def _encode(cls, value: Any) -> Any:
+        if type(value) in cls._NATIVE_TYPES:
+            if type(value) is not int or -(2**63) <= value < 2**63:
+                return value
+        return pickle.dumps(value)
+
+    @staticmethod
+    def _decode(value: Any) -> Any:
+        return pickle.loads(value) if isinstance(value, bytes) else value
+
+    def _spill(self) -> None:
+        import sqlite3
+        import tempfile
+
+        directory = tempfile.mkdtemp(prefix="mimesis-")
+        connection = sqlite3.connect(os.path.join(directory, "items.db"))
+        self._finalizer = weakref.finalize(
+            self, _close_reference_store, connection, directory
+        )
+        columns = ", ".join(f"c{i}" for i in range(len(self.fields)))
+        connection.execute(f"CREATE TABLE items ({columns})")
+        self._connection = connection
+        self._insert(self._columns)
+        self._columns = [[] for _ in self.fields]
+
+    def _insert(self, columns: list[list[Any]]) -> None:
+        connection = t.cast("sqlite3.Connection", self._connection)
+        placeholders = ", ".join("?" for _ in self.fields)
+        connection.executemany(
+            f"INSERT INTO items VALUES ({placeholders})",
+            (tuple(map(self._encode, row)) for row in zip(*columns)),
+        )
+        connection.commit()
+
+    def extend(self, items: list[JSON]) -> None:
+        """Store the referenced fields of items.
+
+        :param items: Generated items.
+        """
+        columns = [[item[name] for item in items] for name in self.fields]
+        self._size += len(items)
+
+        if self._connection is not None:
+            self._insert(columns)
+            return
+
+        for column, values in zip(self._columns, columns):
+            column.extend(values)
+
+        if self.fields and self._size > self._threshold:
+            self._spill()
+
+    @property
+    def spilled(self) -> bool:
+        """Whether items are stored on disk."""
+        return self._connection is not None
+
+    def close(self) -> None:
+        """Remove the items and the temporary database."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._connection = None
+        self._columns = [[] for _ in self.fields]
+        self._size = 0
+
+
 class SchemaBuilder:
     """Builder for creating related schemas with references."""
 
-    __slots__ = ("_schemas", "_data", "_seed", "_random")
+    __slots__ = (
+        "_schemas",
+        "_data",
+        "_seed",
+        "_random",
+        "_keep",
+        "_depends_on",
+        "_spill_threshold",
+    )
 
-    def __init__(self, seed: Seed = MissingSeed) -> None:
+    def __init__(
+        self,
+        seed: Seed = MissingSeed,
+        spill_threshold: int = 1_000_000,
+    ) -> None:
         """Initialize relation schema.
 
         :param seed: Seed for random generator.
+        :param spill_threshold: Number of items of a schema which
+            :meth:`stream` keeps in memory before moving them to
+            a temporary file.
         """
         self._schemas: dict[str, Schema] = {}
-        self._data: dict[str, list[JSON]] = {}
+        self._data: dict[str, Sequence[JSON]] = {}
+        self._keep: dict[str, tuple[str, ...]] = {}
+        self._depends_on: dict[str, tuple[str, ...]] = {}
+        self._spill_threshold = spill_threshold
         self._seed = seed
         if seed is MissingSeed:
             self._random = Random()
@@ -624,14 +2161,26 @@ class SchemaBuilder:
             # Type narrowing: seed is not MissingSeed here
             self._random = Random(seed)  # type: ignore[arg-type]
 
-    def define(self, name: str, schema: Schema) -> Schema:
+    def define(
+        self,
+        name: str,
+        schema: Schema,
+        keep: Sequence[str] = (),
+        depends_on: Sequence[str] = (),
+    ) -> Schema:
         """Register a schema with a name.
 
         :param name: Name to register schema under.
         :param schema: Schema instance.
+        :param keep: Fields which other schemas reference. Only these
+            fields are kept by :meth:`stream`.
+        :param depends_on: Names of schemas which this schema references.
+            Used by :meth:`create_parallel`.
         :return: The schema for chaining.
         """
         self._schemas[name] = schema
+        self._keep[name] = tuple(keep)
+        self._depends_on[name] = tuple(depends_on)
         return schema
 
     def _pick_from(self, schema_name: str, field: str | None = None) -> Any:
@@ -648,41 +2197,64 @@ class SchemaBuilder:
         if not items:
             raise ValueError(f"Schema '{schema_name}' has no items")
 
+        if isinstance(items, _ReferenceStore) and field not in (None, *items.fields):
+            raise ValueError(f"Field '{field}' of schema '{schema_name}' is not kept")
+
         item = self._random.choice(items)
         return item[field] if field else item
 
-    def _get_data(self, schema_name: str) -> list[JSON]:
+    def _get_data(self, schema_name: str) -> Sequence[JSON]:
         """Get all data for a schema.
 
         :param schema_name: Name of schema.
-        :return: List of items.
+        :return: Sequence of items.
         """
         if schema_name not in self._data:
             raise ValueError(f"Schema '{schema_name}' not yet generated")
         return self._data[schema_name]
 
-    def _wrap_transformer(self, orig_fn: Callable[..., JSON]) -> Callable[..., Any]:
+    def _wrap_transformer(self, orig_fn: Transformer) -> Transformer:
         """Wrap a transformer to inject SchemaBuilder context.
 
-        :param orig_fn: Original transformer function.
+        :param orig_fn: Transformer bound by :meth:`Schema.map`.
         :return: Wrapped transformer function.
         """
 
         def wrapped_transformer(item: JSON, ctx: SchemaContext) -> JSON:
-            new_ctx = SchemaContext(
-                index=ctx.index,
-                seed=ctx.seed,
-                custom=ctx.custom,
-                builder=self,
-            )
-
-            sig = inspect.signature(orig_fn)
-            if len(sig.parameters) >= 2:
-                return orig_fn(item, new_ctx)
-            return orig_fn(item)
+            # The context is shared by all transformers of the schema.
+            ctx.schema_builder = self
+            return orig_fn(item, ctx)
 
         return wrapped_transformer
 
+    @contextmanager
+    def _bind(self, name: str, count: int) -> Iterator[Schema]:
+        """Temporarily prepare a schema for generation by the builder.
+
+        :param name: Name of the schema.
+        :param count: Number of items.
+        :return: The schema with the builder context and the count.
+        """
+        if name not in self._schemas:
+            raise ValueError(f"Schema '{name}' is not defined")
+
+        schema = self._schemas[name]
+
+        old_transformers = schema._transformers
+        old_iterations = schema.iterations
+
+        # Wrap transformers to inject builder context
+        schema._transformers = [
+            self._wrap_transformer(transformer) for transformer in old_transformers
+        ]
+        schema.iterations = count
+
+        try:
+            yield schema
+        finally:
+            schema._transformers = old_transformers
+            schema.iterations = old_iterations
+
     def create(self, **counts: int) -> dict[str, list[JSON]]:
         """Create all schemas with specified counts.
 
@@ -692,28 +2264,191 @@ class SchemaBuilder:
         result: dict[str, list[JSON]] = {}
 
         for name, count in counts.items():
-            if name not in self._schemas:
-                raise ValueError(f"Schema '{name}' is not defined")
+            with self._bind(name, count) as schema:
+                data = schema.create()
 
-            schema = self._schemas[name]
+            self._data[name] = data
+            result[name] = data
 
-            # Wrap transformers to inject builder context
-            temp_transformers = [
-                self._wrap_transformer(transformer)
-                for transformer in schema._transformers
-            ]
+        return result
 
-            old_transformers = schema._transformers
-            schema._transformers = temp_transformers
+    def stream(
+        self,
+        sink: Callable[[str, list[JSON]], Any],
+        batch_size: int = 1000,
+        /,
+        **counts: int,
+    ) -> None:
+        """Create all schemas with specified counts, passing items to a sink.
 
-            old_iterations = schema.iterations
-            schema.iterations = count
-            data = schema.create()
-            schema.iterations = old_iterations
+        Unlike :meth:`create`, only the fields passed as ``keep``
+        to :meth:`define` are kept for references, column by column.
+        When a schema has more items than the spill threshold,
+        they are moved to a temporary SQLite database.
 
-            self._data[name] = data
-            result[name] = data
+        With the same seeds, the items are the same as the items
+        of :meth:`create`.
 
-            schema._transformers = old_transformers
+        :param sink: Function called with the name of a schema
+            and a batch of its items.
+        :param batch_size: Maximum number of items per batch.
+        :param counts: Schema names and their counts.
+        """
+        for name, count in counts.items():
+            previous = self._data.pop(name, None)
+            if isinstance(previous, _ReferenceStore):
+                previous.close()
 
-        return result
+            store = _ReferenceStore(self._keep.get(name, ()), self._spill_threshold)
+
+            with self._bind(name, count) as schema:
+                for batch in schema.batches(batch_size):
+                    store.extend(batch)
+                    sink(name, batch)
+
+            self._data[name] = store
+
+    def _create_isolated(
+        self,
+        name: str,
+        count: int,
+        seed: Seed,
+        data: dict[str, Sequence[JSON]],
+    ) -> list[JSON]:
+        """Create a schema independently of other schemas being generated.
+
+        The items depend only on the seed, the name of the schema
+        and the items of its dependencies.
+
+        :param name: Name of the schema.
+        :param count: Number of items.
+        :param seed: Base seed.
+        :param data: Items of the dependencies of the schema.
+        :return: Generated items.
+        """
+        builder = SchemaBuilder(seed=f"{seed!r}:{name}")
+        builder._schemas = {name: self._schemas[name]._isolated()}
+        builder._data = data
+
+        with builder._bind(name, count) as schema:
+            schema._reseed_fields(f"{seed!r}:{name}")
+            return schema.create()
+
+    def create_parallel(
+        self,
+        workers: int | None = None,
+        /,
+        *,
+        mp_context: "BaseContext | None" = None,
+        **counts: int,
+    ) -> dict[str, list[JSON]]:
+        """Create all schemas with specified counts in worker processes.
+
+        Schemas are generated as soon as the schemas they depend on
+        (see ``depends_on`` of :meth:`define`) are generated, so
+        independent schemas are generated concurrently.
+
+        Every schema gets its own random for references and its fields
+        are reseeded, both from the seed of the builder and the name of
+        the schema. So the result does not depend on the number of workers,
+        but differs from the result of :meth:`create`. As with
+        :meth:`Schema.iter_parallel`, schemas must be mappings or have
+        a counter-based random, and they must be picklable unless
+        workers are forked.
+
+        :param workers: Number of worker processes, defaults to the number
+            of CPUs. With a single worker, schemas are generated in this process.
+        :param mp_context: Multiprocessing context used to start workers.
+        :param counts: Schema names and their counts.
+        :return: Dictionary of schema names to generated data.
+        :raises ValueError: if a schema or a dependency is not defined,
+            dependencies are circular or workers is less than 1.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError("Number of workers should be greater than 0.")
+
+        for name in counts:
+            if name not in self._schemas:
+                raise ValueError(f"Schema '{name}' is not defined")
+
+            self._schemas[name]._check_reproducible()
+
+            for parent in self._depends_on[name]:
+                if parent not in counts and parent not in self._data:
+                    raise ValueError(f"Schema '{parent}' not yet generated")
+
+        import graphlib
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        sorter = graphlib.TopologicalSorter(
+            {
+                name: [p for p in self._depends_on[name] if p in counts]
+                for name in counts
+            }
+        )
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as e:
+            raise ValueError(f"Circular dependencies of schemas: {e.args[1]}") from e
+
+        seed = _parallel_seed(self._seed)
+        results: dict[str, list[JSON]] = {}
+
+        def task(
+            name: str, pickled: bool = True
+        ) -> tuple[str, int, Seed, dict[str, Sequence[JSON]]]:
+            data: dict[str, Sequence[JSON]] = {}
+            for parent in self._depends_on[name]:
+                items = results[parent] if parent in results else self._data[parent]
+                # Stores of stream() are not picklable, so they are read
+                # into memory only when they are sent to a worker.
+                if pickled and not isinstance(items, list):
+                    items = list(items)
+                data[parent] = items
+            return name, counts[name], seed, data
+
+        if workers == 1:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    results[name] = self._create_isolated(*task(name, pickled=False))
+                    sorter.done(name)
+        else:
+            with _process_pool(
+                workers, mp_context, _init_builder_worker, self
+            ) as executor:
+                futures: dict[Future[list[JSON]], str] = {}
+                while sorter.is_active():
+                    for name in sorter.get_ready():
+                        future = executor.submit(_run_builder_schema, *task(name))
+                        futures[future] = name
+
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = futures.pop(future)
+                        results[name] = future.result()
+                        sorter.done(name)
+
+        self._data.update(results)
+        return {name: results[name] for name in counts}
+
+
+#: Builder of a worker process of :meth:`SchemaBuilder.create_parallel`.
+_builder_state: SchemaBuilder | None = None
+
+
+def _init_builder_worker(builder: SchemaBuilder) -> None:
+    global _builder_state
+    _builder_state = builder
+
+
+def _run_builder_schema(
+    name: str,
+    count: int,
+    seed: Seed,
+    data: dict[str, Sequence[JSON]],
+) -> list[JSON]:
+    builder = t.cast(SchemaBuilder, _builder_state)
+    return builder._create_isolated(name, count, seed, data)
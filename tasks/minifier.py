@@ -4,6 +4,9 @@ from typing import Iterable
 
 from colorama import Fore, Style
 
+from mimesis.loader import compile_dataset, compile_string_tables
+from mimesis.locales import Locale
+
 MIMESIS_DIR = Path(__file__).parent.parent.joinpath("mimesis")
 
 
@@ -63,7 +66,55 @@ class Minimizer:
         print(info)
 
 
+class Compiler:
+    """Compile json files of all locales into the binary formats.
+
+    Every compiled file and string tables file contains the dataset
+    merged with the data of its master locale, see :mod:`mimesis.loader`.
+    """
+
+    def __init__(self, *, datadir: Path, locales: Iterable[str]) -> None:
+        """Find all files of the given locales."""
+        self.datadir = datadir
+        self.locales = locales
+        self.json_total = 0
+        self.compiled_total = 0
+
+    def run(self) -> None:
+        """Start compiler and exit when all json files were compiled."""
+        for locale in self.locales:
+            for file in sorted((self.datadir / locale).glob("*.json")):
+                self.compile(locale, file)
+
+        info = (
+            "\nTotal: "
+            f"{Fore.LIGHTGREEN_EX}{human_repr(self.json_total)}{Style.RESET_ALL} -> "
+            f"{Fore.LIGHTGREEN_EX}{human_repr(self.compiled_total)}{Style.RESET_ALL}\n"
+        )
+        print(info)
+
+    def compile(self, locale: str, file: Path) -> None:
+        size_before = file.stat().st_size
+        self.json_total += size_before
+
+        compiled = compile_dataset(self.datadir, locale, file.name)
+        compile_string_tables(self.datadir, locale, file.name)
+
+        size_after = compiled.stat().st_size
+        self.compiled_total += size_after
+
+        rel_file = file.relative_to(file.parent.parent)
+        info = (
+            f"{Fore.BLUE}{str(rel_file):<30}{Style.RESET_ALL} : "
+            f"{Fore.LIGHTGREEN_EX}compiled{Style.RESET_ALL}  : "
+            f"{Fore.YELLOW}{human_repr(size_before):<7}{Style.RESET_ALL} -> "
+            f"{Fore.LIGHTGREEN_EX}{human_repr(size_after):<7}{Style.RESET_ALL}"
+        )
+        print(info)
+
+
 if __name__ == "__main__":  # pragma: no cover
     data_dir = MIMESIS_DIR / "datasets"
     files = sorted(data_dir.rglob("*.json"))
     Minimizer(files=files).run()
+    Compiler(datadir=data_dir, locales=Locale.values()).run()
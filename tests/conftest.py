@@ -3,6 +3,7 @@ import os
 import pytest
 
 import mimesis
+from mimesis import compat
 from mimesis.locales import Locale
 
 platform = ["win32", "linux", "darwin"]
@@ -72,3 +73,12 @@ def text(request):
 @pytest.fixture(params=platform)
 def path(request):
     return mimesis.Path(request.param)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(compat, "numpy", None)
+    elif compat.numpy is None:
+        pytest.skip("NumPy is not installed")
+    return request.param
@@ -0,0 +1,72 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from mimesis import datasets
+
+
+@pytest.mark.parametrize("name, module_name", datasets._CONSTANTS.items())
+def test_constants_are_resolved_from_their_modules(name, module_name):
+    module = importlib.import_module(f"mimesis.datasets.int.{module_name}")
+    assert getattr(datasets, name) is getattr(module, name)
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "address",
+        "code",
+        "common",
+        "cryptographic",
+        "datetime",
+        "development",
+        "file",
+        "finance",
+        "hardware",
+        "internet",
+        "path",
+        "payment",
+        "person",
+        "scientific",
+        "text",
+        "transport",
+    ],
+)
+def test_all_constants_are_registered(module_name):
+    module = importlib.import_module(f"mimesis.datasets.int.{module_name}")
+    constants = {
+        name for name in vars(module) if name.isupper() and not name.startswith("_")
+    }
+    assert constants
+    assert all(datasets._CONSTANTS[name] == module_name for name in constants)
+
+
+def test_unknown_constant():
+    with pytest.raises(AttributeError):
+        datasets.NIL  # noqa
+
+
+def test_int_package_resolves_constants():
+    from mimesis.datasets.int import CALLING_CODES
+
+    assert CALLING_CODES is datasets.CALLING_CODES
+
+
+def test_dir():
+    assert set(datasets.__all__).issubset(dir(datasets))
+
+
+def test_import_does_not_load_datasets():
+    code = (
+        "import sys, mimesis; "
+        "print(*sorted(m for m in sys.modules if m.startswith('mimesis.datasets.int.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.split() == ["mimesis.datasets.int.common"]
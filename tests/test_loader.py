@@ -0,0 +1,201 @@
+import json
+import pickle
+
+import pytest
+
+from mimesis import loader
+from mimesis.locales import Locale
+from mimesis.providers.base import BaseDataProvider
+
+
+@pytest.fixture
+def datadir(tmp_path):
+    (tmp_path / "en").mkdir()
+    (tmp_path / "en-gb").mkdir()
+    (tmp_path / "en" / "data.json").write_text(
+        json.dumps({"words": ["spam"], "names": {"male": ["John"]}})
+    )
+    (tmp_path / "en-gb" / "data.json").write_text(
+        json.dumps({"names": {"female": ["Jane"]}})
+    )
+    return tmp_path
+
+
+def test_load_dataset_merges_master_locale(datadir):
+    data = loader.load_dataset(datadir, "en-gb", "data.json")
+    assert data == {
+        "words": ["spam"],
+        "names": {"male": ["John"], "female": ["Jane"]},
+    }
+
+
+def test_load_dataset_raises(datadir):
+    with pytest.raises(FileNotFoundError):
+        loader.load_dataset(datadir, "ru", "data.json")
+
+
+@pytest.mark.parametrize("locale", ["en", "en-gb"])
+def test_compile_dataset(datadir, locale):
+    path = loader.compile_dataset(datadir, locale, "data.json")
+    assert path == datadir / locale / f"data{loader.COMPILED_SUFFIX}"
+    assert loader.load_dataset(datadir, locale, "data.json") == loader.load_dataset(
+        datadir, locale, "data.json", compiled=False
+    )
+
+
+def test_compiled_dataset_is_preferred(datadir, mocker):
+    loader.compile_dataset(datadir, "en", "data.json")
+    json_loads = mocker.spy(loader.json, "loads")
+    assert loader.load_dataset(datadir, "en", "data.json")["words"] == ["spam"]
+    assert json_loads.call_count == 0
+
+
+@pytest.fixture
+def lazy_dataset(datadir):
+    loader.compile_dataset(datadir, "en-gb", "data.json")
+    return loader.load_dataset(datadir, "en-gb", "data.json")
+
+
+def test_lazy_dataset_loads_keys_on_access(lazy_dataset):
+    assert isinstance(lazy_dataset, loader.LazyDataset)
+    assert lazy_dataset.loaded_keys() == set()
+    assert lazy_dataset["words"] == ["spam"]
+    assert lazy_dataset.loaded_keys() == {"words"}
+    assert lazy_dataset["words"] is lazy_dataset["words"]
+
+    with pytest.raises(KeyError):
+        lazy_dataset["nil"]
+
+
+def test_lazy_dataset_behaves_like_dict(lazy_dataset):
+    expected = {"words": ["spam"], "names": {"male": ["John"], "female": ["Jane"]}}
+
+    assert "names" in lazy_dataset
+    assert "nil" not in lazy_dataset
+    assert len(lazy_dataset) == 2
+    assert list(lazy_dataset) == ["words", "names"]
+    assert lazy_dataset.get("nil", "default") == "default"
+    assert lazy_dataset.get("words") == ["spam"]
+    assert lazy_dataset == expected
+    assert dict(lazy_dataset) == expected
+    assert {**lazy_dataset} == expected
+    assert json.loads(json.dumps(lazy_dataset)) == expected
+
+
+def test_lazy_dataset_or(lazy_dataset):
+    lazy_dataset["words"]
+    updated = lazy_dataset | {"words": ["eggs"], "extra": 1}
+
+    assert isinstance(updated, loader.LazyDataset)
+    assert updated["words"] == ["eggs"]
+    assert updated["extra"] == 1
+    assert updated["names"]["male"] == ["John"]
+    assert len(updated) == 3
+    assert lazy_dataset["words"] == ["spam"]
+    assert "extra" not in lazy_dataset
+
+
+def test_lazy_dataset_copy_and_pickle(lazy_dataset):
+    import copy
+    import pickle
+
+    lazy_dataset["words"]
+    assert copy.deepcopy(lazy_dataset) == lazy_dataset
+    assert pickle.loads(pickle.dumps(lazy_dataset)) == lazy_dataset
+    assert lazy_dataset.copy() == lazy_dataset
+
+
+@pytest.mark.parametrize("locale", ["en", "en-gb"])
+def test_stale_compiled_dataset_is_ignored(datadir, locale):
+    loader.compile_dataset(datadir, locale, "data.json")
+    (datadir / "en" / "data.json").write_text(json.dumps({"words": ["eggs"]}))
+    assert loader.load_dataset(datadir, locale, "data.json")["words"] == ["eggs"]
+
+
+def test_malformed_compiled_dataset_is_ignored(datadir):
+    loader.compiled_path(datadir, "en", "data.json").write_bytes(b"spam")
+    assert loader.load_dataset(datadir, "en", "data.json")["words"] == ["spam"]
+
+
+@pytest.fixture
+def string_tables(datadir, monkeypatch):
+    monkeypatch.setattr(loader, "string_tables", True)
+    loader.compile_string_tables(datadir, "en-gb", "data.json")
+    return loader.load_dataset(datadir, "en-gb", "data.json")
+
+
+def test_string_tables(string_tables):
+    words = string_tables["words"]
+    assert isinstance(words, loader.StringTable)
+    assert isinstance(string_tables["names"]["female"], loader.StringTable)
+    assert list(words) == ["spam"]
+    assert len(words) == 1
+    assert words[-1] == "spam"
+    assert words[:] == ["spam"]
+    assert "spam" in words
+
+    with pytest.raises(IndexError):
+        words[1]
+
+
+def test_string_tables_pickle(string_tables, datadir, monkeypatch):
+    restored = pickle.loads(pickle.dumps(string_tables))
+    words, female = restored["words"], restored["names"]["female"]
+    assert isinstance(words, loader.StringTable)
+    assert list(words) == list(string_tables["words"])
+    assert list(female) == list(string_tables["names"]["female"])
+    assert words._buffer is female._buffer
+
+    (datadir / "en" / "data.json").write_text(json.dumps({"words": ["eggs"]}))
+    loader.compile_string_tables(datadir, "en-gb", "data.json")
+    assert list(pickle.loads(pickle.dumps(words))) == ["spam"]
+
+    # Another process maps the file compiled from other data.
+    monkeypatch.setattr(loader, "_mapped_files", {})
+    with pytest.raises(ValueError):
+        pickle.loads(pickle.dumps(words))
+
+
+def test_string_tables_are_not_used_when_disabled(datadir):
+    loader.compile_string_tables(datadir, "en", "data.json")
+    data = loader.load_dataset(datadir, "en", "data.json")
+    assert data["words"] == ["spam"]
+
+
+def test_string_tables_non_ascii(datadir, monkeypatch):
+    monkeypatch.setattr(loader, "string_tables", True)
+    words = ["Москва", "", "東京", "naïve"]
+    (datadir / "en" / "data.json").write_text(
+        json.dumps({"words": words, "mixed": ["a", 1], "empty": []})
+    )
+    loader.compile_string_tables(datadir, "en", "data.json")
+    data = loader.load_dataset(datadir, "en", "data.json")
+    assert list(data["words"]) == words
+    assert data["mixed"] == ["a", 1]
+    assert data["empty"] == []
+
+
+def test_stale_string_tables_are_ignored(datadir, monkeypatch):
+    monkeypatch.setattr(loader, "string_tables", True)
+    loader.compile_string_tables(datadir, "en", "data.json")
+    (datadir / "en" / "data.json").write_text(json.dumps({"words": ["eggs"]}))
+    assert loader.load_dataset(datadir, "en", "data.json")["words"] == ["eggs"]
+
+
+def test_string_tables_with_provider(datadir, monkeypatch):
+    monkeypatch.setattr(loader, "string_tables", True)
+    loader.compile_string_tables(datadir, "en", "data.json")
+    custom_datadir = datadir
+
+    class CustomDataProvider(BaseDataProvider):
+        class Meta:
+            name = "cdp"
+            datafile = "data.json"
+            datadir = custom_datadir
+            auto_register = False
+
+    provider = CustomDataProvider(Locale.EN)
+    words = provider._extract(["words"])
+    assert isinstance(words, loader.StringTable)
+    assert provider.random.choice(words) == "spam"
+    assert provider.random.choices(words, k=2) == ["spam", "spam"]
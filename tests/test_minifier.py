@@ -2,7 +2,8 @@ import sys
 
 import pytest
 
-from tasks.minifier import Minimizer, human_repr
+from mimesis.loader import COMPILED_SUFFIX, STRING_TABLE_SUFFIX, load_dataset
+from tasks.minifier import Compiler, Minimizer, human_repr
 
 
 def test_human_repr():
@@ -47,3 +48,16 @@ def test_minimizer_reports_to_stdout(capsys, tmp_path):
     lines = capsys.readouterr().out.split("\n")
     assert lines[0].strip().endswith("3.0B    -> 2.0B")
     assert lines[2] == "Total: 3.0B -> 2.0B. Compressed: 1.0B"
+
+
+def test_compiler_compiles_files(tmp_path):
+    (tmp_path / "en").mkdir()
+    (tmp_path / "en-gb").mkdir()
+    (tmp_path / "en" / "spam.json").write_text('{"spam": ["eggs"], "ham": 1}')
+    (tmp_path / "en-gb" / "spam.json").write_text('{"ham": 2}')
+    compiler = Compiler(datadir=tmp_path, locales=("en", "en-gb"))
+    compiler.run()
+    assert (tmp_path / "en" / f"spam{COMPILED_SUFFIX}").exists()
+    assert (tmp_path / "en-gb" / f"spam{COMPILED_SUFFIX}").exists()
+    assert (tmp_path / "en-gb" / f"spam{STRING_TABLE_SUFFIX}").exists()
+    assert load_dataset(tmp_path, "en-gb", "spam.json") == {"spam": ["eggs"], "ham": 2}
@@ -10,7 +10,7 @@ from mimesis.enums import Gender
 from mimesis.exceptions import LocaleError, NonEnumerableError
 from mimesis.locales import Locale
 from mimesis.providers import Code, Cryptographic, Internet, Person
-from mimesis.providers.base import BaseDataProvider, BaseProvider
+from mimesis.providers.base import BaseDataProvider, BaseProvider, DatasetCache
 from mimesis.types import MissingSeed
 
 from . import patterns
@@ -136,6 +136,14 @@ class TestBase:
         with pytest.raises(ValueError):
             assert base_data_provider._extract([])
 
+    def test_extract_records_touched_keys(self):
+        provider = Person(Locale.EN)
+        assert provider._touched_keys == set()
+
+        provider.first_name()
+        provider.occupation()
+        assert provider._touched_keys == {"names", "occupation"}
+
     def test_extract_missing_positional_arguments(self, base_data_provider):
         with pytest.raises(TypeError):
             assert base_data_provider._extract(default=None)
@@ -268,6 +276,66 @@ class TestBase:
                 CustomDataProvider(Locale.RU)
 
 
+class TestDatasetCache:
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self):
+        DatasetCache.clear()
+        yield
+        DatasetCache.set_maxsize(128)
+        DatasetCache.clear()
+
+    def test_dataset_is_shared(self):
+        p1 = Person(Locale.EN_GB)
+        p2 = Person(Locale.EN_GB)
+        assert p1._dataset is p2._dataset
+
+        info = DatasetCache.info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert info.currsize == 1
+
+    def test_sub_locale_is_merged(self):
+        p1 = Person(Locale.EN)
+        p2 = Person(Locale.EN_GB)
+        assert p1._dataset is not p2._dataset
+        assert DatasetCache.info().currsize == 2
+
+    def test_update_dataset_is_copy_on_write(self):
+        p1 = Person(Locale.EN)
+        p2 = Person(Locale.EN)
+        p1.update_dataset({"surnames": ["Doe"]})
+
+        assert p1._extract(["surnames"]) == ["Doe"]
+        assert p2._extract(["surnames"]) != ["Doe"]
+        assert Person(Locale.EN)._extract(["surnames"]) != ["Doe"]
+
+    def test_eviction(self):
+        DatasetCache.set_maxsize(1)
+        Person(Locale.EN)
+        Person(Locale.DE)
+
+        info = DatasetCache.info()
+        assert info.currsize == 1
+        assert info.evictions == 1
+        assert info.maxsize == 1
+
+    def test_disabled(self):
+        DatasetCache.set_maxsize(0)
+        p1 = Person(Locale.EN)
+        p2 = Person(Locale.EN)
+        assert p1._dataset is not p2._dataset
+        assert DatasetCache.info().currsize == 0
+
+    def test_clear(self):
+        Person(Locale.EN)
+        DatasetCache.clear()
+        assert DatasetCache.info() == (0, 0, 0, 128, 0)
+
+    def test_set_maxsize_raises(self):
+        with pytest.raises(ValueError):
+            DatasetCache.set_maxsize(-1)
+
+
 class TestSeededBase:
     @pytest.fixture
     def _bases(self, seed):
@@ -1,6 +1,9 @@
+import threading
+
 import pytest
 
 from mimesis import BaseProvider, Generic
+from mimesis.random import CounterRandom, Random, ThreadLocalRandom
 
 
 class TestGeneric:
@@ -14,6 +17,22 @@ class TestGeneric:
         assert number_1 == number_2
         assert address_1 == address_2
 
+    def test_reseed_does_not_create_providers(self):
+        generic = Generic()
+        person = generic.person
+        generic.reseed(0xFFF)
+
+        assert vars(generic)["person"] is person
+        assert "address" not in vars(generic)
+
+        other = Generic()
+        other.person  # noqa
+        other.reseed(0xFFF)
+        assert generic.person.name() == other.person.name()
+        address = generic.address.address()
+        assert address == other.address.address()
+        assert address == Generic(seed=0xFFF).address.address()
+
     def test_str(self, generic):
         assert str(generic).startswith("Generic")
 
@@ -149,6 +168,63 @@ class TestGeneric:
         assert generic.custom_provider.b == "b"
         assert generic.custom_provider.c == "c"
 
+    def test_providers_are_created_lazily(self):
+        generic = Generic()
+        assert not any(isinstance(v, BaseProvider) for v in vars(generic).values())
+
+        internet = generic.internet
+        assert vars(generic)["internet"] is internet
+        assert "payment" not in vars(generic)
+
+    def test_shared_random(self):
+        rnd = CounterRandom(0xFF)
+        generic = Generic(random=rnd)
+        assert generic.person.random is rnd
+        assert generic.numeric.random is rnd
+        assert "shared_random" not in dir(generic)
+
+        rnd.seek(1)
+        name = generic.person.name()
+        generic.address  # noqa
+        rnd.seek(1)
+        assert generic.person.name() == name
+
+    def test_thread_local(self):
+        generic = Generic(seed=0xFF, thread_local=True)
+        assert isinstance(generic.random, ThreadLocalRandom)
+        assert generic.person.random is generic.random
+        assert generic.internet._text.random is generic.random
+
+        names = [generic.person.name() for _ in range(5)]
+        generic.reseed(0xFF)
+        assert [generic.person.name() for _ in range(5)] == names
+
+        with pytest.raises(ValueError):
+            Generic(random=Random(), thread_local=True)
+
+    def test_thread_local_providers_do_not_reset_threads(self):
+        generic = Generic(seed=0xFF, thread_local=True)
+        barrier = threading.Barrier(2)
+        results = []
+
+        def work(g):
+            results.append(g.numeric.integer_number())
+            barrier.wait()
+            barrier.wait()
+            results.append(g.numeric.integer_number())
+
+        thread = threading.Thread(target=work, args=(generic,))
+        thread.start()
+        barrier.wait()
+        # Providers created lazily in another thread don't reseed the random.
+        generic.address.city()
+        generic.payment.cid()
+        barrier.wait()
+        thread.join()
+
+        expected = Random("255:0")
+        assert results == [expected.randint(-1000, 1000) for _ in range(2)]
+
     def test_dir(self, generic):
         providers = generic.__dir__()
         for p in providers:
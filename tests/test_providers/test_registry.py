@@ -139,10 +139,13 @@ class TestGenericWithRegistry:
         assert person is not None
         assert hasattr(generic, "person")
 
-    def test_locale_independent_providers_eager_loaded(self, generic):
-        assert hasattr(generic, "numeric")
-        assert not hasattr(generic, "_numeric")
-        assert generic.numeric is not None
+    def test_locale_independent_providers_lazy_loaded(self, generic):
+        assert "numeric" not in generic.__dict__
+        assert isinstance(generic._numeric, type)
+
+        numeric = generic.numeric
+        assert numeric is not None
+        assert generic.numeric is numeric
 
 
 class TestProviderSynchronization:
@@ -167,3 +170,36 @@ class TestProviderSynchronization:
         registry = ProviderRegistry.get_all()
         provider_classes = list(registry.values())
         assert len(provider_classes) == len(set(provider_classes))
+
+
+class TestMethodIndex:
+    def test_method_index(self):
+        index = ProviderRegistry.get_method_index()
+        assert index["email"] == "person"
+        assert index["city"] == "address"
+        assert "_extract" not in index
+        assert ProviderRegistry.get_method_index() is index
+
+    def test_method_index_precedence(self):
+        # Both providers have the method, the first name wins.
+        assert hasattr(ProviderRegistry.get("address"), "get_current_locale")
+        index = ProviderRegistry.get_method_index()
+        assert index["get_current_locale"] == "address"
+
+    def test_method_index_is_reset_on_register(self):
+        index = ProviderRegistry.get_method_index()
+
+        class IndexedProvider(BaseProvider):
+            class Meta:
+                name = "indexed_test_provider"
+
+            def indexed_method(self):
+                return "indexed"
+
+        try:
+            new_index = ProviderRegistry.get_method_index()
+            assert new_index is not index
+            assert new_index["indexed_method"] == "indexed_test_provider"
+        finally:
+            del ProviderRegistry._providers["indexed_test_provider"]
+            ProviderRegistry._method_index = None
@@ -28,6 +28,15 @@ class TestCryptographic:
         assert isinstance(uuid_result, str)
         assert re.match(patterns.UUID_REGEX, uuid_result)
 
+    def test_uuid_many(self, crypto):
+        result = crypto.uuid_many(100)
+        assert len(result) == 100
+        for value in result:
+            assert re.match(patterns.UUID_REGEX, value)
+            assert str(uuid.UUID(value)) == value
+            assert uuid.UUID(value).version == 4
+            assert uuid.UUID(value).variant == uuid.RFC_4122
+
     @pytest.mark.parametrize(
         "algorithm, length",
         [
@@ -62,6 +71,15 @@ class TestCryptographic:
         assert len(result) == entropy * 2
         assert isinstance(result, str)
 
+    @pytest.mark.parametrize("entropy", [0, 32, 64])
+    def test_token_many(self, crypto, entropy):
+        result = crypto.token_bytes_many(5, entropy=entropy)
+        assert len(result) == 5
+        assert all(isinstance(t, bytes) and len(t) == entropy for t in result)
+
+        result = crypto.token_hex_many(5, entropy=entropy)
+        assert all(len(t) == entropy * 2 for t in result)
+
     @pytest.mark.parametrize("entropy", [32, 64, 128])
     def test_token_urlsafe(self, crypto, entropy):
         result = crypto.token_urlsafe(entropy=entropy)
@@ -247,6 +265,10 @@ class TestSeededCryptographic:
     def test_mnemonic_phrase(self, c1, c2):
         assert c1.mnemonic_phrase() == c2.mnemonic_phrase()
 
+    def test_many(self, c1, c2):
+        assert c1.uuid_many(5) == c2.uuid_many(5)
+        assert c1.token_hex_many(5) == c2.token_hex_many(5)
+
     def test_jwt(self, c1, c2):
         assert c1.jwt() == c2.jwt()
         assert c1.jwt(algorithm="RS256") == c2.jwt(algorithm="RS256")
@@ -436,6 +436,17 @@ class TestSeededInternet:
     def i2(self, seed):
         return Internet(seed=seed)
 
+    def test_lazy_helpers_do_not_affect_sequence(self, i1, i2):
+        assert "_datetime" not in vars(i1)
+
+        i1.port()
+        i1._datetime  # noqa
+        i1._text  # noqa
+        i2.port()
+
+        assert i1.http_request_headers() == i2.http_request_headers()
+        assert i1.port() == i2.port()
+
     def test_http_request_headers(self, i1, i2):
         r1 = i1.http_request_headers()
         r2 = i2.http_request_headers()
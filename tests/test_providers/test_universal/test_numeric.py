@@ -1,4 +1,5 @@
 import decimal
+import pickle
 import re
 
 import pytest
@@ -28,6 +29,19 @@ class TestNumbers:
             for key in ("a", "b", "c"):
                 assert numeric.increment(accumulator=key) == i
 
+    def test_increment_lock_per_instance(self, numeric):
+        other = Numeric()
+        assert numeric._increment_lock is not other._increment_lock
+
+        with numeric._increment_lock:
+            assert other.increment() == 1
+
+    def test_pickle_incremental(self, numeric):
+        numeric.increment()
+        restored = pickle.loads(pickle.dumps(numeric))
+        assert restored.increment() == 2
+        assert restored._increment_lock is not numeric._increment_lock
+
     @pytest.mark.parametrize(
         "start, end",
         [
@@ -183,6 +197,20 @@ class TestNumbers:
         assert -100 <= result <= 100
         assert len(str(result).split(".")[1]) <= 15
 
+    def test_integer_many(self, numeric, backend):
+        result = numeric.integer_number_many(100, -100, 100)
+        assert len(result) == 100
+        assert all(type(i) is int and -100 <= i <= 100 for i in result)
+
+        result = numeric.integer_number_many(3, start=2**64, end=2**65)
+        assert all(2**64 <= i <= 2**65 for i in result)
+
+    def test_float_many(self, numeric, backend):
+        result = numeric.float_number_many(100, -100, 100, precision=2)
+        assert len(result) == 100
+        assert all(type(f) is float and -100 <= f <= 100 for f in result)
+        assert all(round(f, 2) == f for f in result)
+
     def test_decimal(self, numeric):
         result = numeric.decimal_number(-100, 100)
         assert -100 <= result <= 100
@@ -229,6 +257,10 @@ class TestSeededNumbers:
     def test_float(self, n1, n2):
         assert n1.float_number() == n2.float_number()
 
+    def test_many(self, n1, n2):
+        assert n1.integer_number_many(10) == n2.integer_number_many(10)
+        assert n1.float_number_many(10) == n2.float_number_many(10)
+
     def test_decimal(self, n1, n2):
         assert n1.decimal_number() == n2.decimal_number()
 
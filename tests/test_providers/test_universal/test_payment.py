@@ -93,6 +93,16 @@ class TestSeededPayment:
     def p2(self, seed):
         return Payment(seed=seed)
 
+    def test_lazy_person_does_not_affect_sequence(self, p1, p2):
+        assert "_person" not in vars(p1)
+
+        p1.cvv()
+        p1._person  # noqa
+        p2.cvv()
+
+        assert p1.paypal() == p2.paypal()
+        assert p1.cvv() == p2.cvv()
+
     def test_bitcoin_address(self, p1, p2):
         assert p1.bitcoin_address() == p2.bitcoin_address()
 
@@ -1,6 +1,18 @@
+import pickle
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from mimesis.enums import Gender
+from mimesis.random import (
+    CounterRandom,
+    Random,
+    ThreadLocalRandom,
+    WeightedChoice,
+)
 from mimesis.random import random as _random
 
 
@@ -119,3 +131,282 @@ def test_weighted_choice(random):
 def test_weighted_choice_with_empty_dict(random):
     with pytest.raises(ValueError):
         random.weighted_choice(choices={})
+
+
+def test_choice_many(backend):
+    result = Random().choice_many(["a", "b", "c"], 100)
+    assert len(result) == 100
+    assert set(result) <= {"a", "b", "c"}
+
+    assert list(Random().choice_many("ab", 3)) != ["ab"] * 3
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        ["a", 1, 2.5, None],
+        [(1, 2), (3, 4), (5, 6)],
+        [(1, "a"), (2, "b")],
+    ],
+)
+def test_choice_many_keeps_elements(backend, seq):
+    result = list(Random(0xFF).choice_many(seq, 50))
+    assert len(result) == 50
+    assert all(any(item is element for element in seq) for item in result)
+
+
+def test_choice_many_ndarray(backend):
+    np = pytest.importorskip("numpy")
+    seq = np.array([10, 20, 30])
+    result = Random(0xFF).choice_many(seq, 50)
+    assert len(result) == 50
+    assert set(result) <= {10, 20, 30}
+
+    with pytest.raises(IndexError):
+        Random().choice_many(np.array([]), 1)
+
+
+def test_choice_many_raises(backend):
+    with pytest.raises(IndexError):
+        Random().choice_many([], 1)
+
+    with pytest.raises(ValueError):
+        Random().choice_many([1], -1)
+
+
+def test_randint_array(backend):
+    result = Random().randint_array(1, 3, 1000)
+    assert len(result) == 1000
+    assert set(result) == {1, 2, 3}
+
+    with pytest.raises(ValueError):
+        Random().randint_array(3, 1, 10)
+
+
+def test_uniform_array(backend):
+    result = Random().uniform_array(1.5, 2.5, 100, precision=2)
+    assert len(result) == 100
+    assert all(1.5 <= x <= 2.5 for x in result)
+    assert all(round(x, 2) == x for x in result)
+
+
+@pytest.mark.parametrize("n, size", [(0, 16), (5, 0), (10, 8)])
+def test_randbytes_many(backend, n, size):
+    result = Random().randbytes_many(n, size)
+    assert len(result) == n
+    assert all(isinstance(b, bytes) and len(b) == size for b in result)
+
+
+def test_batch_methods_are_seeded(backend):
+    def generate(rnd):
+        return (
+            list(rnd.choice_many(range(100), 10)),
+            list(rnd.randint_array(0, 1000, 10)),
+            list(rnd.uniform_array(0, 1, 10)),
+            rnd.randbytes_many(10),
+        )
+
+    assert generate(Random(0xFF)) == generate(Random(0xFF))
+    assert generate(Random(0xFF)) != generate(Random(0xFE))
+
+
+def test_batch_methods_consume_single_draw(backend):
+    r1, r2 = Random(0xFF), Random(0xFF)
+    r1.randint_array(0, 10, 1000)
+    r2.getrandbits(128)
+    assert r1.random() == r2.random()
+
+
+def test_numpy_is_imported_lazily():
+    code = "import sys, mimesis; print('numpy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "False"
+
+
+class TestCounterRandom:
+    def test_is_seeded(self):
+        r1, r2 = CounterRandom(0xFF), CounterRandom(0xFF)
+        assert [r1.random() for _ in range(20)] == [r2.random() for _ in range(20)]
+        assert CounterRandom(1).random() != CounterRandom("1").random()
+
+    @pytest.mark.parametrize(
+        "seed", [None, 0, -1, 2**100, 0.5, "s", b"b", bytearray(2)]
+    )
+    def test_seed_types(self, seed):
+        result = CounterRandom(seed).random()
+        assert 0 <= result < 1
+
+    def test_seed_raises(self):
+        with pytest.raises(TypeError):
+            CounterRandom(object())
+
+    def test_jump(self):
+        r1, r2 = CounterRandom(0xFF), CounterRandom(0xFF)
+        values = [r1.random() for _ in range(20)]
+        r2.jump(13)
+        assert r2.counter == 13
+        assert r2.random() == values[13]
+
+        with pytest.raises(ValueError):
+            r2.jump(-1)
+
+    def test_substream(self):
+        r = CounterRandom(0xFF)
+        first = r.random()
+        sub = r.substream(3)
+
+        assert sub.stream == 3
+        assert sub.random() == CounterRandom(0xFF, stream=3).random()
+        assert sub.random() != first
+        assert r.stream == 0
+
+    def test_seek(self):
+        r = CounterRandom(0xFF)
+        r.seek(2, 5)
+        value = r.random()
+        r.seek(2, 5)
+        assert r.random() == value
+
+        with pytest.raises(ValueError):
+            r.seek(-1)
+
+    @pytest.mark.parametrize("k", [0, 1, 64, 65, 200])
+    def test_getrandbits(self, k):
+        r = CounterRandom(0xFF)
+        assert 0 <= r.getrandbits(k) < 2**k or k == 0
+
+    def test_state(self):
+        r = CounterRandom(0xFF)
+        r.random()
+        state = r.getstate()
+        values = [r.randint(1, 100) for _ in range(10)]
+        r.setstate(state)
+        assert [r.randint(1, 100) for _ in range(10)] == values
+
+        restored = pickle.loads(pickle.dumps(r))
+        assert restored.random() == r.random()
+
+    def test_reference_value(self):
+        # The stream must not depend on the platform or the Python version.
+        assert CounterRandom(0xFF).getrandbits(64) == 3978414622123441361
+
+
+class TestThreadLocalRandom:
+    @staticmethod
+    def in_thread(fn):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(fn()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_threads_have_own_generators(self):
+        rnd = ThreadLocalRandom(0xFF)
+        main = [rnd.randint(1, 100) for _ in range(10)]
+        other = self.in_thread(lambda: [rnd.randint(1, 100) for _ in range(10)])
+
+        expected = Random("255:0")
+        assert main == [expected.randint(1, 100) for _ in range(10)]
+        expected = Random("255:1")
+        assert other == [expected.randint(1, 100) for _ in range(10)]
+
+    def test_seed(self):
+        rnd = ThreadLocalRandom(0xFF)
+        values = rnd.choices("abcdef", k=10)
+        self.in_thread(rnd.random)
+
+        rnd.seed(0xFF)
+        assert rnd.choices("abcdef", k=10) == values
+        assert self.in_thread(rnd.random) == Random("255:1").random()
+
+        rnd.seed("other")
+        assert rnd.random() == Random("'other':0").random()
+
+    def test_state_of_calling_thread(self):
+        rnd = ThreadLocalRandom(0xFF)
+        state = rnd.getstate()
+        value = rnd.random()
+        self.in_thread(lambda: rnd.setstate(Random(1).getstate()))
+
+        rnd.setstate(state)
+        assert rnd.random() == value
+
+    def test_seek(self):
+        rnd = ThreadLocalRandom(0xFF)
+        rnd.random()
+        rnd.seek(3)
+        assert rnd.random() == Random("255:3").random()
+
+        def in_stream(stream):
+            rnd.seek(stream)
+            return [rnd.random() for _ in range(5)]
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = list(pool.map(in_stream, range(6)))
+
+        assert result == [in_stream(stream) for stream in range(6)]
+        expected = Random("255:5")
+        assert result[5] == [expected.random() for _ in range(5)]
+
+        rnd.seed(0xFF)
+        assert rnd.random() == Random("255:0").random()
+
+        with pytest.raises(ValueError):
+            rnd.seek(-1)
+
+    def test_unseeded(self):
+        rnd = ThreadLocalRandom()
+        assert rnd.random() != self.in_thread(rnd.random)
+
+    def test_pickle(self):
+        rnd = ThreadLocalRandom(0xFF)
+        rnd.random()
+        restored = pickle.loads(pickle.dumps(rnd))
+        assert restored.random() == Random("255:0").random()
+
+
+class TestWeightedChoice:
+    def test_alias_table_distribution(self):
+        table = WeightedChoice({"a": 1, "b": 3, "c": 0})
+        rnd = Random(0xFF)
+        result = [rnd.weighted_choice(table) for _ in range(4000)]
+
+        assert "c" not in result
+        assert 800 < result.count("a") < 1200
+
+    @pytest.mark.parametrize("choices", [{}, {"a": 0}, {"a": -1, "b": 2}])
+    def test_invalid_weights(self, choices):
+        with pytest.raises(ValueError):
+            WeightedChoice(choices)
+
+    def test_dict_reads_current_weights(self):
+        choices = {"a": 1.0, "b": 0.0}
+        rnd = Random(0xFF)
+        assert rnd.weighted_choice(choices) == "a"
+
+        choices.update(a=0.0, b=1.0)
+        assert rnd.weighted_choice(choices) == "b"
+
+    def test_unhashable_weights(self):
+        class Weight(float):
+            __hash__ = None
+
+        assert Random().weighted_choice({"a": Weight(1)}) == "a"
+
+    def test_weighted_choices(self, backend):
+        choices = {Gender.MALE: 0.1, Gender.FEMALE: 0.9}
+        result = list(Random().weighted_choices(choices, 1000))
+
+        assert len(result) == 1000
+        assert result.count(Gender.MALE) < 200
+        assert list(Random(0xFF).weighted_choices(choices, 10)) == list(
+            Random(0xFF).weighted_choices(choices, 10)
+        )
+
+        with pytest.raises(ValueError):
+            Random().weighted_choices(choices, -1)
@@ -1,13 +1,28 @@
+import asyncio
+import bz2
 import csv
+import gzip
+import inspect
+import io
+import itertools
 import json
+import lzma
+import multiprocessing
+import os
 import pickle
 import re
+import sys
+import threading
 import unicodedata
+import warnings
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
 
+from mimesis import compat, loader
+from mimesis.datasets import BLOOD_GROUPS
 from mimesis.enums import Gender
 from mimesis.exceptions import (
     AliasesTypeError,
@@ -19,7 +34,8 @@ from mimesis.exceptions import (
 )
 from mimesis.keys import maybe, romanize
 from mimesis.locales import Locale
-from mimesis.random import Random
+from mimesis.providers.base import BaseProvider, DatasetCache
+from mimesis.random import CounterRandom, Random
 from mimesis.schema import Field, Fieldset, Schema, SchemaBuilder, SchemaContext
 from mimesis.types import MissingSeed
 from tests.test_providers.patterns import DATA_PROVIDER_STR_REGEX
@@ -202,6 +218,63 @@ def test_fieldset_field_error(default_fieldset):
         default_fieldset("unsupported_field")
 
 
+def test_fieldset_batch_dispatch(monkeypatch):
+    fieldset = Fieldset(i=100)
+    numeric = fieldset._generic.numeric
+    calls = []
+    monkeypatch.setattr(
+        numeric,
+        "integer_number_many",
+        lambda n, **kwargs: calls.append((n, kwargs)) or [1] * n,
+    )
+
+    assert fieldset("integer_number", start=1, end=9) == [1] * 100
+    assert fieldset("numeric.integer_number", key=lambda v: v + 1, i=3) == [2] * 3
+    assert calls == [(100, {"start": 1, "end": 9}), (3, {})]
+
+    spec = fieldset.spec("integer_number", key=str)
+    assert spec.column(2) == ["1", "1"]
+
+
+def test_fieldset_batch_dispatch_key_random():
+    fieldset = Fieldset(i=50)
+    result = fieldset(
+        "float_number",
+        key=lambda value, random: random.choice([value, None]),
+        start=0,
+        end=1,
+    )
+    assert len(result) == 50
+    assert all(value is None or 0 <= value <= 1 for value in result)
+
+
+def test_fieldset_batch_seeded():
+    assert Fieldset(seed=1)("uuid", i=5) == Fieldset(seed=1)("uuid", i=5)
+    assert Fieldset(seed=1)("token_hex", i=5) != Fieldset(seed=2)("token_hex", i=5)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["uuid", "token_hex", "token_bytes", "integer_number", "float_number"],
+)
+def test_fieldset_batch_does_not_depend_on_numpy(monkeypatch, name):
+    pytest.importorskip("numpy")
+    expected = Fieldset(seed=1)(name, i=10)
+    monkeypatch.setattr(compat, "numpy", None)
+    assert Fieldset(seed=1)(name, i=10) == expected
+
+
+def test_fieldset_without_batch_dispatch():
+    fieldset = Fieldset(i=3)
+    fieldset.register_handler("integer_number", lambda random, **kwargs: 42)
+    assert fieldset("integer_number") == [42] * 3
+
+    # Arguments named like the number of values are passed to the method.
+    result = fieldset("integers", n=5)
+    assert len(result) == 3
+    assert all(len(value) == 5 for value in result)
+
+
 @pytest.mark.parametrize(
     "field_name", ["person.full_name.invalid", "invalid_field", "unsupported_field"]
 )
@@ -327,16 +400,89 @@ def test_schema_to_json(tmp_path: "Path", schema: Schema):
     assert "id" in data[0] and "id" in data[-1]
 
 
+def test_schema_to_json_chunks(tmp_path: "Path", schema: Schema):
+    file = tmp_path / "test.json"
+    schema.to_json(str(file), chunk_size=3, indent=2)
+
+    data = json.loads(file.read_text("UTF-8"))
+    assert len(data) == schema.iterations
+    assert "id" in data[0] and "id" in data[-1]
+
+    with pytest.raises(ValueError):
+        schema.to_json(str(file), chunk_size=0)
+
+
+@pytest.mark.parametrize("indent", [None, 2, 0, "\t"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_schema_to_json_matches_json_dump(tmp_path: "Path", indent, chunk_size):
+    items = [
+        {"id": 1, "tags": ["a", "b"], "owner": {"name": "Łukasz\nL"}},
+        {"id": 2, "tags": [], "owner": {}},
+        [1, [2, 3]],
+        "item",
+    ]
+    file = tmp_path / "test.json"
+    schema = Schema(iter(items).__next__, iterations=len(items))
+    schema.to_json(str(file), chunk_size=chunk_size, indent=indent, ensure_ascii=False)
+
+    expected = json.dumps(items, indent=indent, ensure_ascii=False)
+    assert file.read_text("UTF-8") == expected
+
+
+def test_schema_to_csv_chunks(tmp_path: "Path"):
+    file = tmp_path / "test.csv"
+    schema = Schema(schema=lambda: {"a": 1, "b": "b"}, iterations=10)
+    schema.map(lambda item, ctx: {"a": ctx.index} if ctx.index % 2 else item)
+    schema.to_csv(str(file), chunk_size=3, delimiter=";")
+
+    rows = list(csv.reader(file.read_text("UTF-8").splitlines(), delimiter=";"))
+    assert rows[0] == ["a", "b"]
+    assert rows[1] == ["1", "b"]
+    assert rows[2] == ["1", ""]
+    assert len(rows) == 11
+
+
+def _load_pickled_chunks(file):
+    items = []
+    with open(file, "rb") as fp:
+        while True:
+            try:
+                chunk = pickle.load(fp)
+            except EOFError:
+                break
+            assert isinstance(chunk, list)
+            items.extend(chunk)
+    return items
+
+
 def test_schema_to_pickle(tmp_path: "Path", schema: Schema):
     file = tmp_path / "test.pkl"
     schema.to_pickle(str(file))
 
-    data = pickle.loads(file.read_bytes())
+    data = _load_pickled_chunks(file)
     assert "id" in data[0] and "id" in data[-1]
-    assert isinstance(data, list)
     assert len(data) == schema.iterations
 
 
+def test_schema_to_pickle_chunks(tmp_path: "Path", schema: Schema):
+    file = tmp_path / "test.pkl"
+    schema.to_pickle(str(file), chunk_size=3)
+
+    with open(file, "rb") as fp:
+        assert len(pickle.load(fp)) == 3
+
+    assert len(_load_pickled_chunks(file)) == schema.iterations
+
+
+def test_schema_exporters_skip_filtered_items(tmp_path: "Path"):
+    file = tmp_path / "test.json"
+    schema = Schema(schema=lambda: {"a": 1}, iterations=5)
+    schema.map(lambda item, ctx: item if ctx.index % 2 else None)
+    schema.to_json(str(file), chunk_size=2)
+
+    assert json.loads(file.read_text("UTF-8")) == [{"a": 1}] * 5
+
+
 @pytest.mark.parametrize(
     "seed",
     [
@@ -654,3 +800,961 @@ def test_schema_context():
     assert ctx.index == 5
     assert ctx.iteration == 6
     assert ctx.custom["test"] == "value"
+
+
+def _counter_based_schema(seed):
+    rnd = CounterRandom()
+    field = Field(Locale.EN, seed=seed, random=rnd)
+    return Schema(
+        schema=lambda: {
+            "name": field("person.full_name"),
+            "email": field("email"),
+            "uuid": field("uuid"),
+        },
+        iterations=10,
+        random=rnd,
+    )
+
+
+def test_schema_counter_based_random():
+    schema = _counter_based_schema(0xFF)
+    data = schema.create()
+
+    assert data == _counter_based_schema(0xFF).create()
+    assert schema.create_item(7) == data[7]
+    assert _counter_based_schema(0xFF).create_item(7) == data[7]
+    assert _counter_based_schema(0xFE).create_item(7) != data[7]
+
+
+def test_schema_random_must_be_counter_based():
+    with pytest.raises(TypeError):
+        Schema(schema=lambda: {}, random=Random())  # type: ignore
+
+
+@pytest.fixture
+def mapping_schema():
+    field = Field(Locale.EN, seed=0xFF)
+    return Schema(
+        schema={
+            "username": field.spec("username"),
+            "number": field.spec("integer_number", start=1, end=10, key=str),
+            "constant": lambda: "c",
+        },
+        iterations=7,
+    )
+
+
+def test_field_spec(default_field):
+    spec = default_field.spec("integer_number", start=1, end=3)
+    assert spec() in (1, 2, 3)
+    assert set(spec.column(100)) == {1, 2, 3}
+    assert repr(spec) == "FieldSpec <integer_number>"
+
+
+def test_field_spec_handler_and_key():
+    field = Field()
+    field.register_handler("constant", lambda random, value: value)
+    spec = field.spec("constant", key=lambda v, r: v * 2, value=2)
+    assert spec.column(3) == [4, 4, 4]
+
+
+def test_mapping_schema_create(mapping_schema):
+    result = mapping_schema.create()
+    assert len(result) == 7
+    assert list(result[0]) == ["username", "number", "constant"]
+    assert result[0]["constant"] == "c"
+
+
+def test_mapping_schema_raises_schema_error():
+    with pytest.raises(SchemaError):
+        Schema(schema={"a": "b"})  # type: ignore
+
+
+def test_create_columns(mapping_schema):
+    columns = mapping_schema.create_columns()
+    assert list(columns) == ["username", "number", "constant"]
+    assert all(len(column) == 7 for column in columns.values())
+    assert all(1 <= int(value) <= 10 for value in columns["number"])
+    assert columns["constant"] == ["c"] * 7
+
+    assert len(mapping_schema.create_columns(3)["username"]) == 3
+
+    with pytest.raises(ValueError):
+        mapping_schema.create_columns(0)
+
+
+def test_create_columns_with_transformers(mapping_schema):
+    mapping_schema.map(lambda row: row if row["number"] != "1" else None)
+    columns = mapping_schema.create_columns(50)
+    assert len(columns["number"]) == 50
+    assert "1" not in columns["number"]
+
+
+def test_create_columns_callable_schema(schema):
+    columns = schema.create_columns()
+    rows = schema.create()
+    assert list(columns) == list(rows[0])
+    assert all(len(column) == schema.iterations for column in columns.values())
+
+
+def test_iter_columns(mapping_schema):
+    batches = list(mapping_schema.iter_columns(batch_size=3))
+    assert [len(batch["username"]) for batch in batches] == [3, 3, 1]
+
+    with pytest.raises(ValueError):
+        next(mapping_schema.iter_columns(batch_size=0))
+
+
+def test_schema_map_resolves_arity_once(monkeypatch):
+    calls = []
+    signature = inspect.signature
+
+    def counting_signature(fn):
+        calls.append(fn)
+        return signature(fn)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+
+    schema = Schema(schema=lambda: {"a": 1}, iterations=20)
+    schema.map(lambda item: {**item, "b": 2})
+    schema.map(lambda item, ctx: {**item, "i": ctx.index})
+    schema.map(dict)
+
+    result = schema.create()
+    assert result[3] == {"a": 1, "b": 2, "i": 3}
+    assert len(calls) == 3
+
+    builder = SchemaBuilder()
+    builder.define("items", schema)
+    assert builder.create(items=5)["items"][4]["i"] == 4
+    assert len(calls) == 3
+
+
+def _read_jsonl(text):
+    assert text.endswith("\n")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.mark.parametrize(
+    "compress, opener",
+    [
+        (None, open),
+        ("gzip", gzip.open),
+        ("bz2", bz2.open),
+        ("xz", lzma.open),
+    ],
+)
+def test_schema_to_jsonl(tmp_path: "Path", schema: Schema, compress, opener):
+    file = tmp_path / "test.jsonl"
+    schema.to_jsonl(file, buffer_size=64, compress=compress, chunk_size=3)
+
+    with opener(file, "rt", encoding="utf-8") as fp:
+        data = _read_jsonl(fp.read())
+
+    assert len(data) == schema.iterations
+    assert "id" in data[0] and "id" in data[-1]
+
+
+def test_schema_to_jsonl_file_objects(schema: Schema):
+    text = io.StringIO()
+    schema.to_jsonl(text, sort_keys=True)
+    assert len(_read_jsonl(text.getvalue())) == schema.iterations
+    assert not text.closed
+
+    binary = io.BytesIO()
+    schema.to_jsonl(binary, compress="gzip")
+    assert len(_read_jsonl(gzip.decompress(binary.getvalue()).decode())) == 10
+
+
+def test_schema_to_jsonl_stdout(capsys):
+    Schema(schema=lambda: {"a": 1}, iterations=3).to_jsonl(sys.stdout)
+    assert capsys.readouterr().out == '{"a": 1}\n' * 3
+
+
+@pytest.mark.parametrize(
+    "file, kwargs",
+    [
+        (io.StringIO(), {"compress": "gzip"}),
+        (io.BytesIO(), {"compress": "zip"}),
+        (io.BytesIO(), {"indent": 2}),
+    ],
+)
+def test_schema_to_jsonl_raises(schema: Schema, file, kwargs):
+    with pytest.raises(ValueError):
+        schema.to_jsonl(file, **kwargs)
+
+
+@pytest.fixture
+def categorical_schema():
+    field = Field(Locale.EN, seed=0xFF)
+    return Schema(
+        schema={
+            "id": field.spec("increment"),
+            "blood_type": field.spec("blood_type"),
+            "currency": field.spec("currency_iso_code", allow_random=True),
+            "name": field.spec("full_name"),
+        },
+        iterations=25,
+    )
+
+
+def test_schema_to_arrow(categorical_schema):
+    pa = pytest.importorskip("pyarrow")
+    table = categorical_schema.to_arrow(batch_size=10)
+
+    assert table.num_rows == 25
+    assert table.column_names == ["id", "blood_type", "currency", "name"]
+    assert pa.types.is_dictionary(table.schema.field("blood_type").type)
+    assert pa.types.is_dictionary(table.schema.field("currency").type)
+    assert pa.types.is_string(table.schema.field("name").type)
+    assert table.column("id").to_pylist() == list(range(1, 26))
+    assert set(table.column("blood_type").to_pylist()) <= set(BLOOD_GROUPS)
+
+
+def test_schema_to_arrow_callable_schema(schema):
+    pytest.importorskip("pyarrow")
+    schema.map(lambda item: item if item["id"] < "8" else None)
+    table = schema.to_arrow(batch_size=3)
+    assert table.num_rows == schema.iterations
+    assert table.column_names == list(schema.create()[0])
+
+
+@pytest.mark.parametrize("mapping", [True, False])
+def test_schema_to_arrow_none_first(mapping):
+    pa = pytest.importorskip("pyarrow")
+    counter = itertools.count()
+
+    def value():
+        return None if next(counter) < 10 else "spam"
+
+    if mapping:
+        schema = Schema({"value": value, "n": lambda: 1}, iterations=30)
+    else:
+        schema = Schema(lambda: {"value": value(), "n": 1}, iterations=30)
+
+    table = schema.to_arrow(batch_size=10)
+    assert table.schema.field("value").type == pa.string()
+    assert table.column("value").to_pylist() == [None] * 10 + ["spam"] * 20
+
+    counter = itertools.count()
+    with pytest.raises(ValueError, match="arrow_schema"):
+        schema.to_arrow_ipc(io.BytesIO(), batch_size=10)
+
+    counter = itertools.count()
+    sink = io.BytesIO()
+    arrow_schema = pa.schema([("value", pa.string()), ("n", pa.int64())])
+    schema.to_arrow_ipc(sink, batch_size=10, arrow_schema=arrow_schema)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.schema == arrow_schema
+    assert table.column("value").null_count == 10
+
+
+def test_schema_to_arrow_none_later():
+    pa = pytest.importorskip("pyarrow")
+    counter = itertools.count()
+    schema = Schema(
+        {"value": lambda: "spam" if next(counter) < 10 else None}, iterations=30
+    )
+    sink = io.BytesIO()
+    schema.to_arrow_ipc(sink, batch_size=10)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.schema.field("value").type == pa.string()
+    assert table.column("value").null_count == 20
+
+
+def test_schema_to_parquet(tmp_path: "Path", categorical_schema):
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "data.parquet"
+    categorical_schema.to_parquet(file_path, row_group_size=10)
+
+    metadata = pq.ParquetFile(file_path).metadata
+    assert metadata.num_rows == 25
+    assert metadata.num_row_groups == 3
+    assert pq.read_table(file_path).column_names == [
+        "id",
+        "blood_type",
+        "currency",
+        "name",
+    ]
+
+
+def test_schema_to_parquet_arrow_schema(tmp_path: "Path", categorical_schema):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    arrow_schema = pa.schema(
+        [
+            ("id", pa.int32()),
+            ("blood_type", pa.string()),
+            ("currency", pa.string()),
+            ("name", pa.string()),
+        ]
+    )
+    file_path = tmp_path / "data.parquet"
+    categorical_schema.to_parquet(
+        file_path, row_group_size=10, arrow_schema=arrow_schema
+    )
+    assert pq.read_schema(file_path).remove_metadata() == arrow_schema
+    assert categorical_schema.to_arrow(arrow_schema=arrow_schema).schema == (
+        arrow_schema
+    )
+
+
+def test_schema_to_arrow_ipc(tmp_path: "Path", categorical_schema):
+    pa = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+    categorical_schema.to_arrow_ipc(sink, batch_size=7)
+    reader = pa.ipc.open_stream(sink.getvalue())
+    assert [batch.num_rows for batch in reader] == [7, 7, 7, 4]
+
+    file_path = tmp_path / "data.arrows"
+    categorical_schema.to_arrow_ipc(file_path)
+    with pa.ipc.open_stream(pa.OSFile(str(file_path))) as reader:
+        assert reader.read_all().num_rows == 25
+
+
+def test_schema_to_arrow_raises(monkeypatch, categorical_schema):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError):
+        categorical_schema.to_arrow(batch_size=0)
+
+    monkeypatch.setattr(compat, "pyarrow", None)
+    with pytest.raises(ImportError):
+        categorical_schema.to_arrow()
+
+
+@pytest.fixture
+def fork_context():
+    # Lambdas and closures can be passed only to forked workers.
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork is not available")
+    return multiprocessing.get_context("fork")
+
+
+@pytest.fixture
+def parallel_schema():
+    field = Field(Locale.EN, seed=0xFF)
+    return Schema(
+        schema={
+            "name": field.spec("full_name"),
+            "email": field.spec("email"),
+        },
+        iterations=50,
+        seed=0xFF,
+    )
+
+
+def test_schema_create_parallel(parallel_schema):
+    items = parallel_schema.create(workers=1, chunk_size=8)
+    assert len(items) == 50
+    assert parallel_schema.create(workers=3, chunk_size=8) == items
+    assert parallel_schema.create(workers=2, chunk_size=8) == items
+    assert parallel_schema.create(workers=1, chunk_size=16) != items
+
+
+def test_schema_iter_parallel_unordered(parallel_schema):
+    items = parallel_schema.create(workers=1, chunk_size=8)
+    chunks = list(parallel_schema.iter_parallel(workers=2, chunk_size=8, ordered=False))
+    assert sorted(len(chunk) for chunk in chunks) == [2, 8, 8, 8, 8, 8, 8]
+    assert sorted(map(str, sum(chunks, []))) == sorted(map(str, items))
+
+
+def test_schema_iter_parallel_sink(parallel_schema, fork_context):
+    results = parallel_schema.iter_parallel(
+        workers=2,
+        chunk_size=20,
+        sink=lambda index, items: (index, len(items)),
+        mp_context=fork_context,
+    )
+    assert list(results) == [(0, 20), (1, 20), (2, 10)]
+
+
+def _count_items(index, items):
+    return index, len(items)
+
+
+def test_schema_iter_parallel_spawn(parallel_schema):
+    spawn = multiprocessing.get_context("spawn")
+    results = parallel_schema.iter_parallel(
+        workers=2, chunk_size=20, sink=_count_items, mp_context=spawn
+    )
+    assert list(results) == [(0, 20), (1, 20), (2, 10)]
+
+    expected = parallel_schema.create(workers=1, chunk_size=20)
+    assert parallel_schema.create(2, chunk_size=20, mp_context=spawn) == expected
+
+
+def test_schema_create_parallel_counter_based(fork_context):
+    rnd = CounterRandom(0xFF)
+    field = Field(Locale.EN, seed=0xFF, random=rnd)
+    schema = Schema(lambda: {"name": field("full_name")}, iterations=20, random=rnd)
+    schema.map(lambda item, ctx: item if ctx.index % 4 else None)
+
+    expected = [schema.create_item(i) for i in range(20) if i % 4]
+    assert schema.create(2, chunk_size=6, mp_context=fork_context) == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"workers": 0},
+        {"chunk_size": 0},
+    ],
+)
+def test_schema_iter_parallel_raises(parallel_schema, kwargs):
+    with pytest.raises(ValueError):
+        next(parallel_schema.iter_parallel(**kwargs))
+
+
+def test_schema_iter_parallel_requires_reproducible_schema(schema):
+    with pytest.raises(ValueError):
+        schema.create(workers=2)
+
+    with pytest.raises(ValueError, match="cannot be reseeded"):
+        Schema({"a": lambda: 1}).create(workers=2)
+
+
+def test_schema_create_parallel_compiled_fields(fork_context):
+    field = Field(Locale.EN, seed=0xFF)
+    schema = Schema(
+        {
+            **field.compile_many({"id": "uuid", "name": "full_name"}),
+            "word": field.compile("word", key=str.upper),
+            "email": lambda: field("email"),
+        },
+        iterations=40,
+        seed=0xFF,
+    )
+
+    expected = field("uuid")
+    field.reseed(0xFF)
+    items = schema.create(workers=1, chunk_size=10)
+    assert field("uuid") == expected
+    assert len({item["id"] for item in items}) == 40
+    assert len({item["email"] for item in items}) == 40
+    assert schema.create(4, chunk_size=10, mp_context=fork_context) == items
+
+
+async def _collect(iterable):
+    return [value async for value in iterable]
+
+
+def test_schema_aiter(parallel_schema):
+    batches = asyncio.run(_collect(parallel_schema.aiter(batch_size=20)))
+    assert [len(batch) for batch in batches] == [20, 20, 10]
+
+    items = asyncio.run(_collect(parallel_schema))
+    assert len(items) == 50
+    assert list(items[0]) == ["name", "email"]
+
+
+def test_schema_aiter_workers(parallel_schema):
+    batches = asyncio.run(_collect(parallel_schema.aiter(batch_size=20, workers=2)))
+    assert batches == list(parallel_schema.iter_parallel(workers=1, chunk_size=20))
+
+
+def test_schema_aiter_workers_fork_on_event_loop_thread(
+    parallel_schema, fork_context, monkeypatch
+):
+    threads = []
+    fork = os.fork
+
+    def record_fork():
+        threads.append(threading.current_thread())
+        return fork()
+
+    monkeypatch.setattr(os, "fork", record_fork)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        batches = asyncio.run(
+            _collect(
+                parallel_schema.aiter(batch_size=20, workers=2, mp_context=fork_context)
+            )
+        )
+
+    assert [len(batch) for batch in batches] == [20, 20, 10]
+    assert threads and set(threads) == {threading.main_thread()}
+    assert not [w for w in caught if "fork()" in str(w.message)]
+
+
+def test_schema_aiter_backpressure():
+    counter = itertools.count()
+    schema = Schema(schema={"n": lambda: next(counter)}, iterations=1000)
+
+    async def consume():
+        async for batch in schema.aiter(batch_size=10, maxsize=1):
+            await asyncio.sleep(0.1)
+            return batch
+
+    assert asyncio.run(consume()) == [{"n": n} for n in range(10)]
+    # The consumed batch and one batch in the queue.
+    assert next(counter) == 20
+
+
+def test_schema_aiter_raises():
+    def broken():
+        raise RuntimeError
+
+    schema = Schema(schema=broken, iterations=10)
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(schema.aiter()))
+
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(schema.aiter(batch_size=0)))
+
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(schema.aiter(maxsize=0)))
+
+
+def test_schema_batches():
+    field = Field(Locale.EN, seed=0xFF)
+    schema = Schema(lambda: {"name": field("full_name")}, iterations=25, seed=0xFF)
+    schema.map(lambda item, ctx: {**item, "index": ctx.index})
+    schema.map(lambda item, ctx: item if ctx.index % 3 else None)
+
+    batches = list(schema.batches(size=10))
+    assert [len(batch) for batch in batches] == [10, 6]
+
+    field.reseed(0xFF)
+    items = list(schema)
+    assert sum(batches, []) == items
+    assert [item["index"] for item in items][:4] == [1, 2, 4, 5]
+
+    field.reseed(0xFF)
+    created = schema.create()
+    assert len(created) == 25
+    assert created[:16] == items
+
+    with pytest.raises(ValueError):
+        next(schema.batches(size=0))
+
+
+def test_schema_iteration_all_filtered_out():
+    schema = Schema(lambda: {"a": 1}, iterations=5)
+    schema.map(lambda item: None)
+    assert list(schema) == []
+    assert list(schema.batches(2)) == []
+    assert asyncio.run(_collect(schema)) == []
+
+
+def test_schema_batches_share_context():
+    contexts = set()
+    schema = Schema(lambda: {"a": 1}, iterations=5)
+    schema.map(lambda item, ctx: contexts.add(id(ctx)) or item)
+    list(schema.batches(2))
+    assert len(contexts) == 1
+
+
+def _relational_builder(**kwargs):
+    field = Field(Locale.EN, seed=0xFF)
+    builder = SchemaBuilder(seed=0xFF, **kwargs)
+    builder.define(
+        "users",
+        Schema(
+            lambda: {
+                "id": field("uuid"),
+                "name": field("name"),
+                "birthdate": field("date"),
+            }
+        ),
+        keep=("id", "birthdate"),
+    )
+    builder.define(
+        "posts",
+        Schema(lambda: {"title": field("sentence")}).map(
+            lambda item, ctx: {
+                **item,
+                "user_id": ctx.pick_from("users", "id"),
+                "created": ctx.pick_from("users")["birthdate"],
+                "users": len(ctx.ref("users")),
+            }
+        ),
+    )
+    return builder
+
+
+@pytest.mark.parametrize("spill_threshold", [1000, 10])
+def test_schema_builder_stream(spill_threshold):
+    expected = _relational_builder().create(users=30, posts=50)
+
+    builder = _relational_builder(spill_threshold=spill_threshold)
+    result = {}
+    builder.stream(
+        lambda name, batch: result.setdefault(name, []).append(batch),
+        16,
+        users=30,
+        posts=50,
+    )
+
+    assert [len(batch) for batch in result["users"]] == [16, 14]
+    assert sum(result["users"], []) == expected["users"]
+    assert sum(result["posts"], []) == expected["posts"]
+
+    users = builder._get_data("users")
+    assert users.spilled is (spill_threshold < 30)
+    assert list(users) == [
+        {"id": user["id"], "birthdate": user["birthdate"]} for user in expected["users"]
+    ]
+    assert users[-1] == users[29]
+    assert users[:2] == list(users)[:2]
+
+    with pytest.raises(IndexError):
+        users[30]
+
+
+def test_schema_builder_stream_field_not_kept():
+    builder = _relational_builder()
+    builder.define(
+        "comments",
+        Schema(lambda: {}).map(
+            lambda item, ctx: {"name": ctx.pick_from("users", "name")}
+        ),
+    )
+    builder.stream(lambda name, batch: None, users=3)
+
+    with pytest.raises(ValueError):
+        builder.stream(lambda name, batch: None, comments=1)
+
+
+def test_reference_store_values():
+    values = [True, 2**70, b"bytes", None, 1.5, "str", ("a", 1)]
+    builder = SchemaBuilder(spill_threshold=1)
+    builder.define("items", Schema(lambda: {"value": values.pop()}), keep=("value",))
+    builder.stream(lambda name, batch: None, items=7)
+
+    store = builder._get_data("items")
+    assert store.spilled
+    assert [item["value"] for item in store] == [
+        ("a", 1),
+        "str",
+        1.5,
+        None,
+        b"bytes",
+        2**70,
+        True,
+    ]
+
+    store.close()
+    assert len(store) == 0
+    assert not store.spilled
+
+
+def _dependent_builder():
+    field = Field(Locale.EN, seed=0xFF)
+    builder = SchemaBuilder(seed=0xFF)
+    builder.define("users", Schema({"id": field.spec("uuid")}), keep=("id",))
+    builder.define("countries", Schema({"name": field.spec("country")}))
+    builder.define(
+        "posts",
+        Schema({"title": field.spec("sentence")}).map(
+            lambda item, ctx: {
+                **item,
+                "user_id": ctx.pick_from("users", "id"),
+                "country": ctx.pick_from("countries", "name"),
+            }
+        ),
+        depends_on=("users", "countries"),
+    )
+    return builder
+
+
+def test_schema_builder_create_parallel(fork_context):
+    expected = _dependent_builder().create_parallel(1, posts=20, users=5, countries=3)
+    assert list(expected) == ["posts", "users", "countries"]
+    assert len(expected["posts"]) == 20
+
+    user_ids = {user["id"] for user in expected["users"]}
+    assert all(post["user_id"] in user_ids for post in expected["posts"])
+
+    builder = _dependent_builder()
+    counts = {"posts": 20, "users": 5, "countries": 3}
+    assert builder.create_parallel(3, mp_context=fork_context, **counts) == expected
+    assert builder._get_data("posts") == expected["posts"]
+
+
+def test_schema_builder_create_parallel_generated_dependencies(fork_context):
+    builder = _dependent_builder()
+    builder.stream(lambda name, batch: None, users=5)
+    builder.create(countries=3)
+
+    posts = builder.create_parallel(2, mp_context=fork_context, posts=10)["posts"]
+    assert len(posts) == 10
+
+
+def test_schema_builder_create_parallel_single_worker_keeps_store(monkeypatch):
+    builder = _dependent_builder()
+    builder._spill_threshold = 1
+    builder.stream(lambda name, batch: None, users=5)
+    builder.create(countries=3)
+    users = builder._get_data("users")
+    assert users.spilled
+
+    def iterate(self):
+        raise AssertionError("The store was read into memory.")
+
+    monkeypatch.setattr(type(users), "__iter__", iterate)
+    posts = builder.create_parallel(1, posts=10)["posts"]
+    user_ids = {users[i]["id"] for i in range(len(users))}
+    assert all(post["user_id"] in user_ids for post in posts)
+
+
+@pytest.mark.parametrize(
+    "schema, counts, match",
+    [
+        (None, {"posts": 1}, "not yet generated"),
+        (
+            {"a": Field().spec("uuid")},
+            {"posts": 1, "comments": 1, "users": 1, "countries": 1},
+            "Circular",
+        ),
+        (lambda: {}, {"comments": 1}, "mapping schema"),
+        ({"a": lambda: 1}, {"comments": 1}, "cannot be reseeded"),
+    ],
+)
+def test_schema_builder_create_parallel_raises(schema, counts, match):
+    builder = _dependent_builder()
+    if schema is not None:
+        builder.define("comments", Schema(schema), depends_on=("posts",))
+        builder.define(
+            "users", Schema({"id": Field().spec("uuid")}), depends_on=("comments",)
+        )
+
+    with pytest.raises(ValueError, match=match):
+        builder.create_parallel(1, **counts)
+
+
+def test_field_resolution_plans():
+    field = Field()
+    field("email")
+    field("person.email")
+    assert set(field._plans) == {"email", "person.email"}
+
+    field.aliases["mail"] = "email"
+    assert "@" in field("mail")
+    assert set(field._plans) == {"email", "person.email"}
+
+    field.aliases.update(mail="username")
+    assert "@" not in field("mail")
+
+    del field.aliases["mail"]
+    with pytest.raises(FieldError):
+        field("mail")
+
+    aliases = {"mail": "email"}
+    field.aliases = aliases
+    assert field.aliases is aliases
+    assert "@" in field("mail")
+
+    aliases.pop("mail")
+    with pytest.raises(FieldError):
+        field("mail")
+
+    aliases["mail"] = 1
+    with pytest.raises(AliasesTypeError):
+        field("mail")
+
+
+def test_field_resolution_plans_handlers():
+    field = Field()
+    assert "@" in field("email")
+
+    field.register_handler("email", lambda random, **kwargs: "handled")
+    assert field("email") == "handled"
+
+    field.unregister_handler("email")
+    assert "@" in field("email")
+
+
+def test_field_handlers_take_precedence_over_aliases():
+    field = Field()
+    field.aliases["mail"] = "email"
+    assert "@" in field("mail")
+
+    field.register_handler("mail", lambda random, **kwargs: "HANDLER")
+    assert field("mail") == "HANDLER"
+    assert field.compile("mail")() == "HANDLER"
+    assert "@" in field("email")
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [
+        {12: "email"},
+        {"mail": 12},
+    ],
+)
+def test_field_aliases_are_validated_after_change(invalid):
+    field = Field()
+    aliases = {"name": "first_name"}
+    field.aliases = aliases
+    assert "@" in field("email")
+
+    aliases.update(invalid)
+    with pytest.raises(AliasesTypeError):
+        field("email")
+
+    assert field.aliases == {}
+    assert "@" in field("email")
+
+
+def test_field_key_arity_is_resolved_once():
+    field = Field()
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return value
+
+    results = [field("email", key=key) for _ in range(3)]
+    assert calls == results
+    assert field._key_arities[key] == 1
+
+    field("email", key=lambda value, random: random)
+    assert field("email", key=str.upper).isupper()
+
+
+@pytest.mark.parametrize("string_tables", [False, True])
+def test_field_aliases_pickle(monkeypatch, string_tables):
+    monkeypatch.setattr(loader, "string_tables", string_tables)
+    DatasetCache.clear()
+    field = Field()
+    field.aliases["mail"] = "email"
+    field("mail", key=lambda value: value)
+
+    restored = pickle.loads(pickle.dumps(field))
+    assert restored.aliases == {"mail": "email"}
+    restored.aliases["mail"] = "username"
+    assert "@" not in restored("mail")
+    DatasetCache.clear()
+
+
+def test_field_fuzzy_lookup_creates_one_provider():
+    field = Field()
+    assert "@" in field("email")
+    assert field._generic.__dict__.keys() & {"address", "person"} == {"person"}
+
+    with pytest.raises(FieldError):
+        field("unknown_method")
+
+
+def test_field_fuzzy_lookup_custom_provider():
+    class Planet(BaseProvider):
+        class Meta:
+            name = "planet"
+            auto_register = False
+
+        def planet_name(self):
+            return "Mars"
+
+    field = Field()
+    field._generic.add_provider(Planet)
+    assert field("planet_name") == "Mars"
+
+
+def test_field_fuzzy_lookup_custom_provider_precedence():
+    def provider(provider_name, value):
+        class CustomProvider(BaseProvider):
+            class Meta:
+                name = provider_name
+                auto_register = False
+
+            def email(self):
+                return value
+
+        return CustomProvider
+
+    field = Field()
+    field("person.username")
+    field._generic.add_providers(provider("zmail", "first"), provider("amail", "2nd"))
+    assert field("email") == "first"
+
+    field = Field()
+    field._generic.add_provider(provider("person", "custom"))
+    assert field("email") == "custom"
+
+
+def test_field_compile():
+    field = Field(seed=0xFF)
+    other = Field(seed=0xFF)
+
+    compiled = field.compile("integer_number", start=1, end=9)
+    assert [compiled() for _ in range(5)] == [
+        other("integer_number", start=1, end=9) for _ in range(5)
+    ]
+
+    username = field.compile("person.username")
+    assert username.__self__ is field._generic.person
+    assert username() == other("person.username")
+
+    with pytest.raises(FieldError):
+        field.compile(None)
+
+    with pytest.raises(FieldError):
+        field.compile("unknown_method")
+
+
+def test_field_compile_key():
+    field = Field(seed=0xFF)
+    other = Field(seed=0xFF)
+
+    def key(value, random):
+        return random.choice([value, value.upper()])
+
+    compiled = field.compile("username", key=key)
+    assert compiled() == other("username", key=key)
+
+    upper = field.compile("email", key=str.upper)
+    assert upper().isupper()
+
+
+def test_field_compile_handler_and_alias():
+    field = Field()
+    field.register_handler("constant", lambda random, value: value)
+    field.aliases["mail"] = "email"
+
+    constant = field.compile("constant", value=42)
+    mail = field.compile("mail")
+    field.aliases["mail"] = "username"
+
+    assert constant() == 42
+    assert "@" in mail()
+
+
+def test_field_compile_many():
+    field = Field(seed=0xFF)
+    other = Field(seed=0xFF)
+
+    compiled = field.compile_many(
+        {
+            "name": "person.full_name",
+            "age": other.spec("integer_number", start=18, end=90),
+            "email": field.spec("email", key=str.upper),
+        }
+    )
+    assert list(compiled) == ["name", "age", "email"]
+    assert compiled["age"].func.__self__ is other._generic.numeric
+    assert compiled["email"]().isupper()
+
+    items = Schema(compiled, iterations=5).create()
+    assert all(18 <= item["age"] <= 90 for item in items)
+
+    with pytest.raises(FieldError):
+        field.compile_many({"unknown": "unknown_method"})
+
+
+def test_field_thread_local():
+    def generate():
+        field = Field(seed=0xFF, thread_local=True)
+
+        def chunk(index):
+            field.get_random_instance().seek(index)
+            return [field("integer_number") for _ in range(500)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            chunks = list(pool.map(chunk, range(8)))
+            ids = pool.map(lambda _: [field("increment") for _ in range(500)], range(4))
+            return chunks, sorted(i for chunk in ids for i in chunk)
+
+    chunks, ids = generate()
+    assert ids == list(range(1, 2001))
+    assert len(set(map(tuple, chunks))) == 8
+    assert generate()[0] == chunks